@@ -1,25 +1,131 @@
-from fastapi import FastAPI
-from hub.policy_hash import policy_hash
-import subprocess
+from contextlib import asynccontextmanager
+from typing import Any, Dict, List, Optional
 
-app = FastAPI(title="ACM Hub")
+from fastapi import FastAPI, HTTPException, Request, Response
+from pydantic import BaseModel, Field
+
+from hub.policy_store import get_store, git_sha
+from hub import pipeline as engine
+import hashlib
+import json
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Warm config, policy and solver state once per process.
+    _warm()
+    yield
+
+app = FastAPI(title="ACM Hub", lifespan=lifespan)
+policy_store = get_store("policies/base.yaml")
+
+def _cached_json(request: Request, payload: Dict[str, Any], etag_src: str) -> Response:
+    """JSON response with a strong ETag; 304 when If-None-Match matches."""
+    etag = '"' + hashlib.sha256(etag_src.encode()).hexdigest()[:32] + '"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    inm = request.headers.get("if-none-match", "")
+    if etag in (t.strip() for t in inm.split(",")) or inm.strip() == "*":
+        return Response(status_code=304, headers=headers)
+    return Response(content=json.dumps(payload), media_type="application/json", headers=headers)
 
 @app.get("/health")
 def health():
     return {"status": "ok"}
 
 @app.get("/policy/hash")
-def get_policy_hash():
-    return {"hash": policy_hash("policies/base.yaml")}
+def get_policy_hash(request: Request):
+    h = policy_store.hash
+    return _cached_json(request, {"hash": h}, h)
+
+@app.get("/version")
+def version(request: Request):
+    commit, h = git_sha(), policy_store.hash
+    return _cached_json(request, {"commit": commit, "policy_hash": h}, f"{commit}:{h}")
+
+
+# -----------------------
+# Decision endpoints
+# -----------------------
+class EventIn(BaseModel):
+    type: str = "route_outage"
+    route_id: str
+    warehouse_id: str
+    source: str = "api"
+    severity: str = "high"
+    ts: Optional[str] = None
+
+class DecideIn(BaseModel):
+    event: EventIn
+    snapshot: Optional[Dict[str, Any]] = None
 
-def git_sha() -> str:
+class DecideBatchIn(BaseModel):
+    items: List[DecideIn] = Field(..., min_length=1, max_length=1000)
+
+class BundleIn(BaseModel):
+    event: Optional[Dict[str, Any]] = None
+    plans: List[Dict[str, Any]]
+    snapshot: Optional[Dict[str, Any]] = None
+    trials: int = Field(0, ge=0, le=100000)
+    seed: int = 0
+
+
+def _warm() -> None:
+    engine.load_config()
+    git_sha()
+    policy_store.hash
     try:
-        return subprocess.check_output(
-            ["git", "rev-parse", "--short", "HEAD"], text=True
-        ).strip()
-    except Exception:
-        return "unknown"
+        from hub.z3_verifier import get_verifier
+        get_verifier().policy_hash  # builds the solver
+    except ImportError:
+        pass  # no z3: decisions use the policy fallback
 
-@app.get("/version")
-def version():
-    return {"commit": git_sha(), "policy_hash": policy_hash("policies/base.yaml")}
+def _event_dict(e: EventIn) -> Dict[str, Any]:
+    event = engine.seed_event(e.type, e.route_id, e.warehouse_id, source=e.source, severity=e.severity)
+    if e.ts:
+        event["ts"] = e.ts
+    return event
+
+def _decide(item: DecideIn) -> Dict[str, Any]:
+    event = _event_dict(item.event)
+    bundle = engine.generate_plans(event, snapshot=item.snapshot)
+    cfg = engine.load_config()
+    verdicts, used_fallback = engine.verify_plans(bundle, cfg)
+    selector = engine.select_plans(bundle, verdicts, weights=engine.selection_weights(cfg))
+    best = selector.best()
+    sim = engine.simulate_bundle(bundle, snapshot=item.snapshot)
+    chosen_sim = next((r for r in sim["results"] if best and r["plan_id"] == best["id"]), None)
+    return {
+        "event": event,
+        "plans": bundle["plans"],
+        "verdicts": verdicts,
+        "via": "policy-fallback" if used_fallback else "z3",
+        "chosen": best,
+        "frontier": [p["id"] for p in selector.frontier()],
+        "chosen_simulation": chosen_sim,
+        "simulation": sim["results"],
+    }
+
+@app.post("/decide/plans")
+def decide_plans(item: DecideIn):
+    return engine.generate_plans(_event_dict(item.event), snapshot=item.snapshot)
+
+@app.post("/decide/verify")
+def decide_verify(bundle: BundleIn):
+    verdicts, used_fallback = engine.verify_plans(bundle.model_dump(), engine.load_config())
+    return {"verdicts": verdicts, "via": "policy-fallback" if used_fallback else "z3"}
+
+@app.post("/decide/simulate")
+def decide_simulate(bundle: BundleIn):
+    if bundle.event is None:
+        raise HTTPException(status_code=422, detail="bundle.event is required for simulation")
+    return engine.simulate_bundle(bundle.model_dump(exclude={"snapshot", "trials", "seed"}),
+                                  snapshot=bundle.snapshot, trials=bundle.trials, seed=bundle.seed)
+
+@app.post("/decide")
+def decide(item: DecideIn):
+    return _decide(item)
+
+@app.post("/decide/batch")
+def decide_batch(batch: DecideBatchIn):
+    results = [_decide(item) for item in batch.items]
+    return {"count": len(results), "results": results}
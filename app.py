@@ -1,7 +1,5 @@
 # app.py
-import os
 import sys
-import json
 import time
 import subprocess
 from pathlib import Path
@@ -14,8 +12,9 @@ REPO_ROOT = Path(__file__).resolve().parent
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
-# Reuse your canonical policy hash
-from hub.policy_hash import policy_hash as acm_policy_hash
+# Canonical policy hash, parsed once and revalidated on file change
+from hub.policy_store import get_store
+from hub import pipeline as engine
 
 # -----------------------
 # Utility + Repo Helpers
@@ -27,24 +26,6 @@ def sh(cmd: List[str], timeout: int = 120, env: Optional[dict] = None) -> Tuple[
     except Exception as e:
         return 99, "", str(e)
 
-def latest_file(glob_pat: str) -> Optional[Path]:
-    files = sorted(Path(".").glob(glob_pat), key=lambda p: p.stat().st_mtime if p.exists() else 0)
-    return files[-1] if files else None
-
-def load_json(path: Optional[Path]) -> Optional[dict]:
-    if not path or not path.exists():
-        return None
-    try:
-        return json.loads(path.read_text(encoding="utf-8"))
-    except Exception:
-        return None
-
-def dump_json_atomic(path: Path, obj: dict):
-    path.parent.mkdir(parents=True, exist_ok=True)
-    tmp = path.with_suffix(path.suffix + ".tmp")
-    tmp.write_text(json.dumps(obj, indent=2), encoding="utf-8")
-    tmp.replace(path)
-
 def quick_notice(msg: str, ok: bool):
     (st.success if ok else st.warning)(msg)
 
@@ -61,7 +42,7 @@ with st.sidebar:
     lock_path = "policies/policy.lock"
     st.caption("Canonical Policy Hash")
     if Path(policy_path).exists():
-        st.code(acm_policy_hash(policy_path), language="text")
+        st.code(get_store(policy_path).hash, language="text")
     else:
         st.error("Missing policies/base.yaml")
 
@@ -153,96 +134,39 @@ with st.form("selector"):
     submitted = st.form_submit_button("Run Demo")
 
 # -----------------------
-# Orchestration helpers
+# Orchestration helpers (in-process engine)
 # -----------------------
-def seed_event(disruption_type: str, route_id: str, wh_id: str) -> Path:
-    sh(["python3", "scripts/seed_disruption.py"])
-    evt_p = latest_file("data/events/*.json") or Path("data/events/custom_event.json")
-    nowz = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
-    event = {
-        "type": disruption_type,
-        "route_id": route_id,
-        "warehouse_id": wh_id,
-        "source": "streamlit-demo",
-        "severity": "high",
-        "ts": nowz,
-    }
-    dump_json_atomic(evt_p, event)
-    return evt_p
-
-def gen_plans():
-    rc, out, err = sh(["python3", "scripts/generate_plans.py"])
-    bundle_p = latest_file("data/plans/*.json")
-    return bundle_p, rc, out, err
-
-def verify_all_with_z3_return_table() -> List[Dict[str, Any]]:
-    rc, out, err = sh(["python3", "scripts/verify_policies.py"])
-    table: List[Dict[str, Any]] = []
-    if rc == 0 and out:
-        try:
-            res = json.loads(out)
-            for r in res.get("results", []):
-                table.append({
-                    "plan_id": r.get("plan_id"),
-                    "strategy": r.get("strategy"),
-                    "sat": r.get("sat"),
-                    "counterexample": r.get("counterexample"),
-                    "via": "z3"
-                })
-        except Exception:
-            pass
-    return table
-
-def simulate_from_bundle():
-    rc, out, err = sh(["python3", "scripts/simulate_twin.py"])
-    sim_p = latest_file("data/sim/*_sim.json")
-    return sim_p, rc, out, err
-
-def write_proof_entry():
-    rc, out, err = sh(["python3", "scripts/write_proof.py"])
-    return rc, out, err
-
-def soft_verify_plans_from_config(bundle_path: Path, config_path: str = "configs/day13.yaml") -> List[Dict[str, Any]]:
+def seed_event(disruption_type: str, route_id: str, wh_id: str) -> Dict[str, Any]:
+    return engine.seed_event(disruption_type, route_id, wh_id, source="streamlit-demo")
+
+def gen_plans(event: Dict[str, Any], snapshot: Optional[dict] = None) -> Dict[str, Any]:
+    return engine.generate_plans(event, snapshot=snapshot)
+
+def verify_all_with_z3_return_table(bundle: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return engine.verify_plans_z3(bundle)
+
+def soft_verify_plans_from_config(bundle: Dict[str, Any], config_path: str = engine.CONFIG_PATH) -> List[Dict[str, Any]]:
     """
     Fallback: if Z3 results are empty, apply the same logical checks
-    used by scripts/verify_policies.py: budget, SLA, region boundary, PII=false.
+    used by the Z3 path: budget, SLA, region boundary, PII=false.
     """
-    import yaml
-    cfg = yaml.safe_load(Path(config_path).read_text(encoding="utf-8"))
-    boundary = cfg.get("region_data_boundary")
-    budget_cap = float(cfg.get("budget_cap_usd", 1e12))
-    sla_min = float(cfg.get("sla_min_percent", 0.0))
-    bundle = load_json(bundle_path) or {}
-    rows: List[Dict[str, Any]] = []
-    for p in bundle.get("plans", []):
-        ok = True
-        reasons = []
-        if float(p.get("cost_usd", 1e12)) > budget_cap:
-            ok = False; reasons.append("budget_cap")
-        if float(p.get("sla_expected_percent", 0.0)) < sla_min:
-            ok = False; reasons.append("sla_min")
-        if p.get("region_data_boundary") != boundary:
-            ok = False; reasons.append("region_mismatch")
-        if bool(p.get("pii_access", False)):
-            ok = False; reasons.append("pii_access")
-        rows.append({
-            "plan_id": p.get("id"),
-            "strategy": p.get("strategy"),
-            "sat": ok,
-            "counterexample": None if ok else ", ".join(reasons),
-            "via": "policy-fallback"
-        })
-    return rows
-
-def choose_best_plan(bundle_path: Path, verdict_rows: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
-    bundle = load_json(bundle_path) or {}
-    plans = bundle.get("plans", [])
-    sat_ids = {r["plan_id"] for r in verdict_rows if r.get("sat")}
-    candidates = [p for p in plans if p.get("id") in sat_ids]
-    if not candidates:
-        return None
-    candidates.sort(key=lambda p: (float(p.get("cost_usd", 1e12)), -float(p.get("sla_expected_percent", 0.0))))
-    return candidates[0]
+    return engine.soft_verify_plans(bundle, engine.load_config(config_path))
+
+def choose_best_plan(bundle: Dict[str, Any], verdict_rows: List[Dict[str, Any]],
+                     config_path: str = engine.CONFIG_PATH) -> Optional[Dict[str, Any]]:
+    """Same ranking as run_pipeline, the scheduler and the API: the config's selection.weights, if any."""
+    weights = engine.selection_weights(engine.load_config(config_path))
+    return engine.choose_best_plan(bundle, verdict_rows, weights=weights)
+
+def simulate_from_bundle(bundle: Dict[str, Any], snapshot: Optional[dict] = None) -> Dict[str, Any]:
+    return engine.simulate_bundle(bundle, snapshot=snapshot)
+
+def write_proof_entry(event: Dict[str, Any], bundle: Dict[str, Any], sim: Dict[str, Any],
+                      verdict_rows: List[Dict[str, Any]], snapshot: Optional[dict] = None) -> Dict[str, str]:
+    """Persist event/bundle/sim artifacts and append a chained proof entry; returns written paths."""
+    paths, _ = engine.persist_run(Path("."), event, bundle, sim, verdict_rows, snapshot,
+                                  proof_policy_hash=get_store(engine.POLICY_PATH).hash)
+    return paths
 
 # -----------------------
 # Visualization helpers
@@ -290,7 +214,6 @@ if submitted:
     with st.status("Analyzing chain...", expanded=True) as status:
         # 1) Snapshot
         snapshot = PRESETS[chain]["snapshot"]
-        dump_json_atomic(Path("twin_snapshot.json"), snapshot)
         st.write("Snapshot prepared for:", chain); st.json(snapshot)
         st.write("Initial Supply Chain:"); draw_chain(snapshot, None, None)
 
@@ -298,8 +221,7 @@ if submitted:
         time.sleep(0.2)
 
         # 2) Event
-        evt_p = seed_event(disruption, route_sel, wh_sel)
-        event = load_json(evt_p) or {}
+        event = seed_event(disruption, route_sel, wh_sel)
         st.write("Seeded Event:"); st.json(event)
         st.write("Affected elements highlighted:")
         draw_chain(snapshot, event.get("route_id"), event.get("warehouse_id"))
@@ -308,13 +230,10 @@ if submitted:
         time.sleep(0.2)
 
         # 3) Plans
-        bundle_p, rc_gp, out_gp, err_gp = gen_plans()
-        st.write("Plan generation stdout:"); st.code(out_gp or "—")
-        if err_gp: st.write("stderr:"); st.code(err_gp)
-        if rc_gp != 0 or not bundle_p:
-            status.update(label="Plan generation failed", state="error"); st.stop()
-        bundle = load_json(bundle_p) or {}
+        bundle = gen_plans(event, snapshot)
         plans = bundle.get("plans", [])
+        if not plans:
+            status.update(label="Plan generation failed", state="error"); st.stop()
         st.success(f"Generated {len(plans)} plan(s):")
         st.dataframe(
             [
@@ -330,20 +249,20 @@ if submitted:
         time.sleep(0.2)
 
         # 4) Verify
-        z3_rows = verify_all_with_z3_return_table()
+        z3_rows = verify_all_with_z3_return_table(bundle)
         verdict_rows = z3_rows[:]
         used_fallback = False
         if not verdict_rows or all(not r.get("sat") for r in verdict_rows):
             # Fallback to policy checks if Z3 has no SAT
             used_fallback = True
-            verdict_rows = soft_verify_plans_from_config(bundle_p)
+            verdict_rows = soft_verify_plans_from_config(bundle)
 
         # Show results
         st.write("Verification results:")
         st.dataframe(verdict_rows, use_container_width=True)
 
         # 5) Choose best from whichever path yielded SAT
-        best = choose_best_plan(bundle_p, verdict_rows)
+        best = choose_best_plan(bundle, verdict_rows)
         if not best:
             status.update(label="No SAT plan found after fallback; please check policy thresholds.", state="error")
             st.stop()
@@ -358,13 +277,10 @@ if submitted:
         time.sleep(0.2)
 
         # 6) Simulate
-        sim_p, rc_sim, out_sim, err_sim = simulate_from_bundle()
-        st.write("Simulation stdout:"); st.code(out_sim or "—")
-        if err_sim: st.write("stderr:"); st.code(err_sim)
-        if not (rc_sim == 0 and sim_p):
+        sim = simulate_from_bundle(bundle, snapshot)
+        if not sim.get("results"):
             status.update(label="Simulation failed", state="error"); st.stop()
 
-        sim = load_json(sim_p) or {}
         st.write("Simulation results (all candidates):")
         st.dataframe(sim.get("results", []), use_container_width=True)
 
@@ -391,13 +307,12 @@ if submitted:
         proof_note = False
         if allow_write_proof:
             status.update(label="Writing proof entry...")
-            rc_pf, out_pf, err_pf = write_proof_entry()
-            st.write("write_proof stdout:"); st.code(out_pf or "—")
-            if err_pf: st.write("stderr:"); st.code(err_pf)
-            if rc_pf == 0:
-                st.success("Proof entry appended to audits/day13_proof.jsonl"); proof_note = True
-            else:
-                st.warning(f"write_proof returned rc={rc_pf}")
+            try:
+                written = write_proof_entry(event, bundle, sim, verdict_rows, snapshot)
+                st.write("Artifacts written:"); st.json(written)
+                st.success(f"Proof entry appended to {engine.PROOF_LOG}"); proof_note = True
+            except Exception as e:
+                st.warning(f"write_proof failed: {e}")
 
         status.update(label="Simulation applied.", state="complete")
 
@@ -0,0 +1,165 @@
+# hub/adt_standin.py
+"""
+Local Azure Digital Twins stand-in for offline throughput runs.
+
+Serves the twin routes the updater uses: GET/PUT/PATCH/DELETE
+/digitaltwins/{id}. PATCH applies add/replace/remove JSON Patch ops to
+in-memory twins (a missing twin is created on first patch). latency_ms adds
+a fixed per-request delay to mimic a round trip; reject_every makes every
+n-th request answer 429 so retry paths can be exercised.
+"""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+from urllib.parse import unquote, urlsplit
+
+
+class PatchError(ValueError):
+    pass
+
+
+def apply_patch(doc: Dict[str, Any], patch: List[Dict[str, Any]]) -> None:
+    for op in patch:
+        parts = [unquote(p).replace("~1", "/").replace("~0", "~") for p in op["path"].lstrip("/").split("/")]
+        parent = doc
+        for key in parts[:-1]:
+            if not isinstance(parent.get(key), dict):
+                raise PatchError(f"missing parent for {op['path']}")
+            parent = parent[key]
+        leaf = parts[-1]
+        kind = op.get("op")
+        if kind == "add":
+            parent[leaf] = op.get("value")
+        elif kind == "replace":
+            if leaf not in parent:
+                raise PatchError(f"replace on missing {op['path']}")
+            parent[leaf] = op.get("value")
+        elif kind == "remove":
+            if leaf not in parent:
+                raise PatchError(f"remove on missing {op['path']}")
+            del parent[leaf]
+        else:
+            raise PatchError(f"unsupported op {kind!r}")
+
+
+class AdtStandIn(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency_ms: float = 0.0,
+                 reject_every: int = 0):
+        super().__init__((host, port), _Handler)
+        self.latency_ms = latency_ms
+        self.reject_every = reject_every
+        self.twins: Dict[str, Dict[str, Any]] = {}
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.ops = 0
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def endpoint(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "AdtStandIn":
+        self._thread = threading.Thread(target=self.serve_forever, name="adt-standin", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, so pooled clients reuse connections
+    disable_nagle_algorithm = True  # headers and body go out as separate writes
+    server: AdtStandIn
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+    def _reply(self, code: int, body: Optional[Any] = None, headers: Optional[Dict[str, str]] = None) -> None:
+        data = b"" if body is None else json.dumps(body).encode("utf-8")
+        self.send_response(code)
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        if data:
+            self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _twin_id(self) -> Optional[str]:
+        path = urlsplit(self.path).path
+        prefix = "/digitaltwins/"
+        return unquote(path[len(prefix):]) if path.startswith(prefix) and len(path) > len(prefix) else None
+
+    def _begin(self) -> Optional[str]:
+        """Common request handling; returns the twin id, or None if a reply was sent."""
+        n = int(self.headers.get("Content-Length") or 0)
+        self._body = self.rfile.read(n) if n else b""
+        srv = self.server
+        with srv.lock:
+            srv.requests += 1
+            count = srv.requests
+        if srv.latency_ms:
+            time.sleep(srv.latency_ms / 1000.0)
+        if srv.reject_every and count % srv.reject_every == 0:
+            self._reply(429, {"error": {"code": "TooManyRequests"}}, {"Retry-After": "0"})
+            return None
+        twin_id = self._twin_id()
+        if twin_id is None:
+            self._reply(404, {"error": {"code": "NotFound"}})
+        return twin_id
+
+    def do_GET(self) -> None:
+        twin_id = self._begin()
+        if twin_id is None:
+            return
+        with self.server.lock:
+            twin = self.server.twins.get(twin_id)
+            body = None if twin is None else json.loads(json.dumps(twin))
+        if body is None:
+            self._reply(404, {"error": {"code": "DigitalTwinNotFound"}})
+        else:
+            self._reply(200, body)
+
+    def do_PUT(self) -> None:
+        twin_id = self._begin()
+        if twin_id is None:
+            return
+        doc = json.loads(self._body or b"{}")
+        doc["$dtId"] = twin_id
+        with self.server.lock:
+            self.server.twins[twin_id] = doc
+        self._reply(200, doc)
+
+    def do_PATCH(self) -> None:
+        twin_id = self._begin()
+        if twin_id is None:
+            return
+        try:
+            patch = json.loads(self._body or b"[]")
+            with self.server.lock:
+                twin = self.server.twins.setdefault(twin_id, {"$dtId": twin_id})
+                staged = json.loads(json.dumps(twin))
+                apply_patch(staged, patch)  # all-or-nothing, like ADT
+                self.server.twins[twin_id] = staged
+                self.server.ops += len(patch)
+        except (ValueError, KeyError) as e:
+            self._reply(400, {"error": {"code": "JsonPatchInvalid", "message": str(e)}})
+            return
+        self._reply(204)
+
+    def do_DELETE(self) -> None:
+        twin_id = self._begin()
+        if twin_id is None:
+            return
+        with self.server.lock:
+            existed = self.server.twins.pop(twin_id, None) is not None
+        self._reply(204 if existed else 404)
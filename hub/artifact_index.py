@@ -0,0 +1,183 @@
+# hub/artifact_index.py
+"""
+Append-only manifest of pipeline artifacts (events, plan bundles, sim results).
+
+Each row records the artifact's content SHA-256, its path relative to the
+repo root and the SHA-256 of its parent (bundle -> event, sim -> bundle).
+"Latest of a kind" and "sim for this bundle" are indexed lookups, so no
+stage has to glob and stat() a data directory.
+"""
+import hashlib
+import sqlite3
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+INDEX_PATH = "data/manifest.sqlite"
+
+KIND_DIRS = {
+    "event": ("data/events", "*.json"),
+    "bundle": ("data/plans", "*.json"),
+    "sim": ("data/sim", "*_sim.json"),
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS artifacts (
+    seq        INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind       TEXT NOT NULL,
+    sha256     TEXT NOT NULL,
+    path       TEXT NOT NULL,
+    parent     TEXT,
+    created_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_artifacts_kind ON artifacts(kind, seq);
+CREATE INDEX IF NOT EXISTS ix_artifacts_sha ON artifacts(sha256);
+CREATE INDEX IF NOT EXISTS ix_artifacts_parent ON artifacts(parent, kind, seq);
+"""
+
+
+@dataclass
+class ArtifactRecord:
+    kind: str
+    sha256: str
+    path: str
+    parent: Optional[str]
+    created_at: str
+
+
+def sha256_file(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+class ArtifactIndex:
+    """SQLite (WAL) manifest; one connection per thread, inserts only (rebuild() aside)."""
+
+    def __init__(self, root: str = ".", index_path: str = INDEX_PATH):
+        self.root = Path(root)
+        self.db_path = self.root / index_path
+        self._local = threading.local()
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), timeout=30.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._local.conn = conn
+        return conn
+
+    def close(self) -> None:
+        """Close this thread's connection (for short-lived indexes, e.g. per-run workspaces)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def _rel(self, path: Path) -> str:
+        try:
+            return str(Path(path).resolve().relative_to(self.root.resolve()))
+        except ValueError:
+            return str(path)
+
+    def record(self, kind: str, path: Path, sha256: str, parent: Optional[str] = None) -> ArtifactRecord:
+        if kind not in KIND_DIRS:
+            raise ValueError(f"unknown artifact kind: {kind}")
+        rec = ArtifactRecord(kind, sha256, self._rel(path), parent,
+                             datetime.now(timezone.utc).isoformat())
+        self._conn().execute(
+            "INSERT INTO artifacts(kind, sha256, path, parent, created_at) VALUES (?,?,?,?,?)",
+            (rec.kind, rec.sha256, rec.path, rec.parent, rec.created_at),
+        )
+        return rec
+
+    def _one(self, sql: str, args: tuple) -> Optional[ArtifactRecord]:
+        row = self._conn().execute(sql, args).fetchone()
+        return ArtifactRecord(*row) if row else None
+
+    def latest(self, kind: str) -> Optional[ArtifactRecord]:
+        return self._one(
+            "SELECT kind, sha256, path, parent, created_at FROM artifacts "
+            "WHERE kind=? ORDER BY seq DESC LIMIT 1", (kind,))
+
+    def by_sha(self, sha256: str) -> Optional[ArtifactRecord]:
+        return self._one(
+            "SELECT kind, sha256, path, parent, created_at FROM artifacts "
+            "WHERE sha256=? ORDER BY seq DESC LIMIT 1", (sha256,))
+
+    def child(self, parent_sha256: str, kind: str) -> Optional[ArtifactRecord]:
+        """Newest artifact of `kind` whose parent is `parent_sha256` (e.g. the sim for a bundle)."""
+        return self._one(
+            "SELECT kind, sha256, path, parent, created_at FROM artifacts "
+            "WHERE parent=? AND kind=? ORDER BY seq DESC LIMIT 1", (parent_sha256, kind))
+
+    def latest_path(self, kind: str) -> Optional[Path]:
+        """Newest indexed artifact path; falls back to a directory scan for unindexed trees."""
+        rec = self.latest(kind)
+        if rec:
+            return self.root / rec.path
+        directory, pattern = KIND_DIRS[kind]
+        files = sorted((self.root / directory).glob(pattern), key=lambda p: p.stat().st_mtime)
+        return files[-1] if files else None
+
+    def sim_for_bundle(self, bundle_sha256: str) -> Optional[Path]:
+        rec = self.child(bundle_sha256, "sim")
+        return self.root / rec.path if rec else None
+
+    def rebuild(self, kinds: Iterable[str] = ("event", "bundle", "sim")) -> Dict[str, int]:
+        """
+        Backfill from existing data/ directories (oldest first by mtime), replacing
+        the rows of those kinds in one transaction, so running it again is harmless.
+        Parent links are recovered from origin_event_file / origin_bundle fields.
+        """
+        import json
+        kinds = list(kinds)
+        by_name: Dict[str, str] = {}
+        counts: Dict[str, int] = {}
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany("DELETE FROM artifacts WHERE kind=?", [(k,) for k in kinds])
+            for kind in kinds:
+                directory, pattern = KIND_DIRS[kind]
+                files = sorted((self.root / directory).glob(pattern), key=lambda p: p.stat().st_mtime)
+                if kind == "bundle":
+                    files = [f for f in files if not f.name.endswith("_sim.json")]
+                for f in files:
+                    data = f.read_bytes()
+                    sha = hashlib.sha256(data).hexdigest()
+                    parent = None
+                    try:
+                        obj = json.loads(data)
+                        origin = obj.get("origin_event_file") or obj.get("origin_bundle")
+                        parent = by_name.get(origin) if origin else None
+                    except Exception:
+                        pass
+                    by_name[f.name] = sha
+                    self.record(kind, f, sha, parent)
+                counts[kind] = len(files)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return counts
+
+
+_indexes: Dict[str, ArtifactIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_index(root: str = ".") -> ArtifactIndex:
+    """
+    Process-wide ArtifactIndex per root. Meant for long-lived roots (the repo);
+    throwaway workspaces should open an ArtifactIndex and close() it instead.
+    """
+    key = str(Path(root).resolve())
+    with _indexes_lock:
+        idx = _indexes.get(key)
+        if idx is None:
+            idx = _indexes[key] = ArtifactIndex(root)
+        return idx
@@ -0,0 +1,233 @@
+# hub/audit_chain.py
+"""
+Audit chain writer for audit_chain.jsonl.
+
+Entries keep the existing format: {"timestamp", "prev_hash", "lineage",
+"entry_hash"} with entry_hash = SHA-256 over the sorted-key compact JSON of
+the entry without entry_hash. The head is held in memory; appends take an
+exclusive flock on <chain>.lock, resync the head only if another process
+grew the file (dropping a torn last line left by a crashed writer), and
+commit a whole batch with one write + fsync.
+
+GroupCommitWriter batches entries from many producer threads; the daemon in
+scripts/audit_daemon.py exposes it over a Unix socket.
+"""
+import fcntl
+import hashlib
+import json
+import os
+import queue
+import socket
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional, Sequence
+
+CHAIN_FILE = "audit_chain.jsonl"
+HEAD_FILE = "artifacts/chain_head.json"
+SOCKET_PATH = "artifacts/audit.sock"
+
+
+def sha256_json(obj: Any) -> str:
+    data = json.dumps(obj, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(data).hexdigest()
+
+
+def now_iso() -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+
+
+def read_tail_line(path: str, block: int = 8192, end: Optional[int] = None) -> Optional[bytes]:
+    """Last non-empty line of a file (of its first `end` bytes, when given), read backwards."""
+    try:
+        with open(path, "rb") as f:
+            if end is None:
+                f.seek(0, os.SEEK_END)
+                end = f.tell()
+            buf = b""
+            pos = end
+            while pos > 0:
+                step = min(block, pos)
+                pos -= step
+                f.seek(pos)
+                buf = f.read(step) + buf
+                lines = buf.rstrip(b"\n").rsplit(b"\n", 1)
+                if len(lines) == 2 or pos == 0:
+                    last = lines[-1].strip()
+                    return last or None
+            return None
+    except FileNotFoundError:
+        return None
+
+
+def complete_end(path: str, size: int, block: int = 8192) -> int:
+    """Offset just past the last newline in the first `size` bytes (0 if none); size if nothing is torn."""
+    with open(path, "rb") as f:
+        pos = size
+        while pos > 0:
+            step = min(block, pos)
+            pos -= step
+            f.seek(pos)
+            buf = f.read(step)
+            if pos + step == size and buf.endswith(b"\n"):
+                return size
+            i = buf.rfind(b"\n")
+            if i >= 0:
+                return pos + i + 1
+        return 0
+
+
+class AuditWriter:
+    """Single-process writer; safe across processes via flock."""
+
+    def __init__(self, chain_path: str = CHAIN_FILE, head_path: Optional[str] = HEAD_FILE,
+                 fsync: bool = True):
+        self.chain_path = chain_path
+        self.head_path = head_path
+        self.fsync = fsync
+        self.lock_path = chain_path + ".lock"
+        self._mutex = threading.Lock()
+        self._head: Optional[str] = None
+        self._size = -1  # chain size when _head was last known good
+
+    def _resync(self, repair: bool = False) -> None:
+        """
+        Re-read the head if the chain changed size. An unterminated last line
+        (a writer died mid-write) was never committed: it is skipped, and with
+        repair (only under the flock) truncated away so appends chain from the
+        last whole entry.
+        """
+        try:
+            size = os.path.getsize(self.chain_path)
+        except FileNotFoundError:
+            size = 0
+        if size == self._size:
+            return
+        end = complete_end(self.chain_path, size) if size else 0
+        if end < size and repair:
+            os.truncate(self.chain_path, end)
+            size = end
+        tail = read_tail_line(self.chain_path, end=end)
+        self._head = json.loads(tail).get("entry_hash") if tail else None
+        self._size = size if end == size else -1  # look again until the torn line is gone
+
+    @property
+    def head(self) -> Optional[str]:
+        with self._mutex:
+            self._resync()
+            return self._head
+
+    def _write_head(self) -> None:
+        if not self.head_path:
+            return
+        os.makedirs(os.path.dirname(self.head_path) or ".", exist_ok=True)
+        tmp = self.head_path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump({"head": self._head, "updated_at": now_iso()}, f, indent=2)
+        os.replace(tmp, self.head_path)
+
+    def append_many(self, lineages: Sequence[Dict[str, Any]]) -> List[str]:
+        """Chain and commit a batch with one write (+ fsync); returns entry hashes in order."""
+        if not lineages:
+            return []
+        os.makedirs(os.path.dirname(self.chain_path) or ".", exist_ok=True)
+        with self._mutex, open(self.lock_path, "a") as lockf:
+            fcntl.flock(lockf, fcntl.LOCK_EX)
+            try:
+                self._resync(repair=True)
+                ts = now_iso()
+                hashes: List[str] = []
+                lines: List[str] = []
+                prev = self._head
+                for lineage in lineages:
+                    entry = {"timestamp": ts, "prev_hash": prev, "lineage": lineage}
+                    entry["entry_hash"] = prev = sha256_json(entry)
+                    hashes.append(prev)
+                    lines.append(json.dumps(entry, separators=(",", ":")))
+                data = ("\n".join(lines) + "\n").encode("utf-8")
+                fd = os.open(self.chain_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+                try:
+                    os.write(fd, data)
+                    if self.fsync:
+                        os.fsync(fd)
+                    self._size = os.fstat(fd).st_size
+                finally:
+                    os.close(fd)
+                self._head = prev
+                self._write_head()
+                return hashes
+            finally:
+                fcntl.flock(lockf, fcntl.LOCK_UN)
+
+    def append(self, lineage: Dict[str, Any]) -> str:
+        return self.append_many([lineage])[0]
+
+
+class GroupCommitWriter:
+    """
+    Accepts entries from many producers; a background thread commits them in
+    batches of up to max_batch, waiting at most max_wait_ms for a batch to fill.
+    """
+
+    def __init__(self, writer: Optional[AuditWriter] = None, max_batch: int = 512,
+                 max_wait_ms: float = 2.0):
+        self.writer = writer or AuditWriter()
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000.0
+        self._q: "queue.Queue[Optional[tuple]]" = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="audit-group-commit", daemon=True)
+        self._thread.start()
+        self.batches = 0
+        self.entries = 0
+
+    def submit(self, lineage: Dict[str, Any]) -> "Future[str]":
+        fut: "Future[str]" = Future()
+        self._q.put((lineage, fut))
+        return fut
+
+    def append(self, lineage: Dict[str, Any], timeout: Optional[float] = None) -> str:
+        return self.submit(lineage).result(timeout)
+
+    def _run(self) -> None:
+        stop = False
+        while not stop:
+            item = self._q.get()
+            if item is None:
+                break
+            batch = [item]
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch:
+                try:
+                    nxt = self._q.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if nxt is None:
+                    stop = True
+                    break
+                batch.append(nxt)
+            try:
+                hashes = self.writer.append_many([lin for lin, _ in batch])
+                for (_, fut), h in zip(batch, hashes):
+                    fut.set_result(h)
+                self.batches += 1
+                self.entries += len(batch)
+            except Exception as e:
+                for _, fut in batch:
+                    fut.set_exception(e)
+
+    def close(self) -> None:
+        self._q.put(None)
+        self._thread.join()
+
+
+def send_to_daemon(lineage: Dict[str, Any], sock_path: str = SOCKET_PATH, timeout: float = 10.0) -> str:
+    """Submit one lineage to scripts/audit_daemon.py; returns its entry_hash."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        s.settimeout(timeout)
+        s.connect(sock_path)
+        s.sendall((json.dumps(lineage, separators=(",", ":")) + "\n").encode("utf-8"))
+        with s.makefile("r", encoding="utf-8") as f:
+            resp = json.loads(f.readline())
+    if "error" in resp:
+        raise RuntimeError(resp["error"])
+    return resp["entry_hash"]
@@ -0,0 +1,189 @@
+# hub/audit_merkle.py
+"""
+Merkle tree over audit_chain.jsonl for O(log n) inclusion proofs.
+
+Leaves are the chain's entry_hash values in order. Hashing follows RFC 6962:
+leaf = SHA256(0x00 || entry_hash), node = SHA256(0x01 || left || right).
+The tree is kept incrementally in a SQLite sidecar that stores every
+complete aligned subtree node, so appending a leaf is amortized O(1) and a
+proof needs O(log n) node lookups. Roots are recorded every `root_every`
+leaves and at the end of each sync so auditors can pin them.
+
+verify_inclusion() checks a proof against a root with nothing but the proof.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from typing import Any, Dict, List, Optional
+
+from hub.audit_chain import CHAIN_FILE
+
+MERKLE_DB = "artifacts/audit_merkle.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS nodes (level INTEGER, idx INTEGER, hash BLOB, PRIMARY KEY (level, idx));
+CREATE TABLE IF NOT EXISTS leaves (idx INTEGER PRIMARY KEY, entry_hash TEXT, plan_id TEXT);
+CREATE INDEX IF NOT EXISTS ix_leaves_entry ON leaves(entry_hash);
+CREATE INDEX IF NOT EXISTS ix_leaves_plan ON leaves(plan_id, idx);
+CREATE TABLE IF NOT EXISTS roots (size INTEGER PRIMARY KEY, root TEXT, ts TEXT);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+"""
+
+
+def leaf_hash(entry_hash: str) -> bytes:
+    return hashlib.sha256(b"\x00" + bytes.fromhex(entry_hash)).digest()
+
+
+def node_hash(left: bytes, right: bytes) -> bytes:
+    return hashlib.sha256(b"\x01" + left + right).digest()
+
+
+def _split(n: int) -> int:
+    """Largest power of two strictly less than n (n >= 2)."""
+    k = 1
+    while k << 1 < n:
+        k <<= 1
+    return k
+
+
+class MerkleLog:
+    def __init__(self, chain_path: str = CHAIN_FILE, db_path: str = MERKLE_DB, root_every: int = 1024):
+        self.chain_path = chain_path
+        self.root_every = root_every
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        self.db = sqlite3.connect(db_path)
+        self.db.executescript(_SCHEMA)
+
+    # -- state --
+    def _meta(self, key: str, default: int = 0) -> int:
+        row = self.db.execute("SELECT value FROM meta WHERE key=?", (key,)).fetchone()
+        return int(row[0]) if row else default
+
+    @property
+    def size(self) -> int:
+        return self._meta("count")
+
+    def _node(self, level: int, idx: int) -> bytes:
+        row = self.db.execute("SELECT hash FROM nodes WHERE level=? AND idx=?", (level, idx)).fetchone()
+        if row is None:
+            raise KeyError((level, idx))
+        return row[0]
+
+    # -- building --
+    def _append_leaf(self, idx: int, entry_hash: str, plan_id: Optional[str]) -> None:
+        self.db.execute("INSERT INTO leaves VALUES (?,?,?)", (idx, entry_hash, plan_id))
+        h, level, i = leaf_hash(entry_hash), 0, idx
+        self.db.execute("INSERT INTO nodes VALUES (?,?,?)", (level, i, h))
+        while i & 1:  # right child completes a parent
+            h = node_hash(self._node(level, i - 1), h)
+            level, i = level + 1, i >> 1
+            self.db.execute("INSERT INTO nodes VALUES (?,?,?)", (level, i, h))
+
+    def sync(self) -> int:
+        """Add leaves for chain lines appended since the last sync; returns the tree size."""
+        if not os.path.exists(self.chain_path):
+            return self.size
+        offset, count = self._meta("offset"), self._meta("count")
+        with self.db:
+            with open(self.chain_path, "rb") as f:
+                f.seek(offset)
+                for raw in f:
+                    if not raw.endswith(b"\n"):
+                        break
+                    offset += len(raw)
+                    if not raw.strip():
+                        continue
+                    entry = json.loads(raw)
+                    lineage = entry.get("lineage") or {}
+                    self._append_leaf(count, entry["entry_hash"], lineage.get("plan_id"))
+                    count += 1
+                    if count % self.root_every == 0:
+                        self._record_root(count)
+            self.db.execute("INSERT OR REPLACE INTO meta VALUES ('offset', ?)", (str(offset),))
+            self.db.execute("INSERT OR REPLACE INTO meta VALUES ('count', ?)", (str(count),))
+            if count:
+                self._record_root(count)
+        return count
+
+    def _record_root(self, size: int) -> None:
+        self.db.execute("INSERT OR IGNORE INTO roots VALUES (?,?,?)",
+                        (size, self._mth(0, size).hex(), time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())))
+
+    # -- queries --
+    def _mth(self, a: int, b: int) -> bytes:
+        """Root of leaves [a, b); aligned power-of-two ranges are single lookups."""
+        n = b - a
+        if n & (n - 1) == 0 and a % n == 0:
+            return self._node(n.bit_length() - 1, a // n)
+        k = _split(n)
+        return node_hash(self._mth(a, a + k), self._mth(a + k, b))
+
+    def root(self, size: Optional[int] = None) -> Optional[str]:
+        size = self.size if size is None else size
+        return self._mth(0, size).hex() if size else None
+
+    def roots(self, limit: int = 20) -> List[Dict[str, Any]]:
+        rows = self.db.execute("SELECT size, root, ts FROM roots ORDER BY size DESC LIMIT ?", (limit,))
+        return [{"tree_size": s, "root": r, "ts": t} for s, r, t in rows]
+
+    def _path(self, m: int, a: int, b: int) -> List[bytes]:
+        if b - a == 1:
+            return []
+        k = _split(b - a)
+        if m < a + k:
+            return self._path(m, a, a + k) + [self._mth(a + k, b)]
+        return self._path(m, a + k, b) + [self._mth(a, a + k)]
+
+    def prove_index(self, idx: int, tree_size: Optional[int] = None) -> Dict[str, Any]:
+        size = self.size if tree_size is None else tree_size
+        if not 0 <= idx < size <= self.size:
+            raise IndexError(f"leaf {idx} not in tree of size {size}")
+        row = self.db.execute("SELECT entry_hash, plan_id FROM leaves WHERE idx=?", (idx,)).fetchone()
+        return {
+            "entry_hash": row[0],
+            "plan_id": row[1],
+            "leaf_index": idx,
+            "tree_size": size,
+            "root": self.root(size),
+            "path": [h.hex() for h in self._path(idx, 0, size)],
+        }
+
+    def prove(self, entry_hash: Optional[str] = None, plan_id: Optional[str] = None,
+              limit: int = 10) -> List[Dict[str, Any]]:
+        """Proofs for an entry_hash, or for the newest `limit` entries of a plan_id."""
+        if entry_hash:
+            rows = self.db.execute("SELECT idx FROM leaves WHERE entry_hash=?", (entry_hash,)).fetchall()
+        elif plan_id:
+            rows = self.db.execute("SELECT idx FROM leaves WHERE plan_id=? ORDER BY idx DESC LIMIT ?",
+                                   (plan_id, limit)).fetchall()
+        else:
+            raise ValueError("entry_hash or plan_id required")
+        return [self.prove_index(r[0]) for r in rows]
+
+    def close(self) -> None:
+        self.db.close()
+
+
+def verify_inclusion(proof: Dict[str, Any], root: Optional[str] = None) -> bool:
+    """RFC 9162 inclusion check; uses proof["root"] unless a pinned `root` is given."""
+    fn, sn = int(proof["leaf_index"]), int(proof["tree_size"]) - 1
+    if fn > sn:
+        return False
+    r = leaf_hash(proof["entry_hash"])
+    for p_hex in proof["path"]:
+        p = bytes.fromhex(p_hex)
+        if sn == 0:
+            return False
+        if fn & 1 or fn == sn:
+            r = node_hash(p, r)
+            if not fn & 1:
+                while not fn & 1 and fn != 0:
+                    fn >>= 1
+                    sn >>= 1
+        else:
+            r = node_hash(r, p)
+        fn >>= 1
+        sn >>= 1
+    return sn == 0 and r.hex() == (root or proof["root"])
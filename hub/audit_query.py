@@ -0,0 +1,226 @@
+# hub/audit_query.py
+"""
+Secondary indexes over a JSONL audit log with cursor pagination.
+
+A SQLite sidecar holds one row per record (line number, byte offset and the
+queryable fields) with an index per field. sync() parses only the bytes
+appended since the last sync and rebuilds when the log was replaced or
+rewritten (new inode, shorter file, same size with a new mtime, or a changed
+hash of the indexed prefix's first and last SIG_WINDOW bytes). query()
+filters on the indexed fields and a timestamp range, returns newest first,
+and reads each hit by seeking to its offset. Timestamps are indexed as epoch
+seconds, so "Z" and "+00:00" stamps (and since/until) compare correctly.
+
+Both log shapes are indexed: chain.log records (top-level policy_hash,
+verdict, secret_name, audit.attestation_type) and audit_chain.jsonl entries
+(lineage.plan_id, lineage.policy_sha256, lineage.verify_status).
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Tuple
+
+FIELDS = ("plan_id", "policy_hash", "verdict", "secret_name", "attestation_type")
+INDEX_DIR = "artifacts"
+SIG_WINDOW = 4096  # bytes at each end of the indexed prefix checked before an incremental sync
+SCHEMA_VERSION = 2  # 2: ts stored as epoch seconds (REAL) instead of the raw string
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    line INTEGER PRIMARY KEY, offset INTEGER, length INTEGER, ts REAL,
+    plan_id TEXT, policy_hash TEXT, verdict TEXT, secret_name TEXT, attestation_type TEXT
+);
+CREATE INDEX IF NOT EXISTS ix_ts ON entries(ts, line);
+CREATE INDEX IF NOT EXISTS ix_plan ON entries(plan_id, line);
+CREATE INDEX IF NOT EXISTS ix_policy ON entries(policy_hash, line);
+CREATE INDEX IF NOT EXISTS ix_verdict ON entries(verdict, line);
+CREATE INDEX IF NOT EXISTS ix_secret ON entries(secret_name, line);
+CREATE INDEX IF NOT EXISTS ix_att ON entries(attestation_type, line);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+"""
+
+
+def index_path_for(log_path: str, index_dir: str = INDEX_DIR) -> str:
+    return os.path.join(index_dir, f"audit_index.{os.path.basename(log_path)}.sqlite")
+
+
+def to_epoch(ts: Any) -> Optional[float]:
+    """Epoch seconds for an ISO-8601 stamp ("Z", an offset, or naive = UTC) or a number; None if neither."""
+    if ts is None:
+        return None
+    try:
+        dt = datetime.fromisoformat(str(ts).replace("Z", "+00:00"))
+    except ValueError:
+        try:
+            return float(ts)
+        except ValueError:
+            return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+def extract_fields(rec: Dict[str, Any]) -> Tuple[Optional[str], ...]:
+    """(ts, plan_id, policy_hash, verdict, secret_name, attestation_type) for either log shape."""
+    lineage = rec.get("lineage") if isinstance(rec.get("lineage"), dict) else {}
+    audit = rec.get("audit") if isinstance(rec.get("audit"), dict) else {}
+    att = audit.get("attestation_type") or rec.get("attestation_type")
+    if att is None and isinstance(audit.get("claims"), dict):
+        att = audit["claims"].get("x-ms-attestation-type")
+    vals = (
+        rec.get("timestamp"),
+        rec.get("plan_id") or lineage.get("plan_id"),
+        rec.get("policy_hash") or lineage.get("policy_hash") or lineage.get("policy_sha256"),
+        rec.get("verdict") or lineage.get("verify_status"),
+        rec.get("secret_name"),
+        att,
+    )
+    return tuple(None if v is None else str(v) for v in vals)
+
+
+class AuditIndex:
+    def __init__(self, log_path: str, db_path: Optional[str] = None):
+        self.log_path = log_path
+        self.db_path = db_path or index_path_for(log_path)
+        os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self.db = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.db.executescript(_SCHEMA)
+        if self._meta("schema") != SCHEMA_VERSION:
+            # Older sidecar layout: start over, the next sync re-indexes the log.
+            self.db.executescript("DROP TABLE entries; DROP TABLE meta;" + _SCHEMA)
+            with self.db:
+                self.db.execute("INSERT INTO meta VALUES ('schema', ?)", (str(SCHEMA_VERSION),))
+
+    def _meta(self, key: str, default: int = 0) -> int:
+        row = self.db.execute("SELECT value FROM meta WHERE key=?", (key,)).fetchone()
+        return int(row[0]) if row else default
+
+    def _prefix_sig(self, f, offset: int) -> str:
+        """SHA-256 over the first and last SIG_WINDOW bytes of the indexed prefix [0, offset)."""
+        h = hashlib.sha256()
+        f.seek(0)
+        h.update(f.read(min(SIG_WINDOW, offset)))
+        start = max(0, offset - SIG_WINDOW)
+        f.seek(start)
+        h.update(f.read(offset - start))
+        return h.hexdigest()
+
+    def _prefix_intact(self, offset: int, st: os.stat_result) -> bool:
+        if self._meta("inode", st.st_ino) != st.st_ino:
+            return False
+        if offset == 0:
+            return True
+        if st.st_size == self._meta("size", -1):
+            # Unchanged, or rewritten in place (same size, new mtime).
+            return st.st_mtime_ns == self._meta("mtime_ns", -1)
+        if st.st_size < offset:
+            return False
+        row = self.db.execute("SELECT value FROM meta WHERE key='prefix_sig'").fetchone()
+        with open(self.log_path, "rb") as f:
+            f.seek(offset - 1)
+            if f.read(1) != b"\n":
+                return False
+            # The file grew: the indexed prefix must still end where it did and keep its edges.
+            return row is not None and row[0] == self._prefix_sig(f, offset)
+
+    def sync(self) -> int:
+        """Index records appended since the last sync; returns the number added."""
+        if not os.path.exists(self.log_path):
+            return 0
+        with self._lock, self.db:
+            st = os.stat(self.log_path)
+            offset, line = self._meta("offset"), self._meta("lines")
+            if not self._prefix_intact(offset, st):
+                self.db.execute("DELETE FROM entries")
+                offset = line = 0
+            added = 0
+            rows = []
+            with open(self.log_path, "rb") as f:
+                f.seek(offset)
+                for raw in f:
+                    if not raw.endswith(b"\n"):
+                        break  # partial trailing write
+                    start, offset = offset, offset + len(raw)
+                    line += 1
+                    try:
+                        rec = json.loads(raw)
+                    except ValueError:
+                        continue  # tolerate non-JSON lines in chain.log
+                    if not isinstance(rec, dict):
+                        continue
+                    ts, *fields = extract_fields(rec)
+                    rows.append((line, start, len(raw), to_epoch(ts), *fields))
+                    if len(rows) >= 5000:
+                        self.db.executemany("INSERT OR REPLACE INTO entries VALUES (?,?,?,?,?,?,?,?,?)", rows)
+                        added += len(rows); rows = []
+            self.db.executemany("INSERT OR REPLACE INTO entries VALUES (?,?,?,?,?,?,?,?,?)", rows)
+            added += len(rows)
+            with open(self.log_path, "rb") as f:
+                sig = self._prefix_sig(f, offset)
+            for k, v in (("offset", offset), ("lines", line), ("inode", st.st_ino), ("size", st.st_size),
+                         ("mtime_ns", st.st_mtime_ns), ("prefix_sig", sig)):
+                self.db.execute("INSERT OR REPLACE INTO meta VALUES (?, ?)", (k, str(v)))
+            return added
+
+    def query(self, since: Optional[str] = None, until: Optional[str] = None,
+              cursor: Optional[str] = None, limit: int = 20, sync: bool = True,
+              **filters: Optional[str]) -> Dict[str, Any]:
+        """
+        Newest-first records matching every given field filter and since <= ts < until
+        (ISO-8601 stamps in any offset, or epoch seconds). Pass the returned
+        next_cursor back as `cursor` for the following page.
+        """
+        unknown = set(filters) - set(FIELDS)
+        if unknown:
+            raise ValueError(f"unknown filter(s): {', '.join(sorted(unknown))}")
+        if sync:
+            self.sync()
+        where, params = [], []
+        for k, v in filters.items():
+            if v is not None:
+                where.append(f"{k} = ?"); params.append(v)
+        for op, bound in ((">=", since), ("<", until)):
+            if bound:
+                t = to_epoch(bound)
+                if t is None:
+                    raise ValueError(f"bad timestamp: {bound!r}")
+                where.append(f"ts {op} ?"); params.append(t)
+        if cursor:
+            where.append("line < ?"); params.append(int(cursor))
+        sql = "SELECT line, offset, length FROM entries"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY line DESC LIMIT ?"
+        with self._lock:
+            hits = self.db.execute(sql, params + [limit + 1]).fetchall()
+        more = len(hits) > limit
+        hits = hits[:limit]
+        records = []
+        with open(self.log_path, "rb") as f:
+            for _, off, length in hits:
+                f.seek(off)
+                records.append(json.loads(f.read(length)))
+        return {
+            "records": records,
+            "next_cursor": str(hits[-1][0]) if more else None,
+        }
+
+    def close(self) -> None:
+        self.db.close()
+
+
+_indexes: Dict[str, AuditIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_index(log_path: str) -> AuditIndex:
+    key = os.path.abspath(log_path)
+    with _indexes_lock:
+        idx = _indexes.get(key)
+        if idx is None:
+            idx = _indexes[key] = AuditIndex(log_path)
+        return idx
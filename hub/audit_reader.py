@@ -0,0 +1,138 @@
+# hub/audit_reader.py
+"""
+Tail-indexed reader for JSONL audit logs (audits/chain.log, audit_chain.jsonl).
+
+Keeps the byte offset of every complete line start. refresh() only scans the
+bytes appended since the last call when the file grew; a changed inode, a
+shrink, or a same-size rewrite (mtime change) rebuilds the index. tail(n)
+seeks to the start of the n-th line from the end and parses just those lines,
+so request cost tracks n, not the log size.
+"""
+import json
+import os
+import threading
+from array import array
+from typing import Any, Dict, List, Optional, Tuple
+
+_CHUNK = 1 << 20
+
+
+class AuditTail:
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._sig: Optional[Tuple[int, int, int]] = None
+        self._starts = array("q")  # byte offset of each complete line
+        self._end = 0               # offset just past the last complete line
+        self.rebuilds = 0
+
+    def __len__(self) -> int:
+        self.refresh()
+        return len(self._starts)
+
+    def _reset(self) -> None:
+        self._starts = array("q")
+        self._end = 0
+        self.rebuilds += 1
+
+    def _scan(self, size: int) -> None:
+        with open(self.path, "rb") as f:
+            f.seek(self._end)
+            pos = self._end
+            line_start = self._end
+            while pos < size:
+                buf = f.read(min(_CHUNK, size - pos))
+                if not buf:
+                    break
+                i = buf.find(b"\n")
+                while i != -1:
+                    self._starts.append(line_start)
+                    line_start = pos + i + 1
+                    i = buf.find(b"\n", i + 1)
+                pos += len(buf)
+            self._end = line_start  # a partial trailing line is picked up next time
+
+    def refresh(self) -> None:
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            with self._lock:
+                if self._sig is not None:
+                    self._reset()
+                self._sig = None
+            return
+        sig = (st.st_ino, st.st_size, st.st_mtime_ns)
+        if sig == self._sig:
+            return
+        with self._lock:
+            if sig == self._sig:
+                return
+            old = self._sig
+            if old is not None and (old[0] != sig[0] or sig[1] < self._end or sig[1] == old[1]):
+                self._reset()  # replaced, truncated or rewritten in place
+            elif self._end and not self._ends_line(self._end):
+                self._reset()  # grew, but the indexed prefix no longer lines up
+            self._scan(sig[1])
+            self._sig = sig
+
+    def _ends_line(self, offset: int) -> bool:
+        with open(self.path, "rb") as f:
+            f.seek(offset - 1)
+            return f.read(1) == b"\n"
+
+    def _span(self, i: int) -> Tuple[int, int]:
+        stop = self._starts[i + 1] if i + 1 < len(self._starts) else self._end
+        return self._starts[i], stop
+
+    def read_lines(self, start: int, stop: int) -> List[bytes]:
+        """Raw lines [start, stop) by line number, read with a single seek."""
+        self.refresh()
+        start, stop = max(0, start), min(stop, len(self._starts))
+        if start >= stop:
+            return []
+        a, b = self._starts[start], self._span(stop - 1)[1]
+        with open(self.path, "rb") as f:
+            f.seek(a)
+            data = f.read(b - a)
+        return data.split(b"\n")[: stop - start]
+
+    def record(self, i: int) -> Optional[Dict[str, Any]]:
+        lines = self.read_lines(i, i + 1)
+        return _parse(lines[0]) if lines else None
+
+    def tail(self, n: int) -> List[Dict[str, Any]]:
+        """Last n JSON records, oldest first; blank and non-JSON lines are skipped."""
+        self.refresh()
+        out: List[Dict[str, Any]] = []
+        stop = len(self._starts)
+        while len(out) < n and stop > 0:
+            want = n - len(out)
+            start = max(0, stop - want)
+            recs = [r for r in map(_parse, self.read_lines(start, stop)) if r is not None]
+            out = recs[-want:] + out
+            stop = start
+        return out
+
+
+def _parse(raw: bytes) -> Optional[Dict[str, Any]]:
+    s = raw.strip()
+    if not s:
+        return None
+    try:
+        rec = json.loads(s)
+    except ValueError:
+        return None  # tolerate non-JSON lines in chain.log
+    return rec if isinstance(rec, dict) else None
+
+
+_readers: Dict[str, AuditTail] = {}
+_readers_lock = threading.Lock()
+
+
+def get_reader(path: str) -> AuditTail:
+    key = os.path.abspath(path)
+    with _readers_lock:
+        r = _readers.get(key)
+        if r is None:
+            r = _readers[key] = AuditTail(path)
+        return r
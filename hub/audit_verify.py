@@ -0,0 +1,215 @@
+# hub/audit_verify.py
+"""
+Audit chain verification: full, checkpointed-incremental and parallel.
+
+The checkpoint stores the byte offset, line number and head hash just after
+the last verified entry. An incremental run first confirms the checkpoint
+(the entry ending at that offset still hashes to the stored head), then only
+verifies lines appended after it. If the checkpoint does not hold, the run
+falls back to a full verify so the real failure is reported. Every mode
+verifies an unterminated last line too; the checkpoint just never moves past
+one.
+"""
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import List, Optional, Tuple
+
+from hub.audit_chain import CHAIN_FILE, sha256_json
+
+CHECKPOINT_FILE = "artifacts/audit_verify.checkpoint.json"
+
+
+@dataclass
+class VerifyResult:
+    ok: bool
+    head: Optional[str]
+    lines: int                    # total lines in the verified chain
+    verified: int                 # lines hashed in this run
+    offset: int                   # byte offset after the last verified line
+    error: Optional[str] = None   # "[FAIL] Line N: ..." on failure
+    code: int = 0                 # 2 = entry_hash mismatch, 3 = prev_hash mismatch
+    mode: str = "full"
+
+
+@dataclass
+class Checkpoint:
+    chain: str
+    offset: int
+    line: int
+    head: Optional[str]
+    updated_at: str = ""
+
+
+def _check_line(raw: bytes, prev: Optional[str], lineno: int) -> Tuple[Optional[str], Optional[str], int]:
+    """Return (entry_hash, error, code) for one chain line."""
+    try:
+        entry = json.loads(raw)
+    except ValueError:
+        return None, f"[FAIL] Line {lineno}: entry_hash mismatch", 2  # torn or garbled line
+    eh = entry.get("entry_hash")
+    payload = dict(entry)
+    payload.pop("entry_hash", None)
+    if eh != sha256_json(payload):
+        return eh, f"[FAIL] Line {lineno}: entry_hash mismatch", 2
+    if entry.get("prev_hash") != prev:
+        return eh, f"[FAIL] Line {lineno}: prev_hash mismatch (expected {prev}, got {entry.get('prev_hash')})", 3
+    return eh, None, 0
+
+
+def _verify_from(path: str, offset: int, line: int, prev: Optional[str],
+                 mode: str) -> Tuple[VerifyResult, Tuple[int, int, Optional[str]]]:
+    """
+    Verify every line from offset, an unterminated last line included. Also
+    returns (offset, line, head) after the last newline-terminated verified
+    line: the only safe place for a checkpoint, since a trailing partial line
+    may still be growing.
+    """
+    verified = 0
+    safe = (offset, line, prev)
+    with open(path, "rb") as f:
+        f.seek(offset)
+        for raw in f:
+            pos = offset + len(raw)
+            if raw.strip():
+                line += 1
+                eh, err, code = _check_line(raw, prev, line)
+                if err:
+                    return VerifyResult(False, prev, line, verified, offset, err, code, mode), safe
+                prev = eh
+                verified += 1
+            offset = pos
+            if raw.endswith(b"\n"):
+                safe = (offset, line, prev)
+    return VerifyResult(True, prev, line, verified, offset, mode=mode), safe
+
+
+def verify_full(path: str = CHAIN_FILE) -> VerifyResult:
+    if not os.path.exists(path):
+        return VerifyResult(True, None, 0, 0, 0)
+    return _verify_from(path, 0, 0, None, "full")[0]
+
+
+def load_checkpoint(checkpoint_path: str = CHECKPOINT_FILE) -> Optional[Checkpoint]:
+    try:
+        with open(checkpoint_path, "r") as f:
+            return Checkpoint(**json.load(f))
+    except (FileNotFoundError, ValueError, TypeError):
+        return None
+
+
+def save_checkpoint(cp: Checkpoint, checkpoint_path: str = CHECKPOINT_FILE) -> None:
+    os.makedirs(os.path.dirname(checkpoint_path) or ".", exist_ok=True)
+    cp.updated_at = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+    tmp = checkpoint_path + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump(asdict(cp), f, indent=2)
+    os.replace(tmp, checkpoint_path)
+
+
+def _confirm_checkpoint(path: str, cp: Checkpoint) -> bool:
+    """The entry ending at cp.offset must still hash to cp.head."""
+    if cp.offset == 0:
+        return cp.head is None and cp.line == 0
+    if os.path.getsize(path) < cp.offset:
+        return False
+    with open(path, "rb") as f:
+        start = max(0, cp.offset - 65536)
+        f.seek(start)
+        buf = f.read(cp.offset - start)
+    if not buf.endswith(b"\n"):
+        return False
+    last = buf[:-1].rsplit(b"\n", 1)[-1]
+    try:
+        entry = json.loads(last)
+    except ValueError:
+        return False
+    payload = {k: v for k, v in entry.items() if k != "entry_hash"}
+    return entry.get("entry_hash") == cp.head and sha256_json(payload) == cp.head
+
+
+def verify_incremental(path: str = CHAIN_FILE, checkpoint_path: str = CHECKPOINT_FILE) -> VerifyResult:
+    """Verify only entries after the stored checkpoint; advance it on success."""
+    if not os.path.exists(path):
+        return VerifyResult(True, None, 0, 0, 0, mode="incremental")
+    cp = load_checkpoint(checkpoint_path)
+    if cp and os.path.abspath(cp.chain) == os.path.abspath(path) and _confirm_checkpoint(path, cp):
+        res, safe = _verify_from(path, cp.offset, cp.line, cp.head, "incremental")
+    else:
+        res, safe = _verify_from(path, 0, 0, None, "full")
+    if res.ok:
+        # Never past an unterminated last line: it is verified, but re-checked next run.
+        save_checkpoint(Checkpoint(path, *safe), checkpoint_path)
+    return res
+
+
+# -----------------------
+# Parallel full verify
+# -----------------------
+def _chunk_bounds(path: str, parts: int) -> List[Tuple[int, int]]:
+    size = os.path.getsize(path)
+    step = max(1, size // parts)
+    bounds, start = [], 0
+    with open(path, "rb") as f:
+        while start < size:
+            end = min(size, start + step)
+            if end < size:
+                f.seek(end)
+                f.readline()  # advance to the next line start
+                end = f.tell()
+            bounds.append((start, end))
+            start = end
+    return bounds
+
+
+def _hash_chunk(args: Tuple[str, int, int]):
+    """Hash every line in [start, end); check linkage inside the chunk only."""
+    path, start, end = args
+    first_prev: object = ...
+    prev, n = None, 0
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+    for raw in data.split(b"\n"):
+        if not raw.strip():
+            continue
+        n += 1
+        try:
+            entry = json.loads(raw)
+        except ValueError:  # torn or garbled line
+            return (None if first_prev is ... else first_prev), prev, n, n, 2
+        eh = entry.get("entry_hash")
+        payload = {k: v for k, v in entry.items() if k != "entry_hash"}
+        if eh != sha256_json(payload):
+            return (None if first_prev is ... else first_prev), prev, n, n, 2
+        if first_prev is ...:
+            first_prev = entry.get("prev_hash")
+        elif entry.get("prev_hash") != prev:
+            return first_prev, prev, n, n, 3
+        prev = eh
+    return (None if first_prev is ... else first_prev), prev, n, 0, 0
+
+
+def verify_parallel(path: str = CHAIN_FILE, workers: Optional[int] = None) -> VerifyResult:
+    """Hash newline-aligned chunks across processes, then check linkage between chunks."""
+    if not os.path.exists(path):
+        return VerifyResult(True, None, 0, 0, 0, mode="parallel")
+    workers = workers or os.cpu_count() or 1
+    bounds = _chunk_bounds(path, workers * 4)
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        parts = list(ex.map(_hash_chunk, [(path, s, e) for s, e in bounds]))
+    prev, lines = None, 0
+    for (first_prev, last, n, bad_at, code), (_, end) in zip(parts, bounds):
+        # A bad entry_hash on line 1 outranks linkage; otherwise linkage into the chunk comes first.
+        if n and not (code and bad_at == 1) and first_prev != prev:
+            bad_at, code = 1, 3
+        if code:
+            lineno = lines + bad_at
+            msg = "entry_hash mismatch" if code == 2 else "prev_hash mismatch"
+            return VerifyResult(False, prev, lineno, lineno, end, f"[FAIL] Line {lineno}: {msg}", code, "parallel")
+        if n:
+            prev = last
+        lines += n
+    return VerifyResult(True, prev, lines, lines, os.path.getsize(path), mode="parallel")
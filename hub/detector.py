@@ -0,0 +1,126 @@
+# hub/detector.py
+"""
+Streaming disruption detector over the signal feed.
+
+Signals are consumed one at a time. Each (warehouse, route) keeps a sliding
+time window (deque plus running sums), so a signal costs O(1) amortized work:
+one append, evictions of rows that already left the window, one comparison.
+
+An event is raised when the window mean breaches a policy threshold from
+policies/base.yaml constraints.risk_thresholds (max_stockout_risk,
+max_delay_minutes) with at least min_samples signals in the window. A key then
+stays "open" until both means fall below rearm * threshold, so one episode
+gives one event rather than one per signal.
+"""
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, Iterable, Iterator, Optional, Sequence, Tuple
+
+from hub.policy_store import POLICY_PATH, get_store
+from hub.signal_store import to_epoch
+
+
+@dataclass
+class _Window:
+    rows: Deque[Tuple[int, float, float]] = field(default_factory=deque)
+    risk_sum: float = 0.0
+    delay_sum: float = 0.0
+    open: bool = False
+
+
+def _severity(ratio: float) -> str:
+    return "critical" if ratio >= 1.5 else "high" if ratio >= 1.2 else "medium"
+
+
+class DisruptionDetector:
+    def __init__(self, max_stockout_risk: float = 0.35, max_delay_minutes: float = 45.0,
+                 window_s: int = 900, min_samples: int = 3, rearm: float = 0.9,
+                 source: str = "detector"):
+        self.max_risk = float(max_stockout_risk)
+        self.max_delay = float(max_delay_minutes)
+        self.window_s = window_s
+        self.min_samples = min_samples
+        self.rearm = rearm
+        self.source = source
+        self._state: Dict[Tuple[str, str], _Window] = {}
+        self._last_ts: Any = None  # one-entry parse cache: a tick's rows share a timestamp
+        self._last_t = 0
+        self.signals = 0
+        self.events = 0
+
+    @classmethod
+    def from_policy(cls, policy_path: str = POLICY_PATH, **kw: Any) -> "DisruptionDetector":
+        doc = get_store(policy_path).doc or {}
+        risk = (doc.get("constraints") or {}).get("risk_thresholds") or {}
+        return cls(risk.get("max_stockout_risk", 0.35), risk.get("max_delay_minutes", 45), **kw)
+
+    def feed(self, ts: Any, warehouse: str, route: str, risk: float, delay_minutes: float) -> Optional[Dict[str, Any]]:
+        """Add one signal; returns an event when this signal opens a breach."""
+        self.signals += 1
+        if ts == self._last_ts:
+            t = self._last_t
+        else:
+            t = ts if isinstance(ts, int) else to_epoch(ts)
+            self._last_ts, self._last_t = ts, t
+        key = (warehouse, route)
+        w = self._state.get(key)
+        if w is None:
+            w = self._state[key] = _Window()
+        risk, delay = float(risk), float(delay_minutes)
+        rows = w.rows
+        rows.append((t, risk, delay))
+        w.risk_sum += risk
+        w.delay_sum += delay
+        cutoff = t - self.window_s
+        while rows[0][0] <= cutoff:
+            _, r, d = rows.popleft()
+            w.risk_sum -= r
+            w.delay_sum -= d
+        n = len(rows)
+        mean_risk, mean_delay = w.risk_sum / n, w.delay_sum / n
+        if w.open:
+            if mean_risk < self.rearm * self.max_risk and mean_delay < self.rearm * self.max_delay:
+                w.open = False
+            return None
+        if n < self.min_samples:
+            return None
+        risk_hit, delay_hit = mean_risk > self.max_risk, mean_delay > self.max_delay
+        if not (risk_hit or delay_hit):
+            return None
+        w.open = True
+        self.events += 1
+        ratio = max(mean_risk / self.max_risk if self.max_risk else 0.0,
+                    mean_delay / self.max_delay if self.max_delay else 0.0)
+        return {
+            "type": "route_outage" if risk_hit and delay_hit else "stockout_risk" if risk_hit else "route_delay",
+            "route_id": route,
+            "warehouse_id": warehouse,
+            "source": self.source,
+            "severity": _severity(ratio),
+            "ts": ts if isinstance(ts, str) else datetime.fromtimestamp(t, timezone.utc).isoformat(),
+            "detector": {
+                "window_s": self.window_s,
+                "samples": n,
+                "mean_risk": round(mean_risk, 4),
+                "mean_delay_minutes": round(mean_delay, 2),
+                "max_stockout_risk": self.max_risk,
+                "max_delay_minutes": self.max_delay,
+            },
+        }
+
+    def process(self, rows: Iterable[Sequence[Any]]) -> Iterator[Dict[str, Any]]:
+        """Feed (timestamp, warehouse, route, risk, delay_minutes, ...) rows; yield events as they fire."""
+        feed = self.feed
+        for row in rows:
+            ev = feed(row[0], row[1], row[2], row[3], row[4])
+            if ev is not None:
+                yield ev
+
+    def open_breaches(self) -> Dict[Tuple[str, str], Dict[str, float]]:
+        out = {}
+        for key, w in self._state.items():
+            if w.open and w.rows:
+                n = len(w.rows)
+                out[key] = {"mean_risk": w.risk_sum / n, "mean_delay_minutes": w.delay_sum / n}
+        return out
@@ -0,0 +1,429 @@
+# hub/pipeline.py
+"""
+In-process decision pipeline: seed -> plan -> verify -> simulate -> proof.
+
+Each stage is a plain function that takes and returns dicts, so callers
+(Streamlit, the FastAPI hub, the CLI scripts) chain them in memory and only
+touch disk when they ask for artifacts to be written.
+"""
+import hashlib
+import json
+import os
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+CONFIG_PATH = "configs/day13.yaml"
+POLICY_PATH = "policies/base.yaml"
+EVENTS_DIR = "data/events"
+PLANS_DIR = "data/plans"
+SIM_DIR = "data/sim"
+PROOF_LOG = "audits/day13_proof.jsonl"
+CHAIN_META = "audits/chain.meta"
+
+_config_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+
+def utc_now_z() -> str:
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def json_bytes(obj: Any) -> bytes:
+    """Serialize exactly as the artifact files are written (indent=2)."""
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def content_id(obj: Any) -> str:
+    """16-hex id over sorted-key JSON; matches the existing artifact file names."""
+    payload = json.dumps(obj, sort_keys=True).encode()
+    return hashlib.sha256(payload).hexdigest()[:16]
+
+
+def load_config(config_path: str = CONFIG_PATH) -> Dict[str, Any]:
+    """Parse the run config once and reuse it until the file's mtime changes."""
+    p = Path(config_path)
+    mtime = p.stat().st_mtime
+    hit = _config_cache.get(config_path)
+    if hit and hit[0] == mtime:
+        return hit[1]
+    import yaml
+    cfg = yaml.safe_load(p.read_text(encoding="utf-8")) or {}
+    _config_cache[config_path] = (mtime, cfg)
+    return cfg
+
+
+# -----------------------
+# Stages
+# -----------------------
+def seed_event(disruption_type: str = "route_outage", route_id: str = "R7",
+               warehouse_id: str = "W3", source: str = "day13-seed",
+               severity: str = "high") -> Dict[str, Any]:
+    return {
+        "type": disruption_type,
+        "route_id": route_id,
+        "warehouse_id": warehouse_id,
+        "source": source,
+        "severity": severity,
+        "ts": utc_now_z(),
+    }
+
+
+def search_limits(config_path: str = CONFIG_PATH, policy_path: str = POLICY_PATH, **kw: Any):
+    """Plan search limits from the run config and policy constraints (either may be missing)."""
+    from hub.plan_search import SearchLimits
+    from hub.policy_store import get_store
+    cfg = load_config(config_path) if os.path.exists(config_path) else {}
+    doc = get_store(policy_path).doc if os.path.exists(policy_path) else {}
+    return SearchLimits.from_policy(cfg, (doc or {}).get("constraints"), **kw)
+
+
+def generate_plans(event: Dict[str, Any], origin_event_file: Optional[str] = None,
+                   snapshot: Optional[Dict[str, Any]] = None, limits: Optional[Any] = None) -> Dict[str, Any]:
+    """
+    Build the candidate plan bundle for an event. With a snapshot that knows
+    the event's warehouse, plans come from the branch-and-bound search
+    (hub.plan_search) under `limits` (default: search_limits()); otherwise,
+    or when nothing feasible is found, the two fixed plans are used.
+    """
+    now = datetime.now().isoformat()
+    if snapshot is not None and event.get("warehouse_id") in (snapshot.get("warehouses") or {}):
+        from hub.plan_search import search_plans
+        found, stats = search_plans(event, snapshot, limits or search_limits())
+        if found:
+            for p in found:
+                p["ts"] = now
+            return {
+                "event": event,
+                "plans": found,
+                "origin_event_file": origin_event_file or f"{content_id(event)}.json",
+                "generated_at": now,
+                "search": asdict(stats),
+            }
+    inputs = {"route_id": event["route_id"], "warehouse_id": event["warehouse_id"]}
+    plans = [
+        {
+            "id": "PlanA",
+            "strategy": "reroute_via_R7",
+            "assumptions": {"carrier_capacity_buffer_pct": 10},
+            "cost_usd": 4800,
+            "sla_expected_percent": 97.5,
+            "region_data_boundary": "EU",
+            "pii_access": False,
+            "kpi_expectations": {"stockout_risk_reduction_pct": 22, "delay_reduction_pct": 18},
+            "inputs": dict(inputs),
+            "ts": now,
+        },
+        {
+            "id": "PlanB",
+            "strategy": "reallocate_inventory_and_surge_carrier",
+            "assumptions": {"temp_staff_hours": 12},
+            "cost_usd": 6400,
+            "sla_expected_percent": 98.2,
+            "region_data_boundary": "EU",
+            "pii_access": False,
+            "kpi_expectations": {"stockout_risk_reduction_pct": 42, "delay_reduction_pct": 31},
+            "inputs": dict(inputs),
+            "ts": now,
+        },
+    ]
+    return {
+        "event": event,
+        "plans": plans,
+        "origin_event_file": origin_event_file or f"{content_id(event)}.json",
+        "generated_at": now,
+    }
+
+
+def verify_plans_z3(bundle: Dict[str, Any], policy_path: str = POLICY_PATH) -> List[Dict[str, Any]]:
+    """
+    Z3 check per plan against the policy constraints, on the process-wide
+    incremental verifier. Returns [] when z3 is not installed so callers can fall back.
+    """
+    try:
+        import z3  # type: ignore  # noqa: F401
+    except Exception:
+        return []
+    from hub.z3_verifier import get_verifier
+    return get_verifier(policy_path).verify_bundle(bundle)
+
+
+def soft_verify_plans(bundle: Dict[str, Any], cfg: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Fallback: apply the same logical checks as the Z3 path without a solver:
+    budget, SLA, region boundary, PII=false (one vectorized pass over the bundle).
+    """
+    from hub.policy_batch import PlanSet, evaluate_config
+    plans = bundle.get("plans", [])
+    verdict = evaluate_config(cfg, PlanSet.from_bundle(plans))
+    rows: List[Dict[str, Any]] = []
+    for i, p in enumerate(plans):
+        ok = bool(verdict.sat[i])
+        rows.append({
+            "plan_id": p.get("id"),
+            "strategy": p.get("strategy"),
+            "sat": ok,
+            "counterexample": None if ok else ", ".join(verdict.reasons(i)),
+            "via": "policy-fallback",
+        })
+    return rows
+
+
+def verify_plans(bundle: Dict[str, Any], cfg: Dict[str, Any],
+                 policy_path: str = POLICY_PATH) -> Tuple[List[Dict[str, Any]], bool]:
+    """Z3 first; fall back to policy checks if it yields no SAT plan. Returns (rows, used_fallback)."""
+    rows = verify_plans_z3(bundle, policy_path)
+    if rows and any(r.get("sat") for r in rows):
+        return rows, False
+    return soft_verify_plans(bundle, cfg), True
+
+
+def selection_weights(cfg: Dict[str, Any]) -> Optional[Dict[str, float]]:
+    """Ranking weights from the run config's `selection.weights` block (None = cheapest, then highest SLA)."""
+    return (cfg.get("selection") or {}).get("weights") or None
+
+
+def select_plans(bundle: Dict[str, Any], verdict_rows: List[Dict[str, Any]], k: int = 1,
+                 weights: Optional[Dict[str, float]] = None):
+    """PlanSelector (hub.plan_select) over the SAT plans: top-k under weights plus the Pareto frontier."""
+    from hub.plan_select import select_plans as _select
+    sat_ids = {r["plan_id"] for r in verdict_rows if r.get("sat")}
+    return _select(bundle.get("plans", []), sat_ids, k=k, weights=weights)
+
+
+def choose_best_plan(bundle: Dict[str, Any], verdict_rows: List[Dict[str, Any]],
+                     weights: Optional[Dict[str, float]] = None) -> Optional[Dict[str, Any]]:
+    """Best SAT plan: cheapest, then highest SLA; with weights, highest weighted score first."""
+    return select_plans(bundle, verdict_rows, weights=weights).best()
+
+
+def simulate_bundle(bundle: Dict[str, Any], origin_bundle: Optional[str] = None,
+                    snapshot: Optional[Any] = None, trials: int = 0, seed: int = 0) -> Dict[str, Any]:
+    """
+    Per-plan before/after deltas in the existing *_sim.json shape. With a twin
+    snapshot the deltas come from the vectorized simulator (hub.twin_sim);
+    without one, or when the event touches nothing in it, plans report their
+    kpi_expectations. trials > 0 adds a seeded Monte Carlo block
+    (mean/p5/p95 per metric) to each simulated plan.
+    """
+    event = bundle.get("event", {})
+    simulated = None
+    if snapshot is not None:
+        from hub.twin_sim import SnapshotArrays, monte_carlo, simulate_plans
+        arrays = SnapshotArrays.from_snapshot(snapshot) if isinstance(snapshot, dict) else snapshot
+        simulated = simulate_plans(arrays, bundle)
+        if simulated and trials > 0:
+            for block, mc in zip(simulated, monte_carlo(arrays, bundle, trials=trials, seed=seed)):
+                block["monte_carlo"] = {k: v for k, v in mc.items() if k != "plan_id"}
+    results = []
+    for i, p in enumerate(bundle.get("plans", [])):
+        kpi = p.get("kpi_expectations", {})
+        results.append({
+            "plan_id": p.get("id"),
+            "strategy": p.get("strategy"),
+            "inputs": p.get("inputs", {}),
+            "simulated": simulated[i] if simulated else {
+                "stockout_risk_reduction_pct": kpi.get("stockout_risk_reduction_pct"),
+                "delay_reduction_pct": kpi.get("delay_reduction_pct"),
+                "cost_usd": p.get("cost_usd"),
+                "sla_expected_percent": p.get("sla_expected_percent"),
+            },
+            "ts": utc_now_z(),
+        })
+    return {
+        "origin_bundle": origin_bundle or f"{content_id(bundle)}.json",
+        "event_type": event.get("type"),
+        "route_id": event.get("route_id"),
+        "warehouse_id": event.get("warehouse_id"),
+        "results": results,
+        "generated_at": utc_now_z(),
+    }
+
+
+def build_proof_entry(bundle_file: str, bundle_sha256: str, sim_file: str, sim_sha256: str,
+                      sim: Dict[str, Any], verdict_rows: List[Dict[str, Any]],
+                      policy_hash: str, prev_head: Optional[str]) -> Dict[str, Any]:
+    """Hash-chained decision proof: entry_digest over the body, chain_head = H(prev_head || digest)."""
+    body = {
+        "type": "decision_proof",
+        "bundle_file": bundle_file,
+        "bundle_sha256": bundle_sha256,
+        "sim_file": sim_file,
+        "sim_sha256": sim_sha256,
+        "policy_hash": policy_hash,
+        "attestation_digest": "attest:placeholder",
+        "solver": {
+            "checked_plans": [r.get("plan_id") for r in verdict_rows],
+            "constraints": ["cost=min", "region==boundary", "pii==false"],
+            "result": "SAT" if any(r.get("sat") for r in verdict_rows) else "UNSAT",
+        },
+        "twin_deltas": sim.get("results", []),
+        "ts": datetime.now(timezone.utc).isoformat(),
+        "prev_head": prev_head,
+    }
+    digest = hashlib.sha256(json.dumps(body, sort_keys=True).encode()).hexdigest()
+    head = hashlib.sha256(((prev_head or "") + digest).encode()).hexdigest()
+    body["entry_digest"] = digest
+    body["chain_head"] = head
+    return body
+
+
+# -----------------------
+# Artifact I/O (only on request)
+# -----------------------
+def write_bytes_atomic(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(data)
+    tmp.replace(path)
+
+
+def read_chain_head(root: Path) -> Optional[str]:
+    p = root / CHAIN_META
+    if not p.exists():
+        return None
+    try:
+        return json.loads(p.read_text(encoding="utf-8")).get("head_digest")
+    except Exception:
+        return None
+
+
+def append_proof(root: Path, entry: Dict[str, Any]) -> None:
+    log = root / PROOF_LOG
+    log.parent.mkdir(parents=True, exist_ok=True)
+    with log.open("a", encoding="utf-8") as f:
+        f.write(json.dumps(entry) + "\n")
+    write_bytes_atomic(root / CHAIN_META, json_bytes({
+        "head_digest": entry["chain_head"],
+        "updated_at": datetime.now(timezone.utc).isoformat(),
+    }))
+
+
+KIND_DIRS = {"event": EVENTS_DIR, "bundle": PLANS_DIR, "sim": SIM_DIR}
+
+
+def write_artifact(root: Path, kind: str, name: str, data: bytes, parent: Optional[str] = None,
+                   index: Optional[Any] = None) -> str:
+    """Write an event/bundle/sim file and record it in the manifest (default: root's shared index); returns its content SHA-256."""
+    from hub.artifact_index import get_index
+    path = root / KIND_DIRS[kind] / name
+    write_bytes_atomic(path, data)
+    sha = hashlib.sha256(data).hexdigest()
+    (index or get_index(str(root))).record(kind, path, sha, parent)
+    return sha
+
+
+def latest_artifact(kind: str, root: str = ".") -> Optional[Path]:
+    """Newest event/bundle/sim via the manifest (O(1) indexed lookup)."""
+    from hub.artifact_index import get_index
+    return get_index(root).latest_path(kind)
+
+
+# -----------------------
+# Engine
+# -----------------------
+@dataclass
+class PipelineResult:
+    event: Dict[str, Any]
+    bundle: Dict[str, Any]
+    verdicts: List[Dict[str, Any]]
+    used_fallback: bool
+    best: Optional[Dict[str, Any]]
+    sim: Dict[str, Any]
+    proof: Optional[Dict[str, Any]] = None
+    paths: Dict[str, str] = field(default_factory=dict)
+    timings_ms: Dict[str, float] = field(default_factory=dict)
+
+
+def persist_run(workspace: Path, event: Dict[str, Any], bundle: Dict[str, Any], sim: Dict[str, Any],
+                verdicts: List[Dict[str, Any]], snapshot: Optional[Dict[str, Any]] = None,
+                proof_policy_hash: Optional[str] = None,
+                shared_index: bool = True) -> Tuple[Dict[str, str], Optional[Dict[str, Any]]]:
+    """
+    Write event/bundle/sim (linked in the manifest) under `workspace`, and append a
+    chained proof entry there when `proof_policy_hash` is given. Returns (paths, proof).
+    shared_index=False records into a manifest opened and closed for this call, so
+    per-run workspaces do not pin a process-wide index (and its connections) each.
+    """
+    paths: Dict[str, str] = {}
+    bundle_bytes, sim_bytes = json_bytes(bundle), json_bytes(sim)
+    bundle_file = f"{content_id(bundle)}.json"
+    sim_file = bundle_file.replace(".json", "_sim.json")
+    if snapshot is not None:
+        write_bytes_atomic(workspace / "twin_snapshot.json", json_bytes(snapshot))
+    parent = None
+    index = None
+    if not shared_index:
+        from hub.artifact_index import ArtifactIndex
+        index = ArtifactIndex(str(workspace))
+    try:
+        for kind, name, data in (("event", bundle.get("origin_event_file") or f"{content_id(event)}.json", json_bytes(event)),
+                                 ("bundle", bundle_file, bundle_bytes),
+                                 ("sim", sim_file, sim_bytes)):
+            parent = write_artifact(workspace, kind, name, data, parent, index)
+            paths[KIND_DIRS[kind]] = str(workspace / KIND_DIRS[kind] / name)
+    finally:
+        if index is not None:
+            index.close()
+
+    proof = None
+    if proof_policy_hash is not None:
+        proof = build_proof_entry(
+            bundle_file, hashlib.sha256(bundle_bytes).hexdigest(),
+            sim_file, hashlib.sha256(sim_bytes).hexdigest(),
+            sim, verdicts, proof_policy_hash, read_chain_head(workspace),
+        )
+        append_proof(workspace, proof)
+        paths["proof"] = str(workspace / PROOF_LOG)
+    return paths, proof
+
+
+def run_pipeline(disruption_type: str = "route_outage", route_id: str = "R7", warehouse_id: str = "W3",
+                 source: str = "day13-seed", snapshot: Optional[Dict[str, Any]] = None,
+                 config_path: str = CONFIG_PATH, policy_path: str = POLICY_PATH,
+                 write_artifacts: bool = False, write_proof: bool = False,
+                 root: str = ".", workspace: Optional[str] = None) -> PipelineResult:
+    """
+    Run seed -> plan -> verify -> simulate (-> proof) in-process.
+    Config and policy are read from `root`; artifacts are written under
+    `workspace` (default: `root`) only when write_artifacts/write_proof is set.
+    """
+    base = Path(root)
+    timings: Dict[str, float] = {}
+    paths: Dict[str, str] = {}
+
+    def lap(name: str, t0: float) -> float:
+        t1 = time.perf_counter()
+        timings[name] = round((t1 - t0) * 1000.0, 3)
+        return t1
+
+    t = time.perf_counter()
+    cfg = load_config(str(base / config_path))
+    event = seed_event(disruption_type, route_id, warehouse_id, source=source)
+    t = lap("seed", t)
+
+    bundle = generate_plans(event, snapshot=snapshot,
+                            limits=search_limits(str(base / config_path), str(base / policy_path))
+                            if snapshot is not None else None)
+    bundle_file = f"{content_id(bundle)}.json"
+    t = lap("plan", t)
+
+    verdicts, used_fallback = verify_plans(bundle, cfg, str(base / policy_path))
+    best = choose_best_plan(bundle, verdicts, weights=selection_weights(cfg))
+    t = lap("verify", t)
+
+    sim = simulate_bundle(bundle, origin_bundle=bundle_file, snapshot=snapshot)
+    t = lap("simulate", t)
+
+    proof = None
+    if write_artifacts or write_proof:
+        ph = None
+        if write_proof:
+            from hub.policy_hash import policy_hash
+            ph = policy_hash(str(base / policy_path))
+        paths, proof = persist_run(Path(workspace) if workspace else base, event, bundle, sim,
+                                   verdicts, snapshot, ph, shared_index=workspace is None)
+        lap("write", t)
+
+    return PipelineResult(event, bundle, verdicts, used_fallback, best, sim, proof, paths, timings)
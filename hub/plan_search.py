@@ -0,0 +1,329 @@
+# hub/plan_search.py
+"""
+Combinatorial plan candidates for a disruption, branch-and-bound style.
+
+A candidate combines three levers:
+  - reroute: a path around the disrupted route over the snapshot route graph
+    (routes with from/to endpoints), enumerated in latency order. If the
+    disrupted route has no endpoints, every other endpoint-less route is a
+    one-hop alternative lane;
+  - reallocation: units moved to the disrupted warehouse from donors with
+    surplus inventory (inventory - demand);
+  - carrier surge: extra carrier capacity (SURGE_OPTIONS).
+
+Each candidate is priced and scored:
+  value = stockout_risk_reduction_pct + delay_reduction_pct - cost_usd / USD_PER_POINT.
+Branches are cut as soon as they break budget_cap_usd or max_delay_minutes
+(even with the largest surge still to come), touch a warehouse outside the
+allowed regions, or cannot beat the current k-th best value. The search stops
+at deadline_ms and returns the best plans found so far.
+
+Plans come out in the bundle plan shape; "mitigation" carries the
+supply/delay recovery fractions that hub.twin_sim uses.
+"""
+import heapq
+import itertools
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from hub.twin_sim import LATENCY_FACTOR, SUPPLY_LOSS
+
+REROUTE_USD_PER_HOP = 1200.0
+REROUTE_USD_PER_MINUTE = 30.0
+REROUTE_SUPPLY = 0.6            # share of the shortfall a working reroute restores
+REALLOC_USD_PER_UNIT = 12.0
+REALLOC_FRACTIONS = (0.5, 1.0)  # of min(donor surplus, remaining shortfall)
+SURGE_OPTIONS = ((0, 0.0), (10, 900.0), (25, 2400.0))  # (capacity pct, cost USD)
+USD_PER_POINT = 150.0
+DEFAULT_LATENCY = 60.0
+
+
+@dataclass
+class SearchLimits:
+    budget_cap_usd: float = float("inf")
+    max_delay_minutes: float = float("inf")
+    min_sla_percent: float = 0.0
+    allowed_regions: Optional[Set[str]] = None  # None = no region rule
+    top_k: int = 5
+    max_hops: int = 4
+    max_paths: int = 32
+    max_donors: int = 4
+    deadline_ms: float = 200.0
+
+    @classmethod
+    def from_policy(cls, cfg: Optional[Dict[str, Any]] = None, constraints: Optional[Dict[str, Any]] = None,
+                    **kw: Any) -> "SearchLimits":
+        """Limits from the run config (budget_cap_usd, sla_min_percent, region_data_boundary) and/or policy constraints."""
+        cfg, constraints = cfg or {}, constraints or {}
+        risk = constraints.get("risk_thresholds") or {}
+        caps = [float(x) for x in (cfg.get("budget_cap_usd"), constraints.get("budget_cap_usd")) if x is not None]
+        slas = [float(x) for x in (cfg.get("sla_min_percent"), constraints.get("min_sla_percent")) if x is not None]
+        regions: Optional[Set[str]] = None
+        if cfg.get("region_data_boundary"):
+            regions = {str(cfg["region_data_boundary"])}
+        elif constraints.get("allowed_jurisdictions"):
+            regions = {str(r) for r in constraints["allowed_jurisdictions"]}
+        if (constraints.get("data_egress_rules") or {}).get("non_eu_egress_allowed") is False:
+            regions = {"EU"} if regions is None else regions & {"EU"}
+        return cls(budget_cap_usd=min(caps) if caps else float("inf"),
+                   max_delay_minutes=float(risk.get("max_delay_minutes", float("inf"))),
+                   min_sla_percent=max(slas) if slas else 0.0,
+                   allowed_regions=regions, **kw)
+
+
+@dataclass
+class SearchStats:
+    paths: int = 0
+    explored: int = 0
+    pruned_budget: int = 0
+    pruned_delay: int = 0
+    pruned_region: int = 0
+    pruned_sla: int = 0
+    pruned_bound: int = 0
+    truncated: bool = False
+    elapsed_ms: float = 0.0
+
+
+@dataclass
+class _Reroute:
+    routes: Tuple[str, ...] = ()
+    latency: float = 0.0
+    cost: float = 0.0
+
+
+class PlanNetwork:
+    """Route adjacency and donor columns for a snapshot; build once and reuse across searches."""
+
+    def __init__(self, snapshot: Dict[str, Any]):
+        self.routes: Dict[str, Dict[str, Any]] = snapshot.get("routes") or {}
+        self.warehouses: Dict[str, Dict[str, Any]] = snapshot.get("warehouses") or {}
+        self.out: Dict[str, List[Tuple[str, str, float]]] = {}  # wh -> [(route, to, latency)]
+        for rid, r in self.routes.items():
+            a, b = r.get("from"), r.get("to")
+            if a and b:
+                self.out.setdefault(a, []).append((rid, b, float(r.get("latency_minutes", DEFAULT_LATENCY))))
+        self.wids = list(self.warehouses)
+        self.w_index = {w: i for i, w in enumerate(self.wids)}
+        n = len(self.wids)
+        self.surplus = np.fromiter((float(v.get("inventory", 0) or 0) - float(v.get("demand", 0) or 0)
+                                    for v in self.warehouses.values()), float, n)
+        self.region = np.array([str(v.get("region", "")) for v in self.warehouses.values()], dtype=object)
+        self._allowed_masks: Dict[Any, np.ndarray] = {}
+
+    def region_ok(self, wid: Optional[str], allowed: Optional[Set[str]]) -> bool:
+        if allowed is None or wid is None:
+            return True
+        region = (self.warehouses.get(wid) or {}).get("region")
+        return region is None or region in allowed
+
+    def allowed_mask(self, allowed: Optional[Set[str]]) -> np.ndarray:
+        key = None if allowed is None else frozenset(allowed)
+        mask = self._allowed_masks.get(key)
+        if mask is None:
+            mask = np.ones(len(self.wids), bool) if allowed is None else \
+                np.isin(self.region, list(allowed) + [""])
+            self._allowed_masks[key] = mask
+        return mask
+
+
+def _reroutes(net: PlanNetwork, route_id: str, lim: SearchLimits, delay_cap: float, baseline: float,
+              stats: SearchStats, deadline: float) -> Iterator[_Reroute]:
+    """Alternatives to route_id, cheapest latency first."""
+    r = net.routes.get(route_id) or {}
+    src, dst = r.get("from"), r.get("to")
+    if not (src and dst):
+        lanes = sorted((float(v.get("latency_minutes", DEFAULT_LATENCY)), rid) for rid, v in net.routes.items()
+                       if rid != route_id and not (v.get("from") and v.get("to")))
+        for lat, rid in lanes[:lim.max_paths]:
+            cost = REROUTE_USD_PER_HOP + REROUTE_USD_PER_MINUTE * lat
+            if cost > lim.budget_cap_usd:
+                stats.pruned_budget += 1
+            elif lat - baseline > delay_cap:
+                stats.pruned_delay += 1
+            else:
+                stats.paths += 1
+                yield _Reroute((rid,), lat, cost)
+        return
+    # Best-first over partial paths; cost grows with latency and hops, so both prunes are monotone.
+    heap: List[Tuple[float, int, str, Tuple[str, ...], Tuple[str, ...]]] = [(0.0, 0, src, (), (src,))]
+    seq, found = 0, 0
+    while heap and found < lim.max_paths:
+        if time.perf_counter() > deadline:
+            stats.truncated = True
+            return
+        lat, _, node, path, seen = heapq.heappop(heap)
+        if node == dst and path:
+            found += 1
+            stats.paths += 1
+            yield _Reroute(path, lat, REROUTE_USD_PER_HOP * len(path) + REROUTE_USD_PER_MINUTE * lat)
+            continue
+        if len(path) >= lim.max_hops:
+            continue
+        for rid, nxt, l in net.out.get(node, ()):
+            if rid == route_id or nxt in seen:
+                continue
+            stats.explored += 1
+            lat2 = lat + l
+            if REROUTE_USD_PER_HOP * (len(path) + 1) + REROUTE_USD_PER_MINUTE * lat2 > lim.budget_cap_usd:
+                stats.pruned_budget += 1
+                continue
+            if lat2 - baseline > delay_cap:
+                stats.pruned_delay += 1
+                continue
+            if not net.region_ok(nxt, lim.allowed_regions):
+                stats.pruned_region += 1
+                continue
+            seq += 1
+            heapq.heappush(heap, (lat2, seq, nxt, path + (rid,), seen + (nxt,)))
+
+
+def _donors(net: PlanNetwork, warehouse_id: str, lim: SearchLimits) -> List[Tuple[str, float]]:
+    """Largest-surplus donors in allowed regions (vectorized over the network)."""
+    surplus = np.where(net.allowed_mask(lim.allowed_regions), net.surplus, -np.inf)
+    i = net.w_index.get(warehouse_id)
+    if i is not None:
+        surplus[i] = -np.inf
+    k = min(lim.max_donors, len(surplus))
+    if k <= 0:
+        return []
+    top = np.argpartition(-surplus, k - 1)[:k]
+    top = top[np.argsort(-surplus[top], kind="stable")]
+    return [(net.wids[j], float(surplus[j])) for j in top if surplus[j] > 0]
+
+
+def search_plans(event: Dict[str, Any], snapshot: Any,
+                 limits: Optional[SearchLimits] = None) -> Tuple[List[Dict[str, Any]], SearchStats]:
+    """Top-k feasible plans (best value first) and search stats. `snapshot` is a dict or a PlanNetwork."""
+    lim = limits or SearchLimits()
+    stats = SearchStats()
+    t0 = time.perf_counter()
+    deadline = t0 + lim.deadline_ms / 1000.0
+    net = snapshot if isinstance(snapshot, PlanNetwork) else PlanNetwork(snapshot)
+    route_id, warehouse_id = event.get("route_id"), event.get("warehouse_id")
+    sev = str(event.get("severity") or "high").lower()
+    wh = net.warehouses.get(warehouse_id) or {}
+    baseline = float((net.routes.get(route_id) or {}).get("latency_minutes", DEFAULT_LATENCY))
+    disrupted_delay = baseline * LATENCY_FACTOR.get(sev, LATENCY_FACTOR["high"])
+    shortfall = max(1.0, float(wh.get("demand", 100) or 0) * SUPPLY_LOSS.get(sev, SUPPLY_LOSS["high"]))
+    max_surge = max(p for p, _ in SURGE_OPTIONS) / 100.0
+    # Delay a branch may still carry before the largest surge: prune anything above it.
+    delay_cap = lim.max_delay_minutes / max(1e-9, 1.0 - max_surge)
+    min_surge_cost = min(c for _, c in SURGE_OPTIONS)
+
+    best: List[Tuple[float, int, Dict[str, Any]]] = []  # min-heap of (value, seq, plan)
+    seq = 0
+
+    def kth() -> float:
+        return best[0][0] if len(best) >= lim.top_k else -float("inf")
+
+    def bound(supply: float, delay_rec: float, cost: float, realloc_left: bool) -> float:
+        s = 1.0 if realloc_left else min(1.0, supply + max_surge * 0.5)
+        # A surge p leaves delay0 * (1 - p), i.e. recovers p * (1 - delay_rec): more than p
+        # when a slow reroute makes delay_rec negative.
+        d = min(1.0, 1.0 - (1.0 - max_surge) * (1.0 - delay_rec))
+        return 100.0 * s + 100.0 * d - (cost + min_surge_cost) / USD_PER_POINT
+
+    if not net.region_ok(warehouse_id, lim.allowed_regions):
+        stats.pruned_region += 1
+        stats.elapsed_ms = (time.perf_counter() - t0) * 1000.0
+        return [], stats
+
+    donors = _donors(net, warehouse_id, lim)
+    # "No reroute" first, then alternatives in latency order.
+    for rr in itertools.chain([_Reroute()], _reroutes(net, route_id, lim, delay_cap, baseline, stats, deadline)):
+        if rr.routes and time.perf_counter() > deadline:
+            stats.truncated = True
+            break
+        delay0 = max(0.0, rr.latency - baseline) if rr.routes else disrupted_delay
+        if delay0 > delay_cap:
+            stats.pruned_delay += 1
+            continue
+        supply0 = REROUTE_SUPPLY if rr.routes else 0.0
+        delay_rec0 = 1.0 - delay0 / disrupted_delay if disrupted_delay > 0 else 1.0
+        if bound(supply0, delay_rec0, rr.cost, True) <= kth():
+            stats.pruned_bound += 1
+            continue
+        moves = [((), 0.0, 0.0)]
+        need = shortfall * (1.0 - supply0)
+        for wid, surplus in donors:
+            for frac in REALLOC_FRACTIONS:
+                units = round(min(surplus, need) * frac)
+                if units > 0:
+                    moves.append(((wid, units), units / shortfall, units * REALLOC_USD_PER_UNIT))
+        for move, s_add, m_cost in moves:
+            cost1 = rr.cost + m_cost
+            if cost1 > lim.budget_cap_usd:
+                stats.pruned_budget += 1
+                continue
+            supply1 = min(1.0, supply0 + s_add)
+            if bound(supply1, delay_rec0, cost1, False) <= kth():
+                stats.pruned_bound += 1
+                continue
+            for pct, s_cost in SURGE_OPTIONS:
+                stats.explored += 1
+                cost = cost1 + s_cost
+                if cost > lim.budget_cap_usd:
+                    stats.pruned_budget += 1
+                    continue
+                delay = delay0 * (1.0 - pct / 100.0)
+                if delay > lim.max_delay_minutes:
+                    stats.pruned_delay += 1
+                    continue
+                supply = min(1.0, supply1 + pct / 100.0 * 0.5)
+                delay_rec = 1.0 - delay / disrupted_delay if disrupted_delay > 0 else 1.0
+                if supply <= 0 and delay_rec <= 0:
+                    continue  # mitigates nothing
+                if _sla(supply, delay_rec) < lim.min_sla_percent:
+                    stats.pruned_sla += 1
+                    continue
+                value = 100.0 * supply + 100.0 * delay_rec - cost / USD_PER_POINT
+                if value <= kth():
+                    stats.pruned_bound += 1
+                    continue
+                seq += 1
+                plan = _plan(event, rr, move, pct, cost, delay, supply, delay_rec, lim, net, warehouse_id)
+                heapq.heappush(best, (value, seq, plan))
+                if len(best) > lim.top_k:
+                    heapq.heappop(best)
+
+    ranked = [p for _, _, p in sorted(best, key=lambda x: (-x[0], x[1]))]
+    for i, p in enumerate(ranked, 1):
+        p["id"] = f"Plan{i:02d}"
+    stats.elapsed_ms = round((time.perf_counter() - t0) * 1000.0, 3)
+    return ranked, stats
+
+
+def _sla(supply: float, delay_rec: float) -> float:
+    return round(min(99.9, 95.0 + 2.5 * supply + 2.4 * max(0.0, delay_rec)), 1)
+
+
+def _plan(event: Dict[str, Any], rr: _Reroute, move: Sequence[Any], pct: int, cost: float, delay: float,
+          supply: float, delay_rec: float, lim: SearchLimits, net: PlanNetwork, warehouse_id: str) -> Dict[str, Any]:
+    parts = []
+    if rr.routes:
+        parts.append("reroute_via_" + ">".join(rr.routes))
+    if move:
+        parts.append(f"reallocate_{move[1]}_from_{move[0]}")
+    if pct:
+        parts.append(f"surge_carrier_{pct}pct")
+    region = (net.warehouses.get(warehouse_id) or {}).get("region")
+    if region is None:
+        region = next(iter(sorted(lim.allowed_regions))) if lim.allowed_regions else "EU"
+    return {
+        "id": None,
+        "strategy": "+".join(parts) or "hold",
+        "assumptions": {"carrier_capacity_buffer_pct": pct, "reroute": list(rr.routes),
+                        "reallocation": {"from": move[0], "units": move[1]} if move else None},
+        "cost_usd": round(cost, 2),
+        "sla_expected_percent": _sla(supply, delay_rec),
+        "expected_delay_minutes": round(delay, 1),
+        "region_data_boundary": region,
+        "pii_access": False,
+        "kpi_expectations": {"stockout_risk_reduction_pct": round(supply * 100.0, 1),
+                             "delay_reduction_pct": round(delay_rec * 100.0, 1)},
+        "mitigation": {"supply_recovery": round(supply, 4), "delay_recovery": round(delay_rec, 4)},
+        "inputs": {"route_id": event.get("route_id"), "warehouse_id": event.get("warehouse_id")},
+    }
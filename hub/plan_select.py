@@ -0,0 +1,201 @@
+# hub/plan_select.py
+"""
+Plan selection: Pareto frontier and top-k over verified candidates.
+
+Every plan is a point over four objectives:
+  cost_usd (lower is better), sla_expected_percent, stockout_risk_reduction_pct
+  and delay_reduction_pct (higher is better). The reductions come from the
+  simulated block when one is given, else from kpi_expectations.
+
+PlanSelector consumes plans one at a time (add) or in batches (extend) and
+keeps two things up to date without re-sorting what it has already seen:
+  - the top k under a weighting, in a size-k min-heap;
+  - the Pareto frontier: plans no other plan beats on every objective.
+    Batches are merged into it lazily, on the first read after them.
+
+Ranking key (higher wins): sum(weights[m] * value[m]), then lower cost, then
+higher SLA, then arrival order. With no weights that is exactly the old
+choose_best_plan rule, min by (cost_usd, -sla_expected_percent).
+"""
+import heapq
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+OBJECTIVES = ("cost_usd", "sla_expected_percent", "stockout_risk_reduction_pct", "delay_reduction_pct")
+_SIGN = np.array([-1.0, 1.0, 1.0, 1.0])  # frontier points are stored "higher is better"
+
+
+def plan_metrics(plan: Dict[str, Any], simulated: Optional[Dict[str, Any]] = None) -> Tuple[float, float, float, float]:
+    """(cost_usd, sla_expected_percent, stockout_risk_reduction_pct, delay_reduction_pct) of one plan."""
+    kpi = simulated or plan.get("kpi_expectations") or {}
+    return (float(plan.get("cost_usd", 1e12)), float(plan.get("sla_expected_percent", 0.0)),
+            float(kpi.get("stockout_risk_reduction_pct") or 0.0), float(kpi.get("delay_reduction_pct") or 0.0))
+
+
+def metrics_array(plans: Sequence[Dict[str, Any]],
+                  simulated: Optional[Sequence[Optional[Dict[str, Any]]]] = None) -> np.ndarray:
+    """float64[n, 4] of plan_metrics, columns in OBJECTIVES order (one pass per column)."""
+    n = len(plans)
+    kpis = [s or p.get("kpi_expectations") or {} for p, s in zip(plans, simulated or [None] * n)]
+    out = np.empty((n, 4))
+    out[:, 0] = np.fromiter((p.get("cost_usd", 1e12) for p in plans), dtype=np.float64, count=n)
+    out[:, 1] = np.fromiter((p.get("sla_expected_percent", 0.0) for p in plans), dtype=np.float64, count=n)
+    out[:, 2] = np.fromiter((k.get("stockout_risk_reduction_pct") or 0.0 for k in kpis), dtype=np.float64, count=n)
+    out[:, 3] = np.fromiter((k.get("delay_reduction_pct") or 0.0 for k in kpis), dtype=np.float64, count=n)
+    return out
+
+
+def pareto_mask(metrics: np.ndarray) -> np.ndarray:
+    """
+    Bool mask of the non-dominated rows of float[n, 4] metrics. Rows are
+    visited by descending sum of range-normalized objectives: a dominating row
+    always has the larger sum, so a row can only be dominated by one visited
+    before it, and the strongest rows (which dominate the most) go first. Each
+    survivor drops the rows it dominates, so the array shrinks quickly.
+    Identical rows are all kept.
+    """
+    n = metrics.shape[0]
+    keep = np.zeros(n, dtype=bool)
+    if n == 0:
+        return keep
+    pts = metrics * _SIGN
+    span = pts.max(axis=0) - pts.min(axis=0)
+    order = np.argsort(-(pts / np.where(span > 0, span, 1.0)).sum(axis=1), kind="stable")
+    pts, idx = pts[order], order
+    i = 0
+    while i < len(pts):
+        p = pts[i]
+        rest = pts[i + 1:]
+        dominated = (rest <= p).all(axis=1) & (rest < p).any(axis=1)
+        if dominated.any():
+            alive = np.concatenate([np.ones(i + 1, dtype=bool), ~dominated])
+            pts, idx = pts[alive], idx[alive]
+        i += 1
+    keep[idx] = True
+    return keep
+
+
+def _dominated(a: np.ndarray, b: np.ndarray, block: int = 1024) -> np.ndarray:
+    """Bool mask of rows of a (signed metrics) dominated by at least one row of b."""
+    out = np.zeros(len(a), dtype=bool)
+    if not len(b):
+        return out
+    for s in range(0, len(a), block):
+        x = a[s:s + block, None, :]
+        out[s:s + block] = ((b >= x).all(axis=2) & (b > x).any(axis=2)).any(axis=1)
+    return out
+
+
+class PlanSelector:
+    def __init__(self, k: int = 1, weights: Optional[Dict[str, float]] = None):
+        unknown = set(weights or {}) - set(OBJECTIVES)
+        if unknown:
+            raise ValueError(f"unknown objectives in weights: {sorted(unknown)}")
+        self.k = max(1, int(k))
+        self.weights = np.array([float((weights or {}).get(m, 0.0)) for m in OBJECTIVES])
+        self._w = self.weights.tolist()
+        self._heap: List[Tuple[Tuple[float, float, float, int], Dict[str, Any]]] = []  # worst of the top k at [0]
+        self._front = np.empty((0, 4))   # signed metrics, higher is better
+        self._front_plans: List[Dict[str, Any]] = []
+        self._pending: List[Tuple[np.ndarray, Sequence[Dict[str, Any]]]] = []  # batches not yet in the frontier
+        self.seen = 0
+
+    # ---- updates ----------------------------------------------------------
+
+    def add(self, plan: Dict[str, Any], simulated: Optional[Dict[str, Any]] = None) -> bool:
+        """Offer one verified plan; returns True if it joins the frontier."""
+        m = plan_metrics(plan, simulated)
+        seq = self.seen
+        self.seen += 1
+        w = self._w
+        self._offer_top((w[0] * m[0] + w[1] * m[1] + w[2] * m[2] + w[3] * m[3], -m[0], m[1], -seq), plan)
+        p = np.array(m) * _SIGN
+        self._fold()
+        f = self._front
+        if len(f):
+            ge = (f >= p).all(axis=1)
+            if ge.any() and ((f[ge] > p).any(axis=1)).any():
+                return False
+            beaten = (p >= f).all(axis=1) & (p > f).any(axis=1)
+            if beaten.any():
+                alive = ~beaten
+                f = f[alive]
+                self._front_plans = [q for q, a in zip(self._front_plans, alive.tolist()) if a]
+        self._front = np.concatenate([f, p[None, :]])
+        self._front_plans.append(plan)
+        return True
+
+    def extend(self, plans: Sequence[Dict[str, Any]],
+               simulated: Optional[Sequence[Optional[Dict[str, Any]]]] = None) -> int:
+        """Offer a batch of verified plans; returns the batch size."""
+        n = len(plans)
+        if not n:
+            return 0
+        m = metrics_array(plans, simulated)
+        base = self.seen
+        self.seen += n
+
+        # Top k: only rows scoring at least the batch's k-th best score can enter the heap.
+        score = m @ self.weights
+        if n > self.k:
+            cut = np.partition(score, n - self.k)[n - self.k]
+            cand = np.flatnonzero(score >= cut)
+        else:
+            cand = np.arange(n)
+        for i in cand.tolist():
+            self._offer_top((float(score[i]), -m[i, 0], m[i, 1], -(base + i)), plans[i])
+
+        # The frontier merge is deferred until someone reads it (or add() needs it),
+        # so best/top-k callers never pay for it.
+        self._pending.append((m * _SIGN, list(plans)))
+        return n
+
+    def _fold(self) -> None:
+        """Merge pending batches into the frontier: one pareto pass over them, then a merge.
+        Both sides are non-dominated, so new rows are checked against the old frontier
+        and old rows against the new survivors only."""
+        if not self._pending:
+            return
+        pts = np.concatenate([b for b, _ in self._pending])
+        pool = [p for _, ps in self._pending for p in ps]
+        self._pending = []
+        local = np.flatnonzero(pareto_mask(pts * _SIGN))
+        new = pts[local]
+        fresh = ~_dominated(new, self._front)
+        new, local = new[fresh], local[fresh]
+        stay = ~_dominated(self._front, new)
+        self._front = np.concatenate([self._front[stay], new])
+        self._front_plans = [p for p, k in zip(self._front_plans, stay.tolist()) if k] + [pool[i] for i in local.tolist()]
+
+    def _offer_top(self, key: Tuple[float, float, float, int], plan: Dict[str, Any]) -> None:
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, (key, plan))
+        elif key > self._heap[0][0]:
+            heapq.heapreplace(self._heap, (key, plan))
+
+    # ---- reads ------------------------------------------------------------
+
+    def top(self) -> List[Dict[str, Any]]:
+        """Up to k plans, best first."""
+        return [p for _, p in sorted(self._heap, key=lambda e: e[0], reverse=True)]
+
+    def best(self) -> Optional[Dict[str, Any]]:
+        return max(self._heap, key=lambda e: e[0])[1] if self._heap else None
+
+    def frontier(self) -> List[Dict[str, Any]]:
+        """Non-dominated plans, cheapest first."""
+        self._fold()
+        order = np.lexsort((-self._front[:, 1], -self._front[:, 0]))
+        return [self._front_plans[i] for i in order.tolist()]
+
+
+def select_plans(plans: Iterable[Dict[str, Any]], sat_ids: Optional[Iterable[Any]] = None, k: int = 1,
+                 weights: Optional[Dict[str, float]] = None,
+                 simulated: Optional[Dict[Any, Dict[str, Any]]] = None) -> PlanSelector:
+    """A PlanSelector over plans (only those whose id is in sat_ids, when given); simulated maps plan id -> block."""
+    ids = set(sat_ids) if sat_ids is not None else None
+    chosen = [p for p in plans if ids is None or p.get("id") in ids]
+    sel = PlanSelector(k=k, weights=weights)
+    sel.extend(chosen, [simulated.get(p.get("id")) for p in chosen] if simulated else None)
+    return sel
@@ -0,0 +1,184 @@
+# hub/policy_batch.py
+"""
+Vectorized policy evaluation over columnar plan sets.
+
+evaluate_batch() gives the same verdicts and first-violation reasons as
+hub.policy_revision.check_plan, for every plan in one NumPy pass, plus a
+per-plan bitmap of every violated constraint. repair_batch() is the matching
+batch form of hub.policy_revision.repair_plan.
+"""
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from hub.policy_revision import Plan, Policy
+
+# Violation bits, in check_plan's priority order (lowest set bit = first reason).
+BUDGET = 1
+DELAY = 2
+REGION = 4
+PII = 8
+SLA = 16  # informational unless enforce_sla=True; check_plan does not gate on SLA
+
+REASONS = {
+    BUDGET: "budget_exceeded",
+    DELAY: "delay_exceeds_limit",
+    REGION: "data_egress_non_eu",
+    PII: "pii_used_not_allowed",
+    SLA: "sla_below_min",
+}
+
+# Reason names used by the config-driven bundle checks (pipeline soft verify).
+CONFIG_REASONS = {
+    BUDGET: "budget_cap",
+    SLA: "sla_min",
+    REGION: "region_mismatch",
+    PII: "pii_access",
+}
+
+# Lookup: lowest-set-bit value -> bit (0 = none); used to pick the first reason.
+_LOWBIT = np.zeros(32, dtype=np.uint8)
+for _b in (BUDGET, DELAY, REGION, PII, SLA):
+    _LOWBIT[_b] = _b
+
+
+@dataclass
+class PlanSet:
+    cost: np.ndarray            # float64, added cost USD
+    delay: np.ndarray           # float64, expected delay minutes
+    sla: np.ndarray             # float64, expected SLA percent
+    region: np.ndarray          # int16 codes into `regions`
+    pii: np.ndarray             # bool
+    regions: Tuple[str, ...] = ("EU",)
+    ids: Optional[List[str]] = None
+
+    def __len__(self) -> int:
+        return int(self.cost.shape[0])
+
+    def region_code(self, name: Any) -> int:
+        """Code for a region name, or -1 if no plan uses it."""
+        try:
+            return self.regions.index(name)
+        except ValueError:
+            return -1
+
+    @classmethod
+    def from_columns(cls, cost, delay, region: Sequence[str], pii, sla=None,
+                     ids: Optional[List[str]] = None) -> "PlanSet":
+        regions, codes = np.unique(np.asarray(region, dtype=object).astype(str), return_inverse=True)
+        cost = np.asarray(cost, dtype=np.float64)
+        return cls(
+            cost=cost,
+            delay=np.asarray(delay, dtype=np.float64),
+            sla=np.asarray(sla, dtype=np.float64) if sla is not None else np.full(cost.shape, np.inf),
+            region=codes.astype(np.int16),
+            pii=np.asarray(pii, dtype=bool),
+            regions=tuple(str(r) for r in regions),
+            ids=ids,
+        )
+
+    @classmethod
+    def from_plans(cls, plans: Sequence[Plan]) -> "PlanSet":
+        return cls.from_columns(
+            [p.added_cost for p in plans],
+            [p.expected_delay_minutes for p in plans],
+            [p.data_region for p in plans],
+            [p.pii_used for p in plans],
+            ids=[p.route for p in plans],
+        )
+
+    @classmethod
+    def from_bundle(cls, plans: Sequence[Dict[str, Any]]) -> "PlanSet":
+        """Columns from bundle plan dicts (cost_usd, sla_expected_percent, region_data_boundary, pii_access)."""
+        n = len(plans)
+        return cls.from_columns(
+            np.fromiter((p.get("cost_usd", 1e12) for p in plans), dtype=np.float64, count=n),
+            np.fromiter((p.get("expected_delay_minutes", 0) for p in plans), dtype=np.float64, count=n),
+            [str(p.get("region_data_boundary")) for p in plans],
+            np.fromiter((bool(p.get("pii_access", False)) for p in plans), dtype=bool, count=n),
+            sla=np.fromiter((p.get("sla_expected_percent", 0.0) for p in plans), dtype=np.float64, count=n),
+            ids=[p.get("id") for p in plans],
+        )
+
+
+@dataclass
+class BatchVerdict:
+    sat: np.ndarray             # bool mask
+    violations: np.ndarray      # uint8 bitmap of violated constraints
+    first: np.ndarray           # uint8 bit of the first (reported) violation, 0 if sat
+    reason_names: Dict[int, str] = field(default_factory=lambda: dict(REASONS))
+
+    def __len__(self) -> int:
+        return int(self.sat.shape[0])
+
+    def reason(self, i: int) -> str:
+        """check_plan-compatible reason: "ok" or the first violated constraint."""
+        b = int(self.first[i])
+        return "ok" if b == 0 else self.reason_names[b]
+
+    def reasons(self, i: int) -> List[str]:
+        v = int(self.violations[i])
+        return [name for bit, name in self.reason_names.items() if v & bit]
+
+    def counts(self) -> Dict[str, int]:
+        out = {"sat": int(self.sat.sum()), "unsat": int((~self.sat).sum())}
+        for bit, name in self.reason_names.items():
+            out[name] = int(((self.violations & bit) != 0).sum())
+        return out
+
+
+def _verdict(bits: np.ndarray, gating: int, reason_names: Dict[int, str]) -> BatchVerdict:
+    gated = bits & np.uint8(gating)
+    lowbit = gated & (~gated + np.uint8(1))  # isolate lowest set bit
+    return BatchVerdict(sat=gated == 0, violations=bits, first=_LOWBIT[lowbit], reason_names=reason_names)
+
+
+def evaluate_batch(policy: Policy, plans: PlanSet, enforce_sla: bool = False) -> BatchVerdict:
+    """Vectorized check_plan over every plan in `plans`."""
+    bits = np.zeros(len(plans), dtype=np.uint8)
+    bits |= np.where(plans.cost > policy.budget_cap, BUDGET, 0).astype(np.uint8)
+    bits |= np.where(plans.delay > policy.max_delay_minutes, DELAY, 0).astype(np.uint8)
+    if not policy.allow_cross_region:
+        bits |= np.where(plans.region != plans.region_code("EU"), REGION, 0).astype(np.uint8)
+    bits |= np.where(plans.pii, PII, 0).astype(np.uint8)
+    bits |= np.where(plans.sla < policy.sla_min, SLA, 0).astype(np.uint8)
+    gating = BUDGET | DELAY | REGION | PII | (SLA if enforce_sla else 0)
+    return _verdict(bits, gating, dict(REASONS))
+
+
+def evaluate_config(cfg: Dict[str, Any], plans: PlanSet) -> BatchVerdict:
+    """Vectorized run-config checks (budget_cap_usd, sla_min_percent, region_data_boundary, PII=false)."""
+    bits = np.zeros(len(plans), dtype=np.uint8)
+    bits |= np.where(plans.cost > float(cfg.get("budget_cap_usd", 1e12)), BUDGET, 0).astype(np.uint8)
+    bits |= np.where(plans.sla < float(cfg.get("sla_min_percent", 0.0)), SLA, 0).astype(np.uint8)
+    boundary = plans.region_code(str(cfg.get("region_data_boundary")))
+    bits |= np.where(plans.region != boundary, REGION, 0).astype(np.uint8)
+    bits |= np.where(plans.pii, PII, 0).astype(np.uint8)
+    return _verdict(bits, BUDGET | SLA | REGION | PII, dict(CONFIG_REASONS))
+
+
+def repair_batch(policy: Policy, plans: PlanSet) -> Tuple[PlanSet, BatchVerdict]:
+    """
+    repair_plan for every plan at once: clamp cost and delay, move non-EU
+    regions to EU (unless cross-region is allowed), clear PII. Returns the
+    repaired set and the verdict before repair (its violation bits are the
+    fixes applied). SLA is an outcome, not a plan field, and is left as is.
+    """
+    before = evaluate_batch(policy, plans)
+    regions, region = plans.regions, plans.region
+    if not policy.allow_cross_region:
+        eu = plans.region_code("EU")
+        if eu < 0:
+            regions, eu = regions + ("EU",), len(regions)
+        region = np.where(before.violations & REGION, np.int16(eu), region).astype(np.int16)
+    fixed = PlanSet(
+        cost=np.minimum(plans.cost, policy.budget_cap),
+        delay=np.minimum(plans.delay, float(policy.max_delay_minutes)),
+        sla=plans.sla,
+        region=region,
+        pii=np.zeros_like(plans.pii),
+        regions=regions,
+        ids=plans.ids,
+    )
+    return fixed, before
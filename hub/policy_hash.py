@@ -27,8 +27,13 @@ def policy_hash(policy_path: str) -> str:
     """
     Return hex SHA256 over canonicalized policy bytes.
     """
-    b = stable_policy_bytes(policy_path)
-    return hashlib.sha256(b).hexdigest()
+    return policy_digest(stable_policy_bytes(policy_path))
+
+def policy_digest(canonical: bytes) -> str:
+    """
+    Hex SHA256 over bytes from stable_policy_bytes.
+    """
+    return hashlib.sha256(canonical).hexdigest()
 
 if __name__ == "__main__":
     import sys
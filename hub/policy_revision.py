@@ -1,6 +1,6 @@
 # hub/policy_revision.py
 from dataclasses import dataclass, asdict
-from typing import Tuple, Dict, Any
+from typing import Tuple, Dict, Any, List
 
 @dataclass
 class Policy:
@@ -46,3 +46,28 @@ def check_plan(policy: Policy, plan: Plan) -> Verdict:
 
     # SLA minimum included for completeness; real SLA calc would be richer.
     return Verdict(True, "ok", {"policy": asdict(policy), "plan": asdict(plan)})
+
+def repair_plan(policy: Policy, plan: Plan) -> Tuple[Plan, List[str]]:
+    """
+    Minimal-change feasible plan in one step. Every check_plan constraint bounds
+    a single field (cost <= cap, delay <= limit, region == EU, pii == False), so
+    the feasible set is a box and the nearest point, in L1, L2 or number of
+    changed fields, is the per-field projection. Returns (plan, fixed reasons).
+    """
+    fixes = []
+    cost, delay, region, pii = plan.added_cost, plan.expected_delay_minutes, plan.data_region, plan.pii_used
+    if cost > policy.budget_cap:
+        cost = policy.budget_cap
+        fixes.append("budget_exceeded")
+    if delay > policy.max_delay_minutes:
+        delay = policy.max_delay_minutes
+        fixes.append("delay_exceeds_limit")
+    if not policy.allow_cross_region and region != "EU":
+        region = "EU"
+        fixes.append("data_egress_non_eu")
+    if pii:
+        pii = False
+        fixes.append("pii_used_not_allowed")
+    if not fixes:
+        return plan, fixes
+    return Plan(plan.route, cost, delay, region, pii), fixes
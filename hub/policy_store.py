@@ -0,0 +1,78 @@
+# hub/policy_store.py
+"""
+Policy parsed and hashed once, revalidated on (inode, size, mtime) changes,
+plus build info (git SHA) resolved once per process.
+"""
+import json
+import os
+import subprocess
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from hub.policy_hash import policy_digest, stable_policy_bytes
+
+POLICY_PATH = "policies/base.yaml"
+
+
+class PolicyStore:
+    def __init__(self, policy_path: str = POLICY_PATH):
+        self.policy_path = policy_path
+        self._lock = threading.Lock()
+        self._sig: Optional[Tuple[int, int, int]] = None
+        self._doc: Any = None
+        self._hash: Optional[str] = None
+        self.reloads = 0
+
+    def _revalidate(self) -> None:
+        st = os.stat(self.policy_path)
+        sig = (st.st_ino, st.st_size, st.st_mtime_ns)
+        if sig == self._sig:
+            return
+        with self._lock:
+            if sig == self._sig:
+                return
+            canonical = stable_policy_bytes(self.policy_path)
+            self._doc, self._hash = json.loads(canonical), policy_digest(canonical)
+            self._sig = sig
+            self.reloads += 1
+
+    @property
+    def hash(self) -> str:
+        self._revalidate()
+        return self._hash  # type: ignore[return-value]
+
+    @property
+    def doc(self) -> Any:
+        self._revalidate()
+        return self._doc
+
+
+_stores: Dict[str, PolicyStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_store(policy_path: str = POLICY_PATH) -> PolicyStore:
+    with _stores_lock:
+        store = _stores.get(policy_path)
+        if store is None:
+            store = _stores[policy_path] = PolicyStore(policy_path)
+        return store
+
+
+_git_sha: Optional[str] = None
+
+
+def git_sha() -> str:
+    """Short commit SHA, resolved once per process (ACM_GIT_SHA overrides)."""
+    global _git_sha
+    if _git_sha is None:
+        sha = os.environ.get("ACM_GIT_SHA")
+        if not sha:
+            try:
+                sha = subprocess.check_output(
+                    ["git", "rev-parse", "--short", "HEAD"], text=True, stderr=subprocess.DEVNULL
+                ).strip()
+            except Exception:
+                sha = "unknown"
+        _git_sha = sha
+    return _git_sha
@@ -0,0 +1,204 @@
+# hub/scenario_gen.py
+"""
+Deterministic synthetic scenarios for load tests and benchmarks.
+
+A scenario is a topology (warehouses and routes, in the twin snapshot shape),
+a signal stream in the data/signals.csv columns, and disruption storms with
+the events they raise. Everything derives from one integer seed:
+
+  - the topology from SeedSequence([seed, 0]);
+  - storms from SeedSequence([seed, 1]);
+  - each hour of signals from SeedSequence([seed, 2, hour]), so any hour can
+    be regenerated alone and the chunk size never changes the output.
+
+Signals are produced one hour at a time (routes x ticks-per-hour arrays), so
+memory is bounded by the topology size, not by the number of days.
+"""
+import csv
+import json
+import os
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List, Optional
+
+import numpy as np
+
+SIGNAL_HEADER = ["timestamp", "warehouse", "route", "risk", "delay_minutes", "cost_delta"]
+REGIONS = ("EU", "US", "APAC")
+SEVERITIES = ("medium", "high", "critical")
+STORM_RISK = {"medium": 0.15, "high": 0.3, "critical": 0.45}     # added to risk at the storm peak
+STORM_DELAY = {"medium": 1.0, "high": 2.5, "critical": 4.0}      # delay multiplier - 1 at the peak
+
+
+@dataclass
+class Storm:
+    storm_id: str
+    start: str
+    end: str
+    severity: str
+    warehouse_id: str
+    route_ids: List[str]
+
+
+def _rng(seed: int, *key: int) -> np.random.Generator:
+    return np.random.default_rng(np.random.SeedSequence([seed, *key]))
+
+
+def _iso(t: datetime) -> str:
+    return t.isoformat()
+
+
+def check_interval(interval_minutes: int) -> int:
+    """Ticks per hour; the interval must divide 60 so ticks stay evenly spaced across hours."""
+    if not 1 <= interval_minutes <= 60 or 60 % interval_minutes:
+        raise ValueError(f"interval_minutes must divide 60 (1, 2, 3, 4, 5, 6, 10, 12, 15, 20, 30, 60), "
+                         f"got {interval_minutes}")
+    return 60 // interval_minutes
+
+
+def generate_topology(warehouses: int, routes: int, seed: int = 0, neighbourhood: int = 0) -> Dict[str, Any]:
+    """
+    Snapshot-shaped topology; every warehouse has at least one outbound route
+    when routes >= warehouses. neighbourhood > 0 links each warehouse only to
+    the next `neighbourhood` warehouses (ring order), giving the local
+    clustering of real networks; 0 links to any warehouse.
+    """
+    if warehouses < 2 or routes < 1:
+        raise ValueError("need at least 2 warehouses and 1 route (routes link distinct warehouses)")
+    rng = _rng(seed, 0)
+    w_width, r_width = len(str(warehouses)), len(str(routes))
+    wids = [f"W{i:0{w_width}d}" for i in range(1, warehouses + 1)]
+    demand = rng.integers(50, 400, warehouses)
+    inventory = np.rint(demand * rng.uniform(0.4, 2.0, warehouses)).astype(int)
+    region = rng.integers(0, len(REGIONS), warehouses)
+    src = np.concatenate([np.arange(min(routes, warehouses)),
+                          rng.integers(0, warehouses, max(0, routes - warehouses))])
+    span = min(neighbourhood, warehouses - 1) if neighbourhood > 0 else warehouses - 1
+    dst = (src + rng.integers(1, max(2, span + 1), routes)) % max(1, warehouses)
+    latency = rng.integers(10, 240, routes)
+    return {
+        "warehouses": {w: {"inventory": int(inventory[i]), "demand": int(demand[i]),
+                           "region": REGIONS[region[i]]} for i, w in enumerate(wids)},
+        "routes": {f"R{i + 1:0{r_width}d}": {"from": wids[src[i]], "to": wids[dst[i]],
+                                             "latency_minutes": int(latency[i])} for i in range(routes)},
+    }
+
+
+def generate_storms(topology: Dict[str, Any], start: datetime, days: float, storms: int,
+                    seed: int = 0, max_hours: float = 6.0) -> List[Storm]:
+    """Disruption storms: a warehouse and its outbound routes degrade for up to max_hours."""
+    rng = _rng(seed, 1)
+    wids = list(topology["warehouses"])
+    by_src: Dict[str, List[str]] = {}
+    for rid, r in topology["routes"].items():
+        by_src.setdefault(r["from"], []).append(rid)
+    span_s = days * 86400.0
+    out = []
+    for i in range(storms):
+        w = wids[int(rng.integers(len(wids)))]
+        t0 = start + timedelta(seconds=int(rng.uniform(0, span_s)))
+        t1 = min(t0 + timedelta(seconds=int(rng.uniform(0.5, max_hours) * 3600)), start + timedelta(seconds=span_s))
+        sev = SEVERITIES[int(rng.integers(len(SEVERITIES)))]
+        out.append(Storm(f"S{i + 1:04d}", _iso(t0), _iso(t1), sev, w, by_src.get(w, [])))
+    return sorted(out, key=lambda s: s.start)
+
+
+def storm_events(storms: List[Storm], source: str = "scenario") -> Iterator[Dict[str, Any]]:
+    """One seed_event-shaped event per (storm, route); storms on route-less warehouses yield none."""
+    for s in storms:
+        for rid in s.route_ids:
+            yield {"type": "route_outage", "route_id": rid, "warehouse_id": s.warehouse_id,
+                   "source": source, "severity": s.severity, "ts": s.start, "storm_id": s.storm_id}
+
+
+def random_events(topology: Dict[str, Any], count: int, seed: int = 0,
+                  types=("route_outage", "port_closure", "weather", "carrier_strike")) -> List[Dict[str, Any]]:
+    """count (type, route, origin warehouse, severity) picks; ts is left to the caller."""
+    rng = _rng(seed, 3)
+    rids = list(topology["routes"])
+    out = []
+    for _ in range(count):
+        rid = rids[int(rng.integers(len(rids)))]
+        out.append({"type": types[int(rng.integers(len(types)))], "route_id": rid,
+                    "warehouse_id": topology["routes"][rid]["from"],
+                    "severity": SEVERITIES[int(rng.integers(len(SEVERITIES)))]})
+    return out
+
+
+def iter_signals(topology: Dict[str, Any], start: datetime, days: float, interval_minutes: int = 5,
+                 seed: int = 0, storms: Optional[List[Storm]] = None) -> Iterator[List[list]]:
+    """
+    Yield one chunk of signal rows per hour, in timestamp order, for ticks in
+    [start, start + days). Each tick has one row per route, attributed to the
+    route's origin warehouse.
+    """
+    rids = list(topology["routes"])
+    routes = topology["routes"]
+    whs = topology["warehouses"]
+    wh = [routes[r]["from"] for r in rids]
+    lat = np.array([routes[r]["latency_minutes"] for r in rids], float)
+    cov = np.array([whs[w]["inventory"] / max(1, whs[w]["demand"]) for w in wh])
+    base_risk = np.clip(0.3 - 0.12 * cov, 0.02, 0.3)
+    r_index = {r: i for i, r in enumerate(rids)}
+    windows = [(datetime.fromisoformat(s.start), datetime.fromisoformat(s.end), s.severity,
+                np.array([r_index[r] for r in s.route_ids], int)) for s in storms or []]
+
+    ticks = check_interval(interval_minutes)
+    hours = int(np.ceil(days * 24))
+    end = start + timedelta(days=days)
+    for h in range(hours):
+        rng = _rng(seed, 2, h)
+        times = [start + timedelta(hours=h, minutes=k * interval_minutes) for k in range(ticks)]
+        n = sum(t < end for t in times)  # a fractional last hour stops at the exact end tick
+        if not n:
+            break
+        diurnal = 1.0 + 0.2 * np.sin(2 * np.pi * ((h % 24) + np.arange(ticks) * interval_minutes / 60) / 24)
+        risk = base_risk[None, :] * diurnal[:, None] + rng.normal(0, 0.03, (ticks, len(rids)))
+        delay = lat[None, :] * 0.1 * diurnal[:, None] * rng.lognormal(0, 0.3, (ticks, len(rids)))
+        for t0, t1, sev, idx in windows:
+            if not idx.size or t1 <= times[0] or t0 > times[-1]:
+                continue
+            for k, t in enumerate(times):
+                if t0 <= t < t1:
+                    # Triangular ramp: peaks mid-storm.
+                    x = 1.0 - abs(2 * (t - t0).total_seconds() / max(1.0, (t1 - t0).total_seconds()) - 1)
+                    risk[k, idx] += STORM_RISK[sev] * x
+                    delay[k, idx] *= 1.0 + STORM_DELAY[sev] * x
+        risk = np.clip(risk, 0.0, 1.0).round(2)
+        delay = np.rint(delay).astype(int)
+        cost = np.rint(40.0 * delay + 4000.0 * risk + rng.normal(0, 150, risk.shape)).astype(int)
+        stamps = [_iso(t) for t in times]
+        yield [[stamps[k], wh[i], rids[i], float(risk[k, i]), int(delay[k, i]), int(cost[k, i])]
+               for k in range(n) for i in range(len(rids))]
+
+
+def write_scenario(out_dir: str, warehouses: int, routes: int, days: float, storms: int, seed: int = 0,
+                   interval_minutes: int = 5, start: Optional[datetime] = None) -> Dict[str, Any]:
+    """Write topology.json, storms.json, events.jsonl and signals.csv under out_dir; returns a manifest."""
+    start = start or datetime(2025, 1, 1, tzinfo=timezone.utc)
+    check_interval(interval_minutes)
+    os.makedirs(out_dir, exist_ok=True)
+    topo = generate_topology(warehouses, routes, seed)
+    storm_list = generate_storms(topo, start, days, storms, seed)
+    with open(os.path.join(out_dir, "topology.json"), "w", encoding="utf-8") as f:
+        json.dump(topo, f, separators=(",", ":"))
+    with open(os.path.join(out_dir, "storms.json"), "w", encoding="utf-8") as f:
+        json.dump([asdict(s) for s in storm_list], f, indent=1)
+    n_events = 0
+    with open(os.path.join(out_dir, "events.jsonl"), "w", encoding="utf-8") as f:
+        for ev in storm_events(storm_list):
+            f.write(json.dumps(ev, separators=(",", ":")) + "\n")
+            n_events += 1
+    n_rows = 0
+    with open(os.path.join(out_dir, "signals.csv"), "w", newline="") as f:
+        w = csv.writer(f)
+        w.writerow(SIGNAL_HEADER)
+        for chunk in iter_signals(topo, start, days, interval_minutes, seed, storm_list):
+            w.writerows(chunk)
+            n_rows += len(chunk)
+    manifest = {"seed": seed, "start": _iso(start), "days": days, "interval_minutes": interval_minutes,
+                "warehouses": warehouses, "routes": routes, "storms": len(storm_list),
+                "events": n_events, "signals": n_rows}
+    with open(os.path.join(out_dir, "manifest.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
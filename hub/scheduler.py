@@ -0,0 +1,192 @@
+# hub/scheduler.py
+"""
+Concurrent multi-event decision scheduler.
+
+Many disruption events are accepted at once; each run gets its own workspace
+directory (no shared twin_snapshot.json or "latest" file), and the plan, verify
+and simulate stages fan out to bounded thread or process pools. The report carries
+per-event latency and overall throughput.
+"""
+import asyncio
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from hub import pipeline as engine
+
+RUNS_DIR = "data/runs"
+
+
+@dataclass
+class RunResult:
+    run_id: str
+    event: Dict[str, Any]
+    best_plan: Optional[str]
+    used_fallback: bool
+    verdicts: List[Dict[str, Any]]
+    sim: Dict[str, Any]
+    workspace: Optional[str]
+    latency_ms: float
+    stage_ms: Dict[str, float] = field(default_factory=dict)
+    error: Optional[str] = None
+
+
+@dataclass
+class BurstReport:
+    runs: List[RunResult]
+    wall_s: float
+    throughput_eps: float
+    latency_p50_ms: float
+    latency_p95_ms: float
+    latency_max_ms: float
+    failed: int
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "events": len(self.runs),
+            "failed": self.failed,
+            "wall_s": round(self.wall_s, 4),
+            "throughput_eps": round(self.throughput_eps, 2),
+            "latency_p50_ms": round(self.latency_p50_ms, 3),
+            "latency_p95_ms": round(self.latency_p95_ms, 3),
+            "latency_max_ms": round(self.latency_max_ms, 3),
+        }
+
+
+def _percentile(values: Sequence[float], q: float) -> float:
+    if not values:
+        return 0.0
+    s = sorted(values)
+    return s[min(len(s) - 1, int(round(q * (len(s) - 1))))]
+
+
+def _plan_stage(event: Dict[str, Any], snapshot: Optional[Dict[str, Any]], config_path: str,
+                policy_path: str) -> Dict[str, Any]:
+    limits = None if snapshot is None else engine.search_limits(config_path, policy_path)
+    return engine.generate_plans(event, snapshot=snapshot, limits=limits)
+
+
+def _verify_stage(bundle: Dict[str, Any], config_path: str, policy_path: str):
+    return engine.verify_plans(bundle, engine.load_config(config_path), policy_path)
+
+
+def _simulate_stage(bundle: Dict[str, Any], snapshot: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    return engine.simulate_bundle(bundle, snapshot=snapshot)
+
+
+class DecisionScheduler:
+    """
+    Bounded concurrent runner. Use as an async context manager, or call
+    run_burst() which manages the pools itself.
+
+    Each stage has its own pool, so plan search (CPU-bound up to its
+    deadline) never takes simulation slots: plan_workers bounds concurrent
+    searches, verify_workers concurrent verifications, simulate_workers
+    concurrent simulations. With executor="thread" every Z3 call goes through
+    the shared verifier's lock, so verify_workers > 1 only overlaps the
+    non-Z3 work (verdict-cache hits, policy fallback); use executor="process" to run
+    Z3 checks in parallel, one verifier per worker process.
+    """
+
+    def __init__(self, verify_workers: int = 4, simulate_workers: int = 4, max_in_flight: int = 64,
+                 executor: str = "thread", root: str = ".", runs_dir: str = RUNS_DIR,
+                 write_artifacts: bool = False, plan_workers: int = 2):
+        if executor not in ("thread", "process"):
+            raise ValueError("executor must be 'thread' or 'process'")
+        self.verify_workers = verify_workers
+        self.simulate_workers = simulate_workers
+        self.plan_workers = plan_workers
+        self.max_in_flight = max_in_flight
+        self.executor = executor
+        self.root = Path(root)
+        self.runs_dir = self.root / runs_dir
+        self.write_artifacts = write_artifacts
+        self._plan_pool: Optional[Executor] = None
+        self._verify_pool: Optional[Executor] = None
+        self._sim_pool: Optional[Executor] = None
+        self._sem: Optional[asyncio.Semaphore] = None
+        self._seq = 0
+
+    async def __aenter__(self) -> "DecisionScheduler":
+        pool = ProcessPoolExecutor if self.executor == "process" else ThreadPoolExecutor
+        self._plan_pool = pool(max_workers=self.plan_workers)
+        self._verify_pool = pool(max_workers=self.verify_workers)
+        self._sim_pool = pool(max_workers=self.simulate_workers)
+        self._sem = asyncio.Semaphore(self.max_in_flight)
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        for p in (self._plan_pool, self._verify_pool, self._sim_pool):
+            if p is not None:
+                p.shutdown(wait=True)
+        self._plan_pool = self._verify_pool = self._sim_pool = None
+
+    def _new_run_id(self, event: Dict[str, Any]) -> str:
+        self._seq += 1
+        return f"{engine.content_id(event)}-{os.getpid()}-{self._seq:06d}"
+
+    async def submit(self, event: Dict[str, Any], snapshot: Optional[Dict[str, Any]] = None) -> RunResult:
+        """Run one event end to end; plan/verify/simulate run on the bounded pools."""
+        assert self._sem is not None, "use `async with DecisionScheduler(...)`"
+        loop = asyncio.get_running_loop()
+        async with self._sem:
+            run_id = self._new_run_id(event)
+            t0 = time.perf_counter()
+            stage: Dict[str, float] = {}
+            try:
+                bundle = await loop.run_in_executor(
+                    self._plan_pool, _plan_stage, event, snapshot,
+                    str(self.root / engine.CONFIG_PATH), str(self.root / engine.POLICY_PATH))
+                t1 = time.perf_counter(); stage["plan"] = (t1 - t0) * 1000.0
+
+                verdicts, used_fallback = await loop.run_in_executor(
+                    self._verify_pool, _verify_stage, bundle,
+                    str(self.root / engine.CONFIG_PATH), str(self.root / engine.POLICY_PATH))
+                weights = engine.selection_weights(engine.load_config(str(self.root / engine.CONFIG_PATH)))
+                best = engine.choose_best_plan(bundle, verdicts, weights=weights)
+                t2 = time.perf_counter(); stage["verify"] = (t2 - t1) * 1000.0
+
+                sim = await loop.run_in_executor(self._sim_pool, _simulate_stage, bundle, snapshot)
+                t3 = time.perf_counter(); stage["simulate"] = (t3 - t2) * 1000.0
+
+                workspace = None
+                if self.write_artifacts:
+                    ws = self.runs_dir / run_id
+                    await asyncio.to_thread(engine.persist_run, ws, event, bundle, sim, verdicts, snapshot,
+                                            shared_index=False)
+                    workspace = str(ws)
+                    stage["write"] = (time.perf_counter() - t3) * 1000.0
+
+                return RunResult(run_id, event, best["id"] if best else None, used_fallback, verdicts, sim,
+                                 workspace, (time.perf_counter() - t0) * 1000.0, stage)
+            except Exception as e:
+                return RunResult(run_id, event, None, False, [], {}, None,
+                                 (time.perf_counter() - t0) * 1000.0, stage, error=f"{type(e).__name__}: {e}")
+
+    async def run_many(self, events: Sequence[Dict[str, Any]],
+                       snapshots: Optional[Sequence[Optional[Dict[str, Any]]]] = None) -> BurstReport:
+        snaps = list(snapshots) if snapshots is not None else [None] * len(events)
+        t0 = time.perf_counter()
+        runs = await asyncio.gather(*(self.submit(e, s) for e, s in zip(events, snaps)))
+        wall = time.perf_counter() - t0
+        lat = [r.latency_ms for r in runs]
+        return BurstReport(
+            runs=list(runs),
+            wall_s=wall,
+            throughput_eps=(len(runs) / wall) if wall > 0 else 0.0,
+            latency_p50_ms=_percentile(lat, 0.50),
+            latency_p95_ms=_percentile(lat, 0.95),
+            latency_max_ms=max(lat) if lat else 0.0,
+            failed=sum(1 for r in runs if r.error),
+        )
+
+
+def run_burst(events: Sequence[Dict[str, Any]], **kwargs: Any) -> BurstReport:
+    """Synchronous entry point: schedule `events` concurrently and return the report."""
+    async def _go() -> BurstReport:
+        async with DecisionScheduler(**kwargs) as sched:
+            return await sched.run_many(events)
+    return asyncio.run(_go())
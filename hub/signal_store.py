@@ -0,0 +1,352 @@
+# hub/signal_store.py
+"""
+Columnar signal store partitioned by UTC day and (warehouse, route).
+
+Layout under root (default data/signal_store/):
+
+  keys.json                     [[warehouse, route], ...]; list index = key id
+  2025-01-01/MANIFEST           {"sealed": "g000002", "tail": "tail.g000002"}; absent = nothing sealed
+  2025-01-01/<tail>.<col>       arrival-ordered rows appended since the last seal
+  2025-01-01/g000002/sorted.<col>  rows sorted by (key, ts) as of the last seal()
+  2025-01-01/g000002/offsets    int64[n_keys + 1]: key k owns sorted rows offsets[k]:offsets[k+1]
+
+Columns are raw little-endian arrays read through np.memmap: ts (epoch
+seconds), key, risk, delay_minutes, cost_delta. A read touches only the day
+partitions in its window; in a sealed day one (warehouse, route) is a
+contiguous slice found via offsets plus a binary search on ts, and only the
+small unsealed tail is scanned. compact() seals every day except the newest.
+
+seal() writes a complete new generation directory, then switches MANIFEST to
+it (and to a fresh, empty tail prefix) with one os.replace, so a crash leaves
+either the old sealed columns plus the old tail or the new ones, never a mix;
+files the manifest no longer names are removed afterwards. A reader that
+finds the files of its manifest gone re-reads MANIFEST and retries.
+
+Single writer: one process appends at a time. After a crash mid-append, tail
+columns of different lengths are read up to the shortest one.
+"""
+import csv
+import json
+import os
+import shutil
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+STORE_DIR = os.path.join("data", "signal_store")
+LEGACY_CSV = os.path.join("data", "signals.csv")
+COLUMNS = (("ts", "<i8"), ("key", "<i4"), ("risk", "<f4"), ("delay_minutes", "<i4"), ("cost_delta", "<f8"))
+_DTYPES = dict(COLUMNS)
+DAY_S = 86400
+_NO_MANIFEST = {"sealed": None, "tail": "tail"}
+
+Columns = Dict[str, np.ndarray]
+
+
+def to_epoch(ts: Any) -> int:
+    if isinstance(ts, (int, float, np.integer, np.floating)):
+        return int(ts)
+    dt = datetime.fromisoformat(str(ts).replace("Z", "+00:00"))
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp())
+
+
+def _iso(epoch: int) -> str:
+    return datetime.fromtimestamp(int(epoch), timezone.utc).isoformat()
+
+
+def _day_name(day: int) -> str:
+    return time.strftime("%Y-%m-%d", time.gmtime(day * DAY_S))
+
+
+def _empty() -> Columns:
+    return {c: np.empty(0, dt) for c, dt in COLUMNS}
+
+
+def _concat(parts: List[Columns]) -> Columns:
+    parts = [p for p in parts if len(p["ts"])]
+    if not parts:
+        return _empty()
+    if len(parts) == 1:
+        return parts[0]
+    return {c: np.concatenate([p[c] for p in parts]) for c, _ in COLUMNS}
+
+
+def _take(cols: Columns, idx) -> Columns:
+    return {c: np.asarray(cols[c][idx]) for c, _ in COLUMNS}
+
+
+def _manifest(d: str) -> Dict[str, Any]:
+    try:
+        with open(os.path.join(d, "MANIFEST"), encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return dict(_NO_MANIFEST)
+
+
+class SignalStore:
+    def __init__(self, root: str = STORE_DIR):
+        self.root = root
+        self._keys: List[Tuple[str, str]] = []
+        self._key_ids: Dict[Tuple[str, str], int] = {}
+        self._load_keys()
+
+    # ---- keys -------------------------------------------------------------
+
+    def _load_keys(self) -> None:
+        path = os.path.join(self.root, "keys.json")
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                self._keys = [tuple(k) for k in json.load(f)]
+            self._key_ids = {k: i for i, k in enumerate(self._keys)}
+
+    def _save_keys(self) -> None:
+        os.makedirs(self.root, exist_ok=True)
+        path = os.path.join(self.root, "keys.json")
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(self._keys, f)
+        os.replace(path + ".tmp", path)
+
+    def key_id(self, warehouse: str, route: str, create: bool = False) -> Optional[int]:
+        k = (str(warehouse), str(route))
+        kid = self._key_ids.get(k)
+        if kid is None and create:
+            kid = self._key_ids[k] = len(self._keys)
+            self._keys.append(k)
+        return kid
+
+    def keys(self) -> List[Tuple[str, str]]:
+        return list(self._keys)
+
+    def _key_filter(self, warehouse: Optional[str], route: Optional[str]) -> Optional[np.ndarray]:
+        """None = every key; otherwise the (possibly empty) sorted key ids that match."""
+        if warehouse is None and route is None:
+            return None
+        return np.array([i for i, (w, r) in enumerate(self._keys)
+                         if (warehouse is None or w == warehouse) and (route is None or r == route)], np.int64)
+
+    # ---- writes -----------------------------------------------------------
+
+    def append(self, rows: Iterable[Sequence[Any]]) -> int:
+        """Append (timestamp, warehouse, route, risk, delay_minutes, cost_delta) rows; returns the count."""
+        stamps: Dict[Any, int] = {}
+        n_keys = len(self._keys)
+        ts, key, risk, delay, cost = [], [], [], [], []
+        for t, w, r, rk, d, c in rows:
+            e = stamps.get(t)
+            if e is None:
+                e = stamps[t] = to_epoch(t)
+            ts.append(e)
+            key.append(self.key_id(w, r, create=True))
+            risk.append(float(rk))
+            delay.append(int(float(d)))
+            cost.append(float(c))
+        if not ts:
+            return 0
+        if len(self._keys) != n_keys:
+            self._save_keys()  # before the rows that use the new ids
+        cols = {"ts": np.array(ts, "<i8"), "key": np.array(key, "<i4"), "risk": np.array(risk, "<f4"),
+                "delay_minutes": np.array(delay, "<i4"), "cost_delta": np.array(cost, "<f8")}
+        days = cols["ts"] // DAY_S
+        for day in np.unique(days):
+            sel = np.flatnonzero(days == day)
+            d = os.path.join(self.root, _day_name(int(day)))
+            os.makedirs(d, exist_ok=True)
+            tail = _manifest(d)["tail"]
+            for c, dt in COLUMNS:
+                with open(os.path.join(d, f"{tail}.{c}"), "ab") as f:
+                    cols[c][sel].astype(dt, copy=False).tofile(f)
+        return len(ts)
+
+    def seal(self, day: str) -> int:
+        """Merge a day's tail into a new sorted generation; returns the day's row count."""
+        d = os.path.join(self.root, day)
+        man = _manifest(d)
+        merged = _concat([self._sealed(d, man), self._read(d, man["tail"])])
+        order = np.lexsort((merged["ts"], merged["key"]))
+        merged = _take(merged, order)
+        offsets = np.searchsorted(merged["key"], np.arange(len(self._keys) + 1)).astype("<i8")
+        gen = f"g{int((man['sealed'] or 'g0')[1:]) + 1:06d}"
+        g = os.path.join(d, gen)
+        shutil.rmtree(g, ignore_errors=True)  # leftover of a seal that crashed before switching
+        os.makedirs(g)
+        for c, dt in COLUMNS:
+            merged[c].astype(dt, copy=False).tofile(os.path.join(g, f"sorted.{c}"))
+        offsets.tofile(os.path.join(g, "offsets"))
+        with open(os.path.join(d, "MANIFEST.tmp"), "w", encoding="utf-8") as f:
+            json.dump({"sealed": gen, "tail": f"tail.{gen}"}, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(os.path.join(d, "MANIFEST.tmp"), os.path.join(d, "MANIFEST"))  # the switch
+        self._collect(d, gen)
+        return len(merged["ts"])
+
+    @staticmethod
+    def _collect(d: str, gen: str) -> None:
+        """Remove generations and tails the manifest no longer names (including pre-manifest files)."""
+        keep = {gen, "MANIFEST"}
+        for name in os.listdir(d):
+            if name in keep or name.startswith(f"tail.{gen}."):
+                continue
+            p = os.path.join(d, name)
+            if os.path.isdir(p):
+                shutil.rmtree(p, ignore_errors=True)
+            else:
+                os.remove(p)
+
+    def compact(self, include_latest: bool = False) -> List[str]:
+        """Seal every day with a non-empty unsealed tail (the newest day only if include_latest)."""
+        days = self.days()
+        if not include_latest:
+            days = days[:-1]
+        done = []
+        for day in days:
+            d = os.path.join(self.root, day)
+            p = os.path.join(d, f"{_manifest(d)['tail']}.ts")
+            if os.path.exists(p) and os.path.getsize(p):
+                done.append(day)
+        for day in done:
+            self.seal(day)
+        return done
+
+    # ---- reads ------------------------------------------------------------
+
+    def days(self) -> List[str]:
+        if not os.path.isdir(self.root):
+            return []
+        return sorted(d for d in os.listdir(self.root) if len(d) == 10 and d[4] == "-"
+                      and os.path.isdir(os.path.join(self.root, d)))
+
+    @staticmethod
+    def _read(d: str, prefix: str, missing_ok: bool = True) -> Columns:
+        """Columns under d/<prefix>.<col>; missing files read as empty only if missing_ok."""
+        cols, n = {}, None
+        for c, dt in COLUMNS:
+            p = os.path.join(d, f"{prefix}.{c}")
+            size = os.path.getsize(p) if not missing_ok or os.path.exists(p) else 0
+            rows = size // np.dtype(dt).itemsize
+            cols[c] = np.memmap(p, dtype=dt, mode="r", shape=(rows,)) if rows else np.empty(0, dt)
+            n = rows if n is None else min(n, rows)
+        return {c: a[:n] for c, a in cols.items()}
+
+    def _sealed(self, d: str, man: Dict[str, Any]) -> Columns:
+        return self._read(os.path.join(d, man["sealed"]), "sorted", missing_ok=False) if man["sealed"] else _empty()
+
+    def _snapshot(self, d: str) -> Tuple[Columns, Optional[np.ndarray], Columns]:
+        """
+        (sealed, offsets, tail) of one partition, all named by the same MANIFEST.
+        A seal() that switches the manifest mid-read removes the files this
+        reader was using; the read is then retried against the new manifest.
+        Only a tail that was never written reads as empty.
+        """
+        man = _manifest(d)
+        while True:
+            err = None
+            try:
+                srt, offsets = self._sealed(d, man), None
+                if man["sealed"]:
+                    offsets = np.fromfile(os.path.join(d, man["sealed"], "offsets"), "<i8")
+                tail = self._read(d, man["tail"])
+            except FileNotFoundError as e:
+                err = e
+            now = _manifest(d)
+            if now == man:
+                if err is not None:
+                    raise err
+                return srt, offsets, tail
+            man = now
+
+    def _day(self, day: str, keys: Optional[np.ndarray], lo: int, hi: int) -> Columns:
+        """Rows of one partition with lo <= ts < hi, ordered by ts."""
+        srt, offsets, tail = self._snapshot(os.path.join(self.root, day))
+        parts = []
+        if len(srt["ts"]):
+            if keys is None:
+                mask = (srt["ts"] >= lo) & (srt["ts"] < hi)
+                parts.append(_take(srt, mask))
+            else:
+                for k in keys[keys < len(offsets) - 1]:
+                    a, b = int(offsets[k]), int(offsets[k + 1])
+                    t = srt["ts"][a:b]
+                    i, j = a + int(np.searchsorted(t, lo)), a + int(np.searchsorted(t, hi))
+                    if i < j:
+                        parts.append(_take(srt, slice(i, j)))
+        if len(tail["ts"]):
+            mask = (tail["ts"] >= lo) & (tail["ts"] < hi)
+            if keys is not None:
+                mask &= np.isin(tail["key"], keys)
+            parts.append(_take(tail, mask))
+        out = _concat(parts)
+        if len(parts) > 1 or keys is None:
+            out = _take(out, np.argsort(out["ts"], kind="stable"))
+        return out
+
+    def window(self, since: Any = None, until: Any = None, warehouse: Optional[str] = None,
+               route: Optional[str] = None) -> Columns:
+        """Rows with since <= ts < until (either bound optional), ordered by ts."""
+        lo = to_epoch(since) if since is not None else -(2 ** 62)
+        hi = to_epoch(until) if until is not None else 2 ** 62
+        keys = self._key_filter(warehouse, route)
+        if keys is not None and not keys.size:
+            return _empty()
+        first, last = _day_name(lo // DAY_S) if since is not None else "", _day_name(hi // DAY_S) if until is not None else "~"
+        return _concat([self._day(d, keys, lo, hi) for d in self.days() if first <= d <= last])
+
+    def tail(self, n: int, warehouse: Optional[str] = None, route: Optional[str] = None) -> Columns:
+        """The last n rows (by ts) for the filter, newest partitions first."""
+        keys = self._key_filter(warehouse, route)
+        if n <= 0 or (keys is not None and not keys.size):
+            return _empty()
+        parts, have = [], 0
+        for d in reversed(self.days()):
+            cols = self._day(d, keys, -(2 ** 62), 2 ** 62)
+            parts.insert(0, cols)
+            have += len(cols["ts"])
+            if have >= n:
+                break
+        out = _concat(parts)
+        return _take(out, slice(max(0, len(out["ts"]) - n), None))
+
+    def rows(self, cols: Columns) -> List[Dict[str, Any]]:
+        """Columns back to signals.csv-style dicts."""
+        out = []
+        for t, k, rk, d, c in zip(cols["ts"].tolist(), cols["key"].tolist(), cols["risk"].tolist(),
+                                  cols["delay_minutes"].tolist(), cols["cost_delta"].tolist()):
+            w, r = self._keys[k]
+            out.append({"timestamp": _iso(t), "warehouse": w, "route": r, "risk": round(rk, 4),
+                        "delay_minutes": d, "cost_delta": int(c) if float(c).is_integer() else c})
+        return out
+
+
+def import_csv(csv_path: str, store: SignalStore, chunk_rows: int = 200_000, seal: bool = True) -> int:
+    """One-time import of a signals.csv; streams chunk_rows at a time, then seals all but the newest day."""
+    n = 0
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return 0
+        idx = [header.index(c) for c in ("timestamp", "warehouse", "route", "risk", "delay_minutes", "cost_delta")]
+        batch: List[List[str]] = []
+        for row in reader:
+            if row:
+                batch.append([row[i] for i in idx])
+            if len(batch) >= chunk_rows:
+                n += store.append(batch)
+                batch = []
+        n += store.append(batch)
+    if seal:
+        store.compact()
+    return n
+
+
+def open_store(root: str = STORE_DIR, legacy_csv: Optional[str] = LEGACY_CSV) -> SignalStore:
+    """SignalStore at root; when this call creates the store, legacy_csv (if present) is imported first."""
+    fresh = not os.path.exists(os.path.join(root, "keys.json"))
+    store = SignalStore(root)
+    if fresh and legacy_csv and os.path.exists(legacy_csv):
+        import_csv(legacy_csv, store)
+    return store
@@ -0,0 +1,452 @@
+# hub/twin_graph.py
+"""
+In-memory twin graph with indexed MATCH queries.
+
+Snapshots (twin_snapshot.json shape: {"warehouses": {...}, "routes": {...}})
+load into nodes keyed by $dtId, adjacency lists per relationship type in both
+directions, and hash indexes on ID properties ($dtId, warehouseId, routeId).
+A route's warehouse references (from/to/origin/destination/warehouse_id/
+warehouses) become Warehouse -[:ROUTE]-> Route edges; an optional top-level
+"relationships" list adds explicit {source, target, type} edges.
+
+Supported query subset (ADT MATCH syntax):
+    MATCH (w)-[:ROUTE]->(r) WHERE w.warehouseId = 'W3' RETURN w, r LIMIT 5
+  - node patterns (v) or (v:Label), chained with -[:T]->, <-[:T]-, -[]->, -[r:T]->
+  - WHERE with = != <> < <= > >= IN [..], AND / OR / NOT and parentheses
+  - RETURN v, v.prop [AS alias], or *;  LIMIT n
+An equality on an indexed property seeds the match; otherwise the start
+node's label (or every node) is scanned. Matching stops at LIMIT.
+"""
+import json
+import re
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+INDEXED_PROPS = ("$dtId", "warehouseId", "routeId")
+ROUTE_REFS = ("from", "to", "origin", "destination", "warehouse_id", "warehouseId")
+
+
+class QueryError(ValueError):
+    pass
+
+
+class TwinGraph:
+    def __init__(self, indexed: Iterable[str] = INDEXED_PROPS):
+        self.nodes: Dict[str, Dict[str, Any]] = {}
+        self.labels: Dict[str, str] = {}
+        self.by_label: Dict[str, Dict[str, None]] = defaultdict(dict)  # insertion-ordered sets
+        self.out: Dict[str, Dict[str, List[str]]] = {}  # src -> type -> dsts
+        self.inc: Dict[str, Dict[str, List[str]]] = {}  # dst -> type -> srcs
+        # prop -> value -> node ids; $dtId needs no index of its own (nodes is keyed by it)
+        self.indexes: Dict[str, Dict[Any, List[str]]] = {p: {} for p in indexed if p != "$dtId"}
+        self.edges = 0
+
+    # -- building --
+    def add_node(self, node_id: str, label: str, props: Dict[str, Any]) -> None:
+        self._add(node_id, label, dict(props))
+
+    def _add(self, node_id: str, label: str, node: Dict[str, Any]) -> None:
+        if node_id in self.nodes:
+            self._unindex(node_id)
+        node["$dtId"] = node_id
+        self.nodes[node_id] = node
+        self.labels[node_id] = label
+        self.by_label[label][node_id] = None
+        for prop, idx in self.indexes.items():
+            v = node.get(prop)
+            if v is not None and _hashable(v):
+                ids = idx.get(v)
+                if ids is None:
+                    idx[v] = [node_id]
+                else:
+                    ids.append(node_id)
+
+    def _unindex(self, node_id: str) -> None:
+        old = self.nodes[node_id]
+        self.by_label[self.labels[node_id]].pop(node_id, None)
+        for prop, idx in self.indexes.items():
+            ids = idx.get(old.get(prop)) if _hashable(old.get(prop)) else None
+            if ids and node_id in ids:
+                ids.remove(node_id)
+
+    def add_edge(self, src: str, dst: str, rel: str) -> None:
+        out = self.out.get(src)
+        if out is None:
+            out = self.out[src] = {}
+        out.setdefault(rel, []).append(dst)
+        inc = self.inc.get(dst)
+        if inc is None:
+            inc = self.inc[dst] = {}
+        inc.setdefault(rel, []).append(src)
+        self.edges += 1
+
+    def create_index(self, prop: str) -> None:
+        if prop == "$dtId":
+            return
+        idx: Dict[Any, List[str]] = {}
+        for node_id, node in self.nodes.items():
+            v = node.get(prop)
+            if v is not None and _hashable(v):
+                idx.setdefault(v, []).append(node_id)
+        self.indexes[prop] = idx
+
+    def lookup(self, prop: str, value: Any) -> Optional[List[str]]:
+        """Node ids with prop == value, or None when prop is not indexed."""
+        if prop == "$dtId":
+            return [value] if value in self.nodes else []
+        idx = self.indexes.get(prop)
+        return None if idx is None else idx.get(value, [])
+
+    @classmethod
+    def from_snapshot(cls, snapshot: Dict[str, Any], indexed: Iterable[str] = INDEXED_PROPS) -> "TwinGraph":
+        g = cls(indexed)
+        for wid, props in (snapshot.get("warehouses") or {}).items():
+            g._add(wid, "Warehouse", dict(props, warehouseId=wid))
+        for rid, props in (snapshot.get("routes") or {}).items():
+            g._add(rid, "Route", dict(props, routeId=rid))
+            seen: Set[str] = set()
+            for wid in [props[k] for k in ROUTE_REFS if k in props] + list(props.get("warehouses") or ()):
+                if isinstance(wid, str) and wid not in seen and g.labels.get(wid) == "Warehouse":
+                    seen.add(wid)
+                    g.add_edge(wid, rid, "ROUTE")
+        for rel in snapshot.get("relationships") or []:
+            g.add_edge(rel["source"], rel["target"], rel.get("type") or rel.get("name") or "REL")
+        return g
+
+    @classmethod
+    def load(cls, path: str) -> "TwinGraph":
+        with open(path, "r", encoding="utf-8") as f:
+            return cls.from_snapshot(json.load(f))
+
+    # -- querying --
+    def query(self, text: str) -> List[Dict[str, Any]]:
+        return list(self.run(parse(text)))
+
+    def run(self, q: "Query") -> Iterator[Dict[str, Any]]:
+        start, seeds = self._seed(q)
+        emitted = 0
+        for binding in self._expand(q, start, seeds):
+            if q.where is None or q.where(binding, self.nodes):
+                yield self._project(q, binding)
+                emitted += 1
+                if q.limit is not None and emitted >= q.limit:
+                    return
+
+    def _seed(self, q: "Query") -> Tuple[int, Iterable[str]]:
+        """Pick the most selective start position: index hit > label scan > full scan."""
+        best: Optional[Tuple[int, List[str]]] = None
+        for var, prop, val in q.equalities:
+            hits = self.lookup(prop, val) if var in q.var_pos and _hashable(val) else None
+            if hits is not None and (best is None or len(hits) < len(best[1])):
+                best = (q.var_pos[var], list(hits))
+        if best is not None:
+            return best
+        label = q.nodes[0].label
+        return 0, (self.by_label.get(label, {}).keys() if label else self.nodes.keys())
+
+    def _expand(self, q: "Query", pos: int, seeds: Iterable[str]) -> Iterator[Dict[str, str]]:
+        nodes = q.nodes
+        for seed in seeds:
+            if not nodes[pos].accepts(seed, self.labels):
+                continue
+            yield from self._walk(q, {nodes[pos].var: seed}, pos, pos, seed, seed)
+
+    def _step(self, node_id: str, rel: "RelPattern", forward: bool) -> Iterable[Tuple[str, str]]:
+        """Neighbours along `rel` in pattern direction (forward = left to right)."""
+        outgoing = (rel.direction == "out") == forward
+        adj = (self.out if outgoing else self.inc).get(node_id)
+        if not adj:
+            return ()
+        if rel.type:
+            return ((rel.type, n) for n in adj.get(rel.type, ()))
+        return ((t, n) for t, ns in adj.items() for n in ns)
+
+    def _walk(self, q: "Query", binding: Dict[str, str], lo: int, hi: int,
+              lo_id: str, hi_id: str) -> Iterator[Dict[str, str]]:
+        nodes, rels = q.nodes, q.rels
+        if hi < len(nodes) - 1:
+            rel, nxt = rels[hi], nodes[hi + 1]
+            for rtype, n in self._step(hi_id, rel, forward=True):
+                if not nxt.accepts(n, self.labels) or binding.get(nxt.var, n) != n:
+                    continue
+                b = dict(binding)
+                b[nxt.var] = n
+                if rel.var:
+                    b[rel.var] = rtype
+                yield from self._walk(q, b, lo, hi + 1, lo_id, n)
+        elif lo > 0:
+            rel, prv = rels[lo - 1], nodes[lo - 1]
+            for rtype, n in self._step(lo_id, rel, forward=False):
+                if not prv.accepts(n, self.labels) or binding.get(prv.var, n) != n:
+                    continue
+                b = dict(binding)
+                b[prv.var] = n
+                if rel.var:
+                    b[rel.var] = rtype
+                yield from self._walk(q, b, lo - 1, hi, n, hi_id)
+        else:
+            yield binding
+
+    def _project(self, q: "Query", binding: Dict[str, str]) -> Dict[str, Any]:
+        if q.returns == ["*"]:
+            return {v: self._value(v, None, binding) for v in binding}
+        return {alias: self._value(var, prop, binding) for var, prop, alias in q.return_items}
+
+    def _value(self, var: str, prop: Optional[str], binding: Dict[str, str]) -> Any:
+        ref = binding[var]
+        if ref not in self.nodes:  # relationship variable holds its type
+            return {"$relationshipName": ref} if prop is None else None
+        node = self.nodes[ref]
+        return dict(node) if prop is None else node.get(prop)
+
+
+def _hashable(v: Any) -> bool:
+    return isinstance(v, (str, int, float, bool)) or v is None
+
+
+# -----------------------
+# Parser
+# -----------------------
+@dataclass
+class NodePattern:
+    var: str
+    label: Optional[str] = None
+
+    def accepts(self, node_id: str, labels: Dict[str, str]) -> bool:
+        return node_id in labels and (self.label is None or labels[node_id] == self.label)
+
+
+@dataclass
+class RelPattern:
+    var: Optional[str]
+    type: Optional[str]
+    direction: str  # "out" (-[]->) or "in" (<-[]-)
+
+
+@dataclass
+class Query:
+    nodes: List[NodePattern]
+    rels: List[RelPattern]
+    where: Optional[Callable[[Dict[str, str], Dict[str, Dict[str, Any]]], bool]]
+    equalities: List[Tuple[str, str, Any]]
+    return_items: List[Tuple[str, Optional[str], str]]
+    returns: List[str] = field(default_factory=list)
+    limit: Optional[int] = None
+
+    @property
+    def var_pos(self) -> Dict[str, int]:
+        return {n.var: i for i, n in enumerate(self.nodes)}
+
+
+_TOKEN = re.compile(r"""
+    \s*(?:
+      (?P<str>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")
+     |(?P<num>-?\d+(?:\.\d+)?)
+     |(?P<op><>|!=|<=|>=|<-|->|[-=<>()\[\]:,.*])
+     |(?P<word>\$?[A-Za-z_][A-Za-z0-9_]*)
+    )""", re.X)
+
+_KEYWORDS = {"MATCH", "WHERE", "RETURN", "LIMIT", "AND", "OR", "NOT", "IN", "AS", "TRUE", "FALSE", "NULL"}
+
+
+def _tokenize(text: str) -> List[Tuple[str, Any]]:
+    out, pos = [], 0
+    text = text.strip()
+    while pos < len(text):
+        m = _TOKEN.match(text, pos)
+        if not m or m.end() == pos:
+            raise QueryError(f"unexpected input at {pos}: {text[pos:pos + 20]!r}")
+        pos = m.end()
+        if m.group("str"):
+            s = m.group("str")
+            out.append(("lit", re.sub(r"\\(.)", r"\1", s[1:-1])))
+        elif m.group("num"):
+            n = m.group("num")
+            out.append(("lit", float(n) if "." in n else int(n)))
+        elif m.group("op"):
+            out.append(("op", m.group("op")))
+        elif m.group("word"):
+            w = m.group("word")
+            if w.upper() in _KEYWORDS:
+                out.append(("kw", w.upper()))
+            else:
+                out.append(("id", w))
+    return out
+
+
+class _Parser:
+    def __init__(self, tokens: List[Tuple[str, Any]]):
+        self.t = tokens
+        self.i = 0
+        self.equalities: List[Tuple[str, str, Any]] = []
+
+    def peek(self, kind: Optional[str] = None, value: Any = None) -> bool:
+        if self.i >= len(self.t):
+            return False
+        k, v = self.t[self.i]
+        return (kind is None or k == kind) and (value is None or v == value)
+
+    def take(self, kind: str, value: Any = None) -> Any:
+        if not self.peek(kind, value):
+            got = self.t[self.i] if self.i < len(self.t) else ("end", None)
+            raise QueryError(f"expected {value or kind}, got {got[1]!r}")
+        self.i += 1
+        return self.t[self.i - 1][1]
+
+    def parse(self) -> Query:
+        self.take("kw", "MATCH")
+        nodes, rels = [self.node()], []
+        while self.peek("op", "-") or self.peek("op", "<-"):
+            rels.append(self.rel())
+            nodes.append(self.node())
+        where = None
+        if self.peek("kw", "WHERE"):
+            self.i += 1
+            where = self.expr(top=True)
+        self.take("kw", "RETURN")
+        items, returns = [], []
+        if self.peek("op", "*"):
+            self.i += 1
+            returns = ["*"]
+        else:
+            while True:
+                var = self.take("id")
+                prop = None
+                if self.peek("op", "."):
+                    self.i += 1
+                    prop = self.take("id")
+                alias = var if prop is None else f"{var}.{prop}"
+                if self.peek("kw", "AS"):
+                    self.i += 1
+                    alias = self.take("id")
+                items.append((var, prop, alias))
+                if not self.peek("op", ","):
+                    break
+                self.i += 1
+        limit = None
+        if self.peek("kw", "LIMIT"):
+            self.i += 1
+            limit = int(self.take("lit"))
+        if self.i != len(self.t):
+            raise QueryError(f"unexpected trailing input: {self.t[self.i][1]!r}")
+        q = Query(nodes, rels, where, self.equalities, items, returns, limit)
+        known = set(q.var_pos) | {r.var for r in rels if r.var}
+        for var, _, _ in items:
+            if var not in known:
+                raise QueryError(f"unknown variable in RETURN: {var}")
+        return q
+
+    def node(self) -> NodePattern:
+        self.take("op", "(")
+        var = self.take("id")
+        label = None
+        if self.peek("op", ":"):
+            self.i += 1
+            label = self.take("id")
+        self.take("op", ")")
+        return NodePattern(var, label)
+
+    def rel(self) -> RelPattern:
+        incoming = self.peek("op", "<-")
+        self.i += 1
+        var = rtype = None
+        if self.peek("op", "["):
+            self.i += 1
+            if self.peek("id"):
+                var = self.take("id")
+            if self.peek("op", ":"):
+                self.i += 1
+                rtype = self.take("id")
+            self.take("op", "]")
+        if incoming:
+            self.take("op", "-")
+        else:
+            self.take("op", "->")
+        return RelPattern(var, rtype, "in" if incoming else "out")
+
+    # WHERE expressions compile to closures over (binding, nodes).
+    def expr(self, top: bool = False):
+        left = self.conj(top)
+        while self.peek("kw", "OR"):
+            self.i += 1
+            right = self.conj(False)
+            left = (lambda a, b: lambda bd, ns: a(bd, ns) or b(bd, ns))(left, right)
+        return left
+
+    def conj(self, top: bool):
+        # Equalities are index candidates only when every OR branch must hold them,
+        # so collect from a top-level AND chain and discard if an OR follows.
+        start = len(self.equalities)
+        left = self.unary(top)
+        while self.peek("kw", "AND"):
+            self.i += 1
+            right = self.unary(top)
+            left = (lambda a, b: lambda bd, ns: a(bd, ns) and b(bd, ns))(left, right)
+        if not top or self.peek("kw", "OR"):
+            del self.equalities[start:]
+        return left
+
+    def unary(self, top: bool):
+        if self.peek("kw", "NOT"):
+            self.i += 1
+            inner = self.unary(False)
+            return lambda bd, ns: not inner(bd, ns)
+        if self.peek("op", "("):
+            self.i += 1
+            inner = self.expr(False)
+            self.take("op", ")")
+            return inner
+        return self.compare(top)
+
+    def literal(self) -> Any:
+        if self.peek("lit"):
+            return self.take("lit")
+        kw = self.take("kw")
+        if kw in ("TRUE", "FALSE", "NULL"):
+            return {"TRUE": True, "FALSE": False, "NULL": None}[kw]
+        raise QueryError(f"expected a literal, got {kw}")
+
+    def compare(self, top: bool):
+        var = self.take("id")
+        self.take("op", ".")
+        prop = self.take("id")
+        if self.peek("kw", "IN"):
+            self.i += 1
+            self.take("op", "[")
+            vals = [self.literal()]
+            while self.peek("op", ","):
+                self.i += 1
+                vals.append(self.literal())
+            self.take("op", "]")
+            allowed = set(v for v in vals if _hashable(v))
+            return lambda bd, ns: _prop(bd, ns, var, prop) in allowed
+        op = self.take("op")
+        val = self.literal()
+        if op == "=":
+            if top:
+                self.equalities.append((var, prop, val))
+            return lambda bd, ns: _prop(bd, ns, var, prop) == val
+        if op in ("!=", "<>"):
+            return lambda bd, ns: _prop(bd, ns, var, prop) != val
+        cmp = {"<": lambda a, b: a < b, "<=": lambda a, b: a <= b,
+               ">": lambda a, b: a > b, ">=": lambda a, b: a >= b}.get(op)
+        if cmp is None:
+            raise QueryError(f"unsupported operator {op!r}")
+
+        def ordered(bd, ns):
+            x = _prop(bd, ns, var, prop)
+            try:
+                return x is not None and cmp(x, val)
+            except TypeError:
+                return False
+        return ordered
+
+
+def _prop(binding: Dict[str, str], nodes: Dict[str, Dict[str, Any]], var: str, prop: str) -> Any:
+    node = nodes.get(binding.get(var, ""))
+    return None if node is None else node.get(prop)
+
+
+def parse(text: str) -> Query:
+    return _Parser(_tokenize(text)).parse()
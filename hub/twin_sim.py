@@ -0,0 +1,240 @@
+# hub/twin_sim.py
+"""
+Vectorized twin simulator: every plan against every affected warehouse and
+route of a snapshot in one NumPy pass.
+
+Model (per event severity):
+  - the disrupted warehouse loses SUPPLY_LOSS of its inbound supply, the other
+    endpoints of the disrupted route half of that;
+  - the disrupted route's latency grows by LATENCY_FACTOR, routes touching
+    the disrupted warehouse by a quarter of that;
+  - stockout risk = clip(1 - coverage * (1 - shortfall)), coverage = inventory / demand;
+  - a plan recovers a fraction of the shortfall and of the excess latency.
+    The fractions come from plan["mitigation"] {"supply_recovery",
+    "delay_recovery"} when given, else from kpi_expectations
+    (stockout_risk_reduction_pct, delay_reduction_pct) / 100.
+Aggregates are demand-weighted over affected warehouses and averaged over
+affected routes. cost_delta is the plan cost minus the stockout cost avoided.
+
+monte_carlo() reruns the same model under seeded lognormal perturbations of
+demand, latency and disruption intensity and reports mean/p5/p95 per plan. Trials run in fixed-size
+batches, each with its own child of SeedSequence(seed), so a seed replays to
+the same numbers whether the batches run inline or across a process pool.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+SUPPLY_LOSS = {"low": 0.15, "medium": 0.3, "high": 0.5, "critical": 0.7}
+LATENCY_FACTOR = {"low": 0.25, "medium": 0.5, "high": 1.0, "critical": 2.0}
+STOCKOUT_USD_PER_UNIT = 25.0
+MC_BATCH = 512  # trials per batch; fixed so results do not depend on worker count
+MC_POOL_MIN_TRIALS = 20000  # below this, pool start-up costs more than it saves
+ROUTE_ENDS = (("from", "origin", "warehouse_id"), ("to", "destination"))
+
+
+@dataclass
+class SnapshotArrays:
+    warehouse_ids: List[str]
+    inventory: np.ndarray
+    demand: np.ndarray
+    route_ids: List[str]
+    latency: np.ndarray
+    route_src: np.ndarray  # warehouse index of a route's first endpoint, -1 if none
+    route_dst: np.ndarray
+    w_index: Dict[str, int]
+    r_index: Dict[str, int]
+
+    @classmethod
+    def from_snapshot(cls, snapshot: Dict[str, Any]) -> "SnapshotArrays":
+        ws = snapshot.get("warehouses") or {}
+        rs = snapshot.get("routes") or {}
+        wids = list(ws)
+        w_index = {w: i for i, w in enumerate(wids)}
+        inv = np.fromiter((float(v.get("inventory", 0) or 0) for v in ws.values()), float, len(wids))
+        dem = np.fromiter((float(v.get("demand", 0) or 0) for v in ws.values()), float, len(wids))
+        rids = list(rs)
+        lat = np.fromiter((float(v.get("latency_minutes", 0) or 0) for v in rs.values()), float, len(rids))
+
+        def end(keys):
+            return np.fromiter((next((w_index[v[k]] for k in keys if v.get(k) in w_index), -1)
+                                for v in rs.values()), np.int64, len(rids))
+
+        return cls(wids, inv, dem, rids, lat, end(ROUTE_ENDS[0]), end(ROUTE_ENDS[1]),
+                   w_index, {r: i for i, r in enumerate(rids)})
+
+
+def _plan_levers(plans: List[Dict[str, Any]]):
+    def lever(p, key, kpi):
+        m = p.get("mitigation") or {}
+        v = m.get(key)
+        if v is None:
+            v = ((p.get("kpi_expectations") or {}).get(kpi) or 0) / 100.0
+        return float(v)
+    supply = np.clip(np.array([lever(p, "supply_recovery", "stockout_risk_reduction_pct") for p in plans]), 0, 1)
+    delay = np.clip(np.array([lever(p, "delay_recovery", "delay_reduction_pct") for p in plans]), 0, 1)
+    cost = np.array([float(p.get("cost_usd") or 0) for p in plans])
+    return supply, delay, cost
+
+
+def _footprint(arr: SnapshotArrays, event: Dict[str, Any]):
+    """(affected warehouse idx, shortfall, affected route idx, latency factor) or None."""
+    sev = str(event.get("severity") or "high").lower()
+    loss, factor = SUPPLY_LOSS.get(sev, SUPPLY_LOSS["high"]), LATENCY_FACTOR.get(sev, LATENCY_FACTOR["high"])
+    w_star = arr.w_index.get(event.get("warehouse_id"), -1)
+    r_star = arr.r_index.get(event.get("route_id"), -1)
+    if w_star < 0 and r_star < 0:
+        return None
+    shortfall = np.zeros(len(arr.warehouse_ids))
+    spill = np.zeros(len(arr.route_ids))
+    if r_star >= 0:
+        for e in (arr.route_src[r_star], arr.route_dst[r_star]):
+            if e >= 0:
+                shortfall[e] = loss * 0.5
+        spill[r_star] = factor
+    if w_star >= 0:
+        shortfall[w_star] = loss
+        touching = (arr.route_src == w_star) | (arr.route_dst == w_star)
+        spill = np.where(touching, np.maximum(spill, factor * 0.25), spill)
+    wa = np.flatnonzero(shortfall > 0)
+    ra = np.flatnonzero(spill > 0)
+    return wa, shortfall[wa], ra, spill[ra]
+
+
+def _evaluate(inv, dem, s, lat, f, supply, delay, cost):
+    """
+    Core model, broadcast over a leading trial axis T. inv is (A,), dem and s
+    are (T, A) or (A,), lat and f are (T, R) or (R,); supply/delay/cost are (P,). Returns
+    (base_risk (T,), after_risk (T, P), base_delay (T,), after_delay (T, P), cost_delta (T, P)).
+    """
+    dem, s, lat, f = (np.atleast_2d(x) for x in (dem, s, lat, f))
+    T, P = max(dem.shape[0], s.shape[0], lat.shape[0]), len(supply)
+    if inv.size:
+        cov = inv / np.maximum(dem, 1.0)                                                        # (T, A)
+        base = np.clip(1.0 - cov * (1.0 - s), 0.0, 1.0)                                         # (T, A)
+        after = np.clip(1.0 - cov[:, None, :] * (1.0 - s[:, None, :] * (1.0 - supply[None, :, None])),
+                        0.0, 1.0)                                                               # (T, P, A)
+        total = dem.sum(axis=1, keepdims=True)
+        w = np.where(total > 0, dem / np.where(total > 0, total, 1.0), 1.0 / inv.size)
+        base, w, dem = (np.broadcast_to(x, (T, inv.size)) for x in (base, w, dem))
+        base_r = (base * w).sum(axis=1)
+        after_r = np.einsum("tpa,ta->tp", after, w)
+        recovered = np.einsum("tpa,ta->tp", base[:, None, :] - after, dem)
+    else:
+        base_r, after_r, recovered = np.zeros(T), np.zeros((T, P)), np.zeros((T, P))
+    if lat.shape[1]:
+        base_d = (lat * (1.0 + f)).mean(axis=1)
+        after_d = (lat[:, None, :] * (1.0 + f[:, None, :] * (1.0 - delay[None, :, None]))).mean(axis=2)
+    else:
+        base_d, after_d = np.zeros(T), np.zeros((T, P))
+    return base_r, after_r, base_d, after_d, cost - STOCKOUT_USD_PER_UNIT * recovered
+
+
+def _pct(base, after):
+    base = base[:, None]
+    return np.where(base > 0, (base - after) / np.maximum(base, 1e-12) * 100.0, 0.0)
+
+
+def _prepare(snapshot: Any, bundle: Dict[str, Any]):
+    arr = snapshot if isinstance(snapshot, SnapshotArrays) else SnapshotArrays.from_snapshot(snapshot)
+    plans = bundle.get("plans") or []
+    fp = _footprint(arr, bundle.get("event") or {}) if plans else None
+    return arr, plans, fp
+
+
+def simulate_plans(snapshot: Any, bundle: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+    """
+    Per-plan "simulated" blocks for bundle["plans"], or None when the event
+    touches nothing in the snapshot. `snapshot` is a snapshot dict or SnapshotArrays.
+    """
+    arr, plans, fp = _prepare(snapshot, bundle)
+    if fp is None:
+        return None
+    wa, s, ra, f = fp
+    supply, delay, cost = _plan_levers(plans)
+    base_r, after_r, base_d, after_d, cost_delta = _evaluate(
+        arr.inventory[wa], arr.demand[wa][None, :], s, arr.latency[ra][None, :], f, supply, delay, cost)
+    risk_pct, delay_pct = _pct(base_r, after_r)[0], _pct(base_d, after_d)[0]
+    base_r, base_d, after_r, after_d, cost_delta = float(base_r[0]), float(base_d[0]), after_r[0], after_d[0], cost_delta[0]
+
+    out = []
+    for i, p in enumerate(plans):
+        out.append({
+            "stockout_risk_reduction_pct": round(float(risk_pct[i]), 1),
+            "delay_reduction_pct": round(float(delay_pct[i]), 1),
+            "cost_usd": p.get("cost_usd"),
+            "sla_expected_percent": p.get("sla_expected_percent"),
+            "cost_delta": round(float(cost_delta[i]), 2),
+            "risk_delta": round(base_r - float(after_r[i]), 4),
+            "delay_delta": round(base_d - float(after_d[i]), 2),
+            "baseline": {"risk": round(base_r, 4), "delay": round(base_d, 2)},
+            "after": {"risk": round(float(after_r[i]), 4), "delay": round(float(after_d[i]), 2)},
+            "affected": {"warehouses": int(len(wa)), "routes": int(len(ra))},
+        })
+    return out
+
+
+def _lognormal(rng, sigma: float, shape) -> np.ndarray:
+    """Mean-one multiplicative noise."""
+    if sigma <= 0:
+        return np.ones(shape)
+    return np.exp(rng.normal(-0.5 * sigma * sigma, sigma, shape))
+
+
+def _mc_batch(args) -> np.ndarray:
+    """One batch of trials -> (3, n, P): risk %, delay %, cost delta."""
+    inv, dem, s, lat, f, supply, delay, cost, n, sigmas, seq = args
+    demand_sigma, latency_sigma, severity_sigma = sigmas
+    rng = np.random.default_rng(seq)
+    d = dem * _lognormal(rng, demand_sigma, (n, dem.size))
+    l = lat * _lognormal(rng, latency_sigma, (n, lat.size))
+    sev = _lognormal(rng, severity_sigma, (n, 1))  # one disruption intensity per trial
+    base_r, after_r, base_d, after_d, cost_delta = _evaluate(
+        inv, d, np.minimum(s * sev, 1.0), l, f * sev, supply, delay, cost)
+    return np.stack([_pct(base_r, after_r), _pct(base_d, after_d), cost_delta])
+
+
+def monte_carlo(snapshot: Any, bundle: Dict[str, Any], trials: int = 2000, seed: int = 0,
+                demand_sigma: float = 0.15, latency_sigma: float = 0.2, severity_sigma: float = 0.25,
+                workers: Optional[int] = None) -> Optional[List[Dict[str, Any]]]:
+    """
+    Per-plan {"trials", "seed", metric: {"mean", "p5", "p95"}} for
+    stockout_risk_reduction_pct, delay_reduction_pct and cost_delta, or None
+    when the event touches nothing in the snapshot. workers=None picks
+    os.cpu_count() for large runs and stays inline otherwise; workers=1 forces inline.
+    """
+    arr, plans, fp = _prepare(snapshot, bundle)
+    if fp is None or trials <= 0:
+        return None
+    wa, s, ra, f = fp
+    supply, delay, cost = _plan_levers(plans)
+    sizes = [MC_BATCH] * (trials // MC_BATCH) + ([trials % MC_BATCH] if trials % MC_BATCH else [])
+    seqs = np.random.SeedSequence(seed).spawn(len(sizes))
+    inv, dem, lat = arr.inventory[wa], arr.demand[wa], arr.latency[ra]
+    sigmas = (demand_sigma, latency_sigma, severity_sigma)
+    tasks = [(inv, dem, s, lat, f, supply, delay, cost, n, sigmas, q)
+             for n, q in zip(sizes, seqs)]
+    if workers is None:
+        workers = (os.cpu_count() or 1) if trials >= MC_POOL_MIN_TRIALS else 1
+    workers = min(workers, len(tasks))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            parts = list(ex.map(_mc_batch, tasks))
+    else:
+        parts = [_mc_batch(t) for t in tasks]
+    samples = np.concatenate(parts, axis=1)                      # (3, trials, P)
+    mean = samples.mean(axis=1)
+    p5, p95 = np.percentile(samples, [5, 95], axis=1)
+
+    out = []
+    for i, p in enumerate(plans):
+        row: Dict[str, Any] = {"plan_id": p.get("id"), "trials": trials, "seed": seed}
+        for k, key in enumerate(("stockout_risk_reduction_pct", "delay_reduction_pct", "cost_delta")):
+            nd = 2 if key == "cost_delta" else 1
+            row[key] = {"mean": round(float(mean[k, i]), nd), "p5": round(float(p5[k, i]), nd),
+                        "p95": round(float(p95[k, i]), nd)}
+        out.append(row)
+    return out
@@ -0,0 +1,128 @@
+# hub/usage_logger.py
+"""
+Buffered ADT usage logger.
+
+log() only appends a (time, kind, count, note) tuple to an in-memory list;
+records are serialized and written when the buffer reaches max_records, when
+max_delay_s has passed since the oldest unflushed record, on flush(), and at
+interpreter exit. Each flush is one O_APPEND write under an exclusive flock on
+the log, so batches from concurrent processes never interleave. With
+background=True a writer thread does the time-based flushes and the hot path
+never touches the file.
+
+A forked child starts with an empty buffer so records are not written twice.
+"""
+import atexit
+import fcntl
+import json
+import os
+import threading
+import time
+from typing import List, Optional, Tuple
+
+KINDS = ("operation", "message", "query_unit")
+
+_Record = Tuple[float, str, int, str]
+
+
+def _note_json(cache, note: str) -> str:
+    cache[note] = json.dumps(note[:80] if note else "")
+    return cache[note]
+
+
+class UsageLogger:
+    def __init__(self, path: str, max_records: int = 256, max_delay_s: float = 1.0,
+                 background: bool = False):
+        self.path = path
+        self.max_records = max_records
+        self.max_delay_s = max_delay_s
+        self._buf: List[_Record] = []
+        self._first = 0.0               # wall time of the oldest buffered record
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = False
+        self._thread: Optional[threading.Thread] = None
+        self.flushes = 0
+        if background:
+            self._thread = threading.Thread(target=self._run, name="adt-usage-writer", daemon=True)
+            self._thread.start()
+        atexit.register(self.close)
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=self._after_fork)
+
+    def log(self, kind: str, count: int = 1, note: str = "") -> None:
+        if kind not in KINDS:
+            raise ValueError(f"invalid kind: {kind!r}")
+        # Coerce here, not in flush(): a record that cannot be formatted would
+        # stay at the head of the buffer and block every later flush.
+        count = int(count)
+        note = str(note) if note else ""
+        buf = self._buf  # never rebound, so appends cannot race a flush
+        t = time.time()
+        if not buf:
+            self._first = t
+        buf.append((t, kind, count, note))
+        if len(buf) >= self.max_records:
+            if self._thread is not None:
+                self._wake.set()
+            else:
+                self.flush()
+        elif self._thread is None and t - self._first >= self.max_delay_s:
+            self.flush()
+
+    def flush(self) -> int:
+        """Write buffered records; returns how many were written."""
+        with self._flush_lock:
+            n = len(self._buf)
+            if not n:
+                return 0
+            batch = self._buf[:n]
+            lines = []
+            stamps = {}  # one strftime per distinct second
+            notes = {"": '""'}
+            for t, kind, count, note in batch:
+                sec = int(t)
+                ts = stamps.get(sec)
+                if ts is None:
+                    ts = stamps[sec] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(sec))
+                # Same line json.dumps(rec) would produce; kind is from KINDS so needs no escaping.
+                lines.append('{"ts": "%s", "kind": "%s", "count": %d, "note": %s}\n'
+                             % (ts, kind, count, notes.get(note) or _note_json(notes, note)))
+            data = "".join(lines).encode("utf-8")
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view):]
+            finally:
+                os.close(fd)  # releases the flock
+            del self._buf[:n]  # only drop records once they are on disk
+            self.flushes += 1
+            return len(batch)
+
+    def _run(self) -> None:
+        while not self._stop:
+            self._wake.wait(self.max_delay_s)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception:
+                pass  # records stay buffered; the next flush retries them
+
+    def _after_fork(self) -> None:
+        del self._buf[:]
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        if self._thread is not None:
+            self._thread = threading.Thread(target=self._run, name="adt-usage-writer", daemon=True)
+            self._thread.start()
+
+    def close(self) -> None:
+        self._stop = True
+        if self._thread is not None:
+            self._wake.set()
+            self._thread.join(timeout=5)
+            self._thread = None
+        self.flush()
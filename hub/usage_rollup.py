@@ -0,0 +1,176 @@
+# hub/usage_rollup.py
+"""
+Rolling aggregates for the ADT usage log (audits/adt_usage.jsonl).
+
+Counters live in a SQLite sidecar next to the log: running totals per kind
+plus minute, hour and day buckets. sync() folds in only the lines appended
+since the last sync (tracked by byte offset), so the raw log is read once.
+totals(since, until) answers any window by summing whole days in the middle
+and hour/minute buckets at the edges: O(buckets), never the raw log. Bounds
+are floored to the minute, which is the finest bucket.
+"""
+import calendar
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+KINDS = ("operation", "message", "query_unit")
+RESOLUTIONS = (("d", 86400), ("h", 3600), ("m", 60))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS buckets (res TEXT, start INTEGER, kind TEXT, count INTEGER,
+                                    PRIMARY KEY (res, start, kind));
+CREATE TABLE IF NOT EXISTS totals (kind TEXT PRIMARY KEY, count INTEGER);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+"""
+
+Instant = Union[None, int, float, str]
+
+
+def rollup_path_for(log_path: str) -> str:
+    root, _ = os.path.splitext(log_path)
+    return root + ".rollup.sqlite"
+
+
+def to_epoch(ts: Instant) -> Optional[int]:
+    """Epoch seconds from an epoch number or an ISO 8601 'YYYY-MM-DDTHH:MM:SSZ' string."""
+    if ts is None or isinstance(ts, (int, float)):
+        return None if ts is None else int(ts)
+    return calendar.timegm(time.strptime(ts[:19], "%Y-%m-%dT%H:%M:%S"))
+
+
+def _empty() -> Dict[str, int]:
+    return {k: 0 for k in KINDS}
+
+
+class UsageRollup:
+    def __init__(self, log_path: str, db_path: Optional[str] = None):
+        self.log_path = log_path
+        self.db_path = db_path or rollup_path_for(log_path)
+        os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self.db = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.db.executescript(_SCHEMA)
+
+    def _meta(self, key: str, default: int = 0) -> int:
+        row = self.db.execute("SELECT value FROM meta WHERE key=?", (key,)).fetchone()
+        return int(row[0]) if row else default
+
+    def _reset(self) -> None:
+        for t in ("buckets", "totals", "meta"):
+            self.db.execute(f"DELETE FROM {t}")
+
+    def _add(self, records: Iterable[Tuple[int, str, int]]) -> None:
+        """Fold (epoch, kind, count) records into the counters (no raw-log bookkeeping)."""
+        per_bucket: Dict[Tuple[str, int, str], int] = {}
+        per_kind: Dict[str, int] = {}
+        for ts, kind, count in records:
+            per_kind[kind] = per_kind.get(kind, 0) + count
+            for res, width in RESOLUTIONS:
+                key = (res, ts - ts % width, kind)
+                per_bucket[key] = per_bucket.get(key, 0) + count
+        self.db.executemany(
+            "INSERT INTO buckets VALUES (?,?,?,?) "
+            "ON CONFLICT(res, start, kind) DO UPDATE SET count = count + excluded.count",
+            [(r, s, k, c) for (r, s, k), c in per_bucket.items()])
+        self.db.executemany(
+            "INSERT INTO totals VALUES (?,?) ON CONFLICT(kind) DO UPDATE SET count = count + excluded.count",
+            list(per_kind.items()))
+
+    def sync(self) -> int:
+        """Fold log lines appended since the last sync; returns the number of records added."""
+        if not os.path.exists(self.log_path):
+            return 0
+        with self._lock, self.db:
+            st = os.stat(self.log_path)
+            offset = self._meta("offset")
+            if self._meta("inode", st.st_ino) != st.st_ino or st.st_size < offset:
+                self._reset()  # log replaced or truncated: recount from scratch
+                offset = 0
+            recs: List[Tuple[int, str, int]] = []
+            with open(self.log_path, "rb") as f:
+                f.seek(offset)
+                for raw in f:
+                    if not raw.endswith(b"\n"):
+                        break  # partial trailing write
+                    offset += len(raw)
+                    try:
+                        obj = json.loads(raw)
+                        kind, count, ts = obj.get("kind"), int(obj.get("count", 0)), to_epoch(obj["ts"])
+                    except Exception:
+                        continue
+                    if kind in KINDS and ts is not None:
+                        recs.append((ts, kind, count))
+            self._add(recs)
+            self.db.execute("INSERT OR REPLACE INTO meta VALUES ('offset', ?)", (str(offset),))
+            self.db.execute("INSERT OR REPLACE INTO meta VALUES ('inode', ?)", (str(st.st_ino),))
+            return len(recs)
+
+    def _sum(self, res: str, a: int, b: int, out: Dict[str, int]) -> None:
+        if a >= b:
+            return
+        rows = self.db.execute(
+            "SELECT kind, SUM(count) FROM buckets WHERE res=? AND start>=? AND start<? GROUP BY kind",
+            (res, a, b))
+        for kind, c in rows:
+            if kind in out:
+                out[kind] += int(c)
+
+    def totals(self, since: Instant = None, until: Instant = None, sync: bool = True) -> Dict[str, int]:
+        """Exact totals for [since, until) (minute-floored); all-time when both are None."""
+        if sync:
+            self.sync()
+        out = _empty()
+        with self._lock:
+            if since is None and until is None:
+                for kind, c in self.db.execute("SELECT kind, count FROM totals"):
+                    if kind in out:
+                        out[kind] = int(c)
+                return out
+            a = to_epoch(since) if since is not None else 0
+            b = to_epoch(until) if until is not None else int(time.time()) + 60
+            a, b = a - a % 60, b - b % 60
+            # Coarsest buckets in the middle, finer ones at each edge.
+            lo, hi = a, b
+            for fine, width in (("m", 3600), ("h", 86400)):
+                up = min(hi, -(-lo // width) * width)
+                down = max(up, hi - hi % width)
+                self._sum(fine, lo, up, out)
+                self._sum(fine, down, hi, out)
+                lo, hi = up, down
+            self._sum("d", lo, hi, out)
+            return out
+
+    def series(self, res: str = "h", since: Instant = None, until: Instant = None) -> List[Dict[str, int]]:
+        """Bucketed counts at one resolution ('m', 'h' or 'd'), oldest first."""
+        if res not in dict(RESOLUTIONS):
+            raise ValueError("res must be 'm', 'h' or 'd'")
+        self.sync()
+        a = to_epoch(since) if since is not None else 0
+        b = to_epoch(until) if until is not None else 2 ** 62
+        rows = self.db.execute(
+            "SELECT start, kind, count FROM buckets WHERE res=? AND start>=? AND start<? ORDER BY start",
+            (res, a, b))
+        series: Dict[int, Dict[str, int]] = {}
+        for start, kind, c in rows:
+            series.setdefault(start, dict(_empty(), start=start))[kind] = int(c)
+        return list(series.values())
+
+    def close(self) -> None:
+        self.db.close()
+
+
+_rollups: Dict[str, UsageRollup] = {}
+_rollups_lock = threading.Lock()
+
+
+def get_rollup(log_path: str) -> UsageRollup:
+    key = os.path.abspath(log_path)
+    with _rollups_lock:
+        r = _rollups.get(key)
+        if r is None:
+            r = _rollups[key] = UsageRollup(log_path)
+        return r
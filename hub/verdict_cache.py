@@ -0,0 +1,178 @@
+# hub/verdict_cache.py
+"""
+Shared verdict cache keyed by (policy_hash, namespace, canonical plan SHA-256).
+
+Tier 1 is an in-process LRU; tier 2 is an opt-in SQLite file
+(ACM_VERDICT_CACHE_DB) so separate script processes share verdicts. Plan keys
+leave out per-generation stamps (VOLATILE_FIELDS). Both tiers are dropped when
+policies/policy.lock changes on disk. `namespace` separates verdict shapes
+from different checkers (z3, check_plan, ...).
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from hub.policy_revision import Plan, Policy, Verdict, check_plan
+
+LOCK_PATH = "policies/policy.lock"
+# The on-disk tier is opt-in: set ACM_VERDICT_CACHE_DB (e.g. data/verdict_cache.sqlite) to enable it.
+DISK_PATH = os.environ.get("ACM_VERDICT_CACHE_DB") or None
+# Plan fields stamped per generation; they never change a verdict, so they stay out of the key.
+VOLATILE_FIELDS = ("ts",)
+
+_MISSING = object()
+
+
+def canonical_digest(obj: Any) -> str:
+    """SHA-256 over sorted-key compact JSON (same canonical form as the audit chain)."""
+    data = json.dumps(obj, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")
+    return hashlib.sha256(data).hexdigest()
+
+
+def plan_digest(plan: Any) -> str:
+    """canonical_digest of a plan without its VOLATILE_FIELDS, so a regenerated plan hits."""
+    if isinstance(plan, dict):
+        plan = {k: v for k, v in plan.items() if k not in VOLATILE_FIELDS}
+    return canonical_digest(plan)
+
+
+def _stat_sig(path: str) -> Optional[Tuple[int, int, int]]:
+    try:
+        st = os.stat(path)
+        return (st.st_ino, st.st_size, st.st_mtime_ns)
+    except OSError:
+        return None
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+    size: int = 0
+
+
+class VerdictCache:
+    def __init__(self, maxsize: int = 65536, disk_path: Optional[str] = None,
+                 lock_path: str = LOCK_PATH):
+        self.maxsize = maxsize
+        self.disk_path = disk_path or None
+        self.lock_path = lock_path
+        self._mem: "OrderedDict[Tuple[str, str, str], Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._lock_sig = _stat_sig(lock_path)
+        self.stats = CacheStats()
+
+    # -- disk tier --
+    def _db(self) -> Optional[sqlite3.Connection]:
+        if not self.disk_path:
+            return None
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            os.makedirs(os.path.dirname(self.disk_path) or ".", exist_ok=True)
+            conn = sqlite3.connect(self.disk_path, timeout=30.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS verdicts (policy_hash TEXT, namespace TEXT, digest TEXT, "
+                "value TEXT, PRIMARY KEY (policy_hash, namespace, digest))"
+            )
+            self._local.conn = conn
+        return conn
+
+    def _check_lock(self) -> None:
+        sig = _stat_sig(self.lock_path)
+        if sig != self._lock_sig:
+            self._lock_sig = sig
+            self._invalidate_locked()
+
+    def _invalidate_locked(self) -> None:
+        self._mem.clear()
+        self.stats.invalidations += 1
+        self.stats.size = 0
+        db = self._db()
+        if db is not None:
+            db.execute("DELETE FROM verdicts")
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._invalidate_locked()
+
+    def get(self, policy_hash: str, namespace: str, digest: str, default: Any = None) -> Any:
+        key = (policy_hash, namespace, digest)
+        with self._lock:
+            self._check_lock()
+            val = self._mem.get(key, _MISSING)
+            if val is not _MISSING:
+                self._mem.move_to_end(key)
+                self.stats.hits += 1
+                return val
+            db = self._db()
+            if db is not None:
+                row = db.execute(
+                    "SELECT value FROM verdicts WHERE policy_hash=? AND namespace=? AND digest=?", key
+                ).fetchone()
+                if row:
+                    val = json.loads(row[0])
+                    self._put_mem(key, val)
+                    self.stats.disk_hits += 1
+                    return val
+            self.stats.misses += 1
+            return default
+
+    def _put_mem(self, key: Tuple[str, str, str], value: Any) -> None:
+        self._mem[key] = value
+        self._mem.move_to_end(key)
+        while len(self._mem) > self.maxsize:
+            self._mem.popitem(last=False)
+        self.stats.size = len(self._mem)
+
+    def put(self, policy_hash: str, namespace: str, digest: str, value: Any) -> None:
+        """`value` must be JSON-serializable when the disk tier is enabled."""
+        key = (policy_hash, namespace, digest)
+        with self._lock:
+            self._put_mem(key, value)
+            db = self._db()
+            if db is not None:
+                db.execute("INSERT OR REPLACE INTO verdicts VALUES (?,?,?,?)", key + (json.dumps(value),))
+
+    def get_or_compute(self, policy_hash: str, namespace: str, plan: Any,
+                       compute: Callable[[], Any]) -> Any:
+        digest = plan_digest(plan)
+        val = self.get(policy_hash, namespace, digest, _MISSING)
+        if val is _MISSING:
+            val = compute()
+            self.put(policy_hash, namespace, digest, val)
+        return val
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return asdict(self.stats)
+
+
+_cache: Optional[VerdictCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_cache() -> VerdictCache:
+    """Process-wide cache; the disk tier is on only when ACM_VERDICT_CACHE_DB is set."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = VerdictCache(disk_path=DISK_PATH)
+        return _cache
+
+
+def cached_check_plan(policy: Policy, plan: Plan, cache: Optional[VerdictCache] = None) -> Verdict:
+    """check_plan through the verdict cache (policy hash = digest of the Policy fields)."""
+    cache = cache or get_cache()
+    val = cache.get_or_compute(canonical_digest(asdict(policy)), "check_plan", asdict(plan),
+                               lambda: asdict(check_plan(policy, plan)))
+    return Verdict(**val)
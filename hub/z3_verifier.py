@@ -0,0 +1,222 @@
+# hub/z3_verifier.py
+"""
+Long-lived Z3 verifier for policies/base.yaml.
+
+The policy constraints are asserted once per policy hash, each guarded by an
+assumption literal. A plan is checked by binding its fields inside push/pop
+and calling check() with the literals; the unsat core names the violated
+constraints. A constraint over a field the plan does not carry (bundle plans
+have no latency, endpoint or stockout fields) is not assumed at all: it is
+reported as "unchecked", never as satisfied. The solver is rebuilt only when policies/policy.lock or the
+policy file changes on disk and the canonical hash actually moves.
+"""
+import os
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from hub.policy_hash import policy_hash
+from hub.verdict_cache import get_cache
+
+POLICY_PATH = "policies/base.yaml"
+LOCK_PATH = "policies/policy.lock"
+
+# plan field aliases across bundle plans and plan_*.json files
+FIELDS = {
+    "cost": ("cost_usd",),
+    "sla": ("sla_pct", "sla_expected_percent"),
+    "latency": ("latency_ms",),
+    "delay": ("delay_minutes", "expected_delay_minutes"),
+    "stockout": ("stockout_risk",),
+    "region": ("region", "region_data_boundary"),
+    "endpoint": ("endpoint",),
+    "pii": ("pii_access",),
+}
+
+
+# field each rule constrains; a rule whose field the plan lacks is skipped and reported as unchecked
+RULE_FIELDS = {
+    "budget_cap": "cost", "sla_min": "sla", "latency_max": "latency", "delay_max": "delay",
+    "stockout_max": "stockout", "jurisdiction": "region", "region_mismatch": "region",
+    "endpoint": "endpoint", "pii_access": "pii",
+}
+
+
+def _field(plan: Dict[str, Any], name: str) -> Any:
+    for key in FIELDS[name]:
+        if key in plan and plan[key] is not None:
+            return plan[key]
+    return None
+
+
+def _stat_sig(path: str) -> Optional[Tuple[int, int, int]]:
+    try:
+        st = os.stat(path)
+        return (st.st_ino, st.st_size, st.st_mtime_ns)
+    except OSError:
+        return None
+
+
+def load_constraints(policy_path: str = POLICY_PATH) -> Dict[str, Any]:
+    import yaml
+    with open(policy_path, "r", encoding="utf-8") as f:
+        doc = yaml.safe_load(f) or {}
+    return doc.get("constraints", {}) or {}
+
+
+class _Encoded:
+    """One solver with the policy asserted under assumption literals."""
+
+    def __init__(self, constraints: Dict[str, Any]):
+        import z3
+        self.z3 = z3
+        self.solver = z3.Solver()
+        self.codes: Dict[str, int] = {}
+        self.vars = {
+            "cost": z3.Real("cost"), "sla": z3.Real("sla"), "latency": z3.Real("latency"),
+            "delay": z3.Real("delay"), "stockout": z3.Real("stockout"),
+            "region": z3.Int("region"), "endpoint": z3.Int("endpoint"), "pii": z3.Bool("pii"),
+        }
+        v = self.vars
+        risk = constraints.get("risk_thresholds", {}) or {}
+        egress = constraints.get("data_egress_rules", {}) or {}
+        rules: List[Tuple[str, Any]] = []
+        if "budget_cap_usd" in constraints:
+            rules.append(("budget_cap", v["cost"] <= float(constraints["budget_cap_usd"])))
+        if "min_sla_percent" in constraints:
+            rules.append(("sla_min", v["sla"] >= float(constraints["min_sla_percent"])))
+        if "max_latency_ms" in constraints:
+            rules.append(("latency_max", v["latency"] <= float(constraints["max_latency_ms"])))
+        if "max_delay_minutes" in risk:
+            rules.append(("delay_max", v["delay"] <= float(risk["max_delay_minutes"])))
+        if "max_stockout_risk" in risk:
+            rules.append(("stockout_max", v["stockout"] <= float(risk["max_stockout_risk"])))
+        if constraints.get("allowed_jurisdictions"):
+            rules.append(("jurisdiction", z3.Or([v["region"] == self.code(j)
+                                                 for j in constraints["allowed_jurisdictions"]])))
+        if egress.get("non_eu_egress_allowed") is False:
+            rules.append(("region_mismatch", v["region"] == self.code("EU")))
+        if egress.get("permitted_endpoints"):
+            rules.append(("endpoint", z3.Or([v["endpoint"] == self.code(e)
+                                             for e in egress["permitted_endpoints"]])))
+        rules.append(("pii_access", z3.Not(v["pii"])))
+
+        self.literals = []
+        self.names: Dict[str, str] = {}
+        for name, expr in rules:
+            lit = z3.Bool(f"p_{name}")
+            self.solver.add(z3.Implies(lit, expr))
+            self.literals.append(lit)
+            self.names[str(lit)] = name
+
+    def code(self, label: Any) -> int:
+        return self.codes.setdefault(str(label), len(self.codes))
+
+    def check(self, plan: Dict[str, Any]) -> Tuple[bool, List[str], List[str]]:
+        """(sat, violated, unchecked): sat covers only the constraints whose fields the plan has."""
+        z3, v, s = self.z3, self.vars, self.solver
+        s.push()
+        try:
+            present = set()
+            for name in ("cost", "sla", "latency", "delay", "stockout"):
+                val = _field(plan, name)
+                if val is not None:
+                    s.add(v[name] == z3.RealVal(str(float(val))))
+                    present.add(name)
+            for name in ("region", "endpoint"):
+                val = _field(plan, name)
+                if val is not None:
+                    s.add(v[name] == self.code(val))
+                    present.add(name)
+            val = _field(plan, "pii")
+            if val is not None:
+                s.add(v["pii"] == bool(val))
+                present.add("pii")
+            unchecked = [self.names[str(lit)] for lit in self.literals
+                         if RULE_FIELDS[self.names[str(lit)]] not in present]
+            # Peel unsat cores until the remaining assumptions are SAT, so
+            # every violated constraint is reported, not just the first core.
+            active = [lit for lit in self.literals if RULE_FIELDS[self.names[str(lit)]] in present]
+            violated: List[str] = []
+            while active and s.check(*active) != z3.sat:
+                core = {str(c) for c in s.unsat_core()}
+                if not core:
+                    break
+                violated.extend(self.names[c] for c in core)
+                active = [lit for lit in active if str(lit) not in core]
+            return not violated, violated, unchecked
+        finally:
+            s.pop()
+
+
+class IncrementalVerifier:
+    """Process-wide verifier; thread-safe (Z3 calls are serialized per instance)."""
+
+    def __init__(self, policy_path: str = POLICY_PATH, lock_path: str = LOCK_PATH):
+        self.policy_path = policy_path
+        self.lock_path = lock_path
+        self._lock = threading.Lock()
+        self._sig: Optional[Tuple[Any, Any]] = None
+        self._hash: Optional[str] = None
+        self._encoded: Optional[_Encoded] = None
+        self.rebuilds = 0
+
+    def _refresh(self) -> None:
+        sig = (_stat_sig(self.lock_path), _stat_sig(self.policy_path))
+        if sig == self._sig and self._encoded is not None:
+            return
+        h = policy_hash(self.policy_path)
+        if h != self._hash or self._encoded is None:
+            self._encoded = _Encoded(load_constraints(self.policy_path))
+            self._hash = h
+            self.rebuilds += 1
+        self._sig = sig
+
+    @property
+    def policy_hash(self) -> str:
+        with self._lock:
+            self._refresh()
+            return self._hash  # type: ignore[return-value]
+
+    def _check_now(self, plan: Dict[str, Any]) -> Tuple[bool, List[str], List[str]]:
+        with self._lock:
+            self._refresh()
+            return self._encoded.check(plan)  # type: ignore[union-attr]
+
+    def check_detail(self, plan: Dict[str, Any], use_cache: bool = True) -> Tuple[bool, List[str], List[str]]:
+        """Return (sat, violated, unchecked) for one plan dict; unchecked constraints are not part of sat."""
+        if not use_cache:
+            return self._check_now(plan)
+        ok, violated, unchecked = get_cache().get_or_compute(
+            self.policy_hash, "z3.detail", plan, lambda: list(self._check_now(plan)))
+        return bool(ok), list(violated), list(unchecked)
+
+    def check(self, plan: Dict[str, Any], use_cache: bool = True) -> Tuple[bool, List[str]]:
+        """Return (sat, violated constraint names) for one plan dict; see check_detail for unchecked ones."""
+        return self.check_detail(plan, use_cache)[:2]  # type: ignore[return-value]
+
+    def verify_bundle(self, bundle: Dict[str, Any]) -> List[Dict[str, Any]]:
+        rows: List[Dict[str, Any]] = []
+        for p in bundle.get("plans", []):
+            ok, violated, unchecked = self.check_detail(p)
+            rows.append({
+                "plan_id": p.get("id") or p.get("plan_id"),
+                "strategy": p.get("strategy"),
+                "sat": ok,
+                "counterexample": None if ok else ", ".join(sorted(violated)),
+                "unchecked": unchecked,  # constraints on fields the plan lacks: not verified
+                "via": "z3",
+            })
+        return rows
+
+
+_verifiers: Dict[Tuple[str, str], IncrementalVerifier] = {}
+_verifiers_lock = threading.Lock()
+
+
+def get_verifier(policy_path: str = POLICY_PATH, lock_path: str = LOCK_PATH) -> IncrementalVerifier:
+    key = (os.path.abspath(policy_path), os.path.abspath(lock_path))
+    with _verifiers_lock:
+        v = _verifiers.get(key)
+        if v is None:
+            v = _verifiers[key] = IncrementalVerifier(policy_path, lock_path)
+        return v
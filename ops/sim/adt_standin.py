@@ -0,0 +1,26 @@
+import argparse, os, sys
+
+# Ensure repo root (two levels above ops/sim/) is on sys.path so hub/* imports resolve
+repo_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if repo_root not in sys.path:
+    sys.path.insert(0, repo_root)
+
+from hub.adt_standin import AdtStandIn
+
+def main():
+    ap = argparse.ArgumentParser(description="Local ADT stand-in (twin GET/PUT/PATCH/DELETE).")
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("--latency-ms", type=float, default=0.0, help="added delay per request")
+    ap.add_argument("--reject-every", type=int, default=0, help="answer every n-th request with 429")
+    args = ap.parse_args()
+    srv = AdtStandIn(port=args.port, latency_ms=args.latency_ms, reject_every=args.reject_every)
+    print(f"ADT stand-in on {srv.endpoint} (ADT_INSTANCE_URL={srv.endpoint} python ops/sim/update_adt.py)")
+    try:
+        srv.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        srv.server_close()
+
+if __name__ == "__main__":
+    main()
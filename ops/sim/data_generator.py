@@ -1,37 +1,76 @@
-import csv, os, random, hashlib
-from datetime import datetime, timezone, timedelta
-
-# Output file path
-OUT = os.path.join("data", "signals.csv")
-# Fixed seed for deterministic reproducible outputs
-SEED = int(hashlib.sha256(b"ACM-day5-seed").hexdigest(), 16) % (2**32)
-
-def main():
-    random.seed(SEED)
-    rows = []
-    t0 = datetime.now(timezone.utc).replace(second=0, microsecond=0)
-    # 6 ticks, 5‑minute spacing
-    for i in range(6):
-        ts = (t0 + timedelta(minutes=5*i)).isoformat()
-        warehouse = "W3"
-        route = "R7"
-        risk = max(0.0, min(1.0, round(random.uniform(0.55, 0.68), 2)))
-        delay = int(random.uniform(10, 22))
-        cost = int(random.uniform(5800, 6800))
-        rows.append([ts, warehouse, route, risk, delay, cost])
-
-    # CSV header
-    header = ["timestamp", "warehouse", "route", "risk", "delay_minutes", "cost_delta"]
-    write_header = not os.path.exists(OUT)
-
-    os.makedirs(os.path.dirname(OUT), exist_ok=True)
-    with open(OUT, "a", newline="") as f:
-        w = csv.writer(f)
-        if write_header:
-            w.writerow(header)
-        w.writerows(rows)
-
-    print(f"✅ Wrote {len(rows)} rows to {OUT}")
-
-if __name__ == "__main__":
-    main()
+"""
+Synthetic signal data.
+
+With no arguments: append six W3/R7 rows to the signal store
+(data/signal_store, the demo feed; a new store first imports data/signals.csv).
+With --warehouses/--routes/--days/--storms: write a full seeded scenario
+(topology.json, storms.json, events.jsonl, signals.csv, manifest.json) to
+--out via hub.scenario_gen, streaming signals one hour at a time; --store DIR
+also imports its signals into a signal store.
+"""
+import argparse, os, random, hashlib, json, sys
+from datetime import datetime, timezone, timedelta
+
+# Ensure repo root (two levels above ops/sim/) is on sys.path so hub/* imports resolve
+repo_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if repo_root not in sys.path:
+    sys.path.insert(0, repo_root)
+
+from hub.signal_store import SignalStore, import_csv, open_store
+
+# Fixed seed for deterministic reproducible outputs
+SEED = int(hashlib.sha256(b"ACM-day5-seed").hexdigest(), 16) % (2**32)
+
+def demo_rows():
+    random.seed(SEED)
+    rows = []
+    t0 = datetime.now(timezone.utc).replace(second=0, microsecond=0)
+    # 6 ticks, 5‑minute spacing
+    for i in range(6):
+        ts = (t0 + timedelta(minutes=5*i)).isoformat()
+        warehouse = "W3"
+        route = "R7"
+        risk = max(0.0, min(1.0, round(random.uniform(0.55, 0.68), 2)))
+        delay = int(random.uniform(10, 22))
+        cost = int(random.uniform(5800, 6800))
+        rows.append([ts, warehouse, route, risk, delay, cost])
+
+    store = open_store()
+    store.append(rows)
+    print(f"✅ Wrote {len(rows)} rows to {store.root}")
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--warehouses", type=int)
+    ap.add_argument("--routes", type=int, help="default: 2 x warehouses")
+    ap.add_argument("--days", type=float, default=1.0)
+    ap.add_argument("--storms", type=int, default=0)
+    ap.add_argument("--interval", type=int, default=5, help="minutes between ticks; must divide 60")
+    ap.add_argument("--seed", type=int, default=SEED)
+    ap.add_argument("--start", help="ISO start time (default 2025-01-01T00:00:00+00:00)")
+    ap.add_argument("--out", default=os.path.join("data", "scenarios", "default"))
+    ap.add_argument("--store", help="also import the scenario signals into this signal store")
+    args = ap.parse_args(argv)
+    if args.warehouses is None:
+        demo_rows()
+        return
+    from hub.scenario_gen import check_interval, write_scenario
+    if args.warehouses < 2:
+        ap.error("--warehouses must be at least 2 (routes link distinct warehouses)")
+    if args.routes is not None and args.routes < 1:
+        ap.error("--routes must be at least 1")
+    try:
+        check_interval(args.interval)
+    except ValueError as e:
+        ap.error(f"--interval: {e}")
+    start = datetime.fromisoformat(args.start) if args.start else None
+    manifest = write_scenario(args.out, args.warehouses, args.routes or 2 * args.warehouses, args.days,
+                              args.storms, args.seed, args.interval, start)
+    print(json.dumps(manifest, indent=2))
+    if args.store:
+        n = import_csv(os.path.join(args.out, "signals.csv"), SignalStore(args.store))
+        print(f"✅ Imported {n} signals into {args.store}")
+    print(f"✅ Wrote scenario to {args.out}")
+
+if __name__ == "__main__":
+    main()
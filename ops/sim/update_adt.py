@@ -1,39 +1,58 @@
-import csv, os, subprocess, time
+import argparse, json, os, sys, subprocess
+
+# Ensure repo root (two levels above ops/sim/) is on sys.path so hub/* imports resolve
+repo_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if repo_root not in sys.path:
+    sys.path.insert(0, repo_root)
+
+from hub.adt_client import AdtClient, cli_token_provider
+from hub.signal_store import open_store
 
 ADT_NAME = "acm-day3-adt-9427"
 RG = "acm-day3-rg"
 TWIN_ID = "thermo1"
-CSV_PATH = os.path.join("data", "signals.csv")
 
-def az(*args):
-    cmd = ["az"] + list(args)
-    out = subprocess.check_output(cmd, text=True)
-    return out
+def resolve_endpoint() -> str:
+    """ADT_INSTANCE_URL, else the instance host name from one `az dt show` call."""
+    url = os.getenv("ADT_INSTANCE_URL")
+    if url:
+        return url
+    host = subprocess.check_output(
+        ["az", "dt", "show", "-n", ADT_NAME, "-g", RG, "--query", "hostName", "-o", "tsv"], text=True).strip()
+    return f"https://{host}"
 
-def update_temperature(value: float):
-    patch = f'[{{"op":"replace","path":"/temperature","value":{value}}}]'
-    az("dt", "twin", "update",
-       "-n", ADT_NAME,
-       "-g", RG,
-       "--twin-id", TWIN_ID,
-       "--json-patch", patch)
+def temperature_patch(row) -> list:
+    temp = round(20 + float(row["risk"]) * 40, 1)
+    # "add" upserts the property, so a fresh twin (or the local stand-in) accepts it too
+    return [{"op": "add", "path": "/temperature", "value": temp}]
 
 def main():
-    if not os.path.exists(CSV_PATH):
-        raise SystemExit(f"❌ Missing {CSV_PATH} — run data_generator.py first!")
-
-    with open(CSV_PATH, newline="") as f:
-        rows = list(csv.DictReader(f))
-
-    window = rows[-3:] if len(rows) >= 3 else rows
-
-    for row in window:
-        risk = float(row["risk"])
-        temp = round(20 + risk * 40, 1)
-        update_temperature(temp)
-        print(f"🌡 Updated {TWIN_ID}.temperature -> {temp}")
-        time.sleep(1)
+    ap = argparse.ArgumentParser(description="Push the latest signal rows to ADT twins.")
+    ap.add_argument("--rows", type=int, default=3, help="trailing signal rows to apply (default 3)")
+    ap.add_argument("--endpoint", help="ADT endpoint (default: ADT_INSTANCE_URL or `az dt show`)")
+    ap.add_argument("--rate", type=float, default=20.0, help="max requests per second")
+    ap.add_argument("--connections", type=int, default=4)
+    args = ap.parse_args()
+
+    store = open_store()  # a new store imports data/signals.csv first
+    if not store.days():
+        raise SystemExit(f"❌ No signals in {store.root} — run data_generator.py first!")
+    window = store.rows(store.tail(args.rows))
+
+    endpoint = args.endpoint or resolve_endpoint()
+    # Real ADT needs a bearer token; the local stand-in (http://) does not.
+    provider = cli_token_provider() if endpoint.startswith("https://") and not os.getenv("ADT_TOKEN") else None
+    updates = [(TWIN_ID, temperature_patch(row)) for row in window]
+    with AdtClient(endpoint, token_provider=provider, max_connections=args.connections,
+                   rate_per_s=args.rate) as client:
+        report = client.update_many(updates)
+
+    for twin_id, err in report.failed.items():
+        print(f"❌ {twin_id}: {err}", file=sys.stderr)
+    if updates and not report.failed:
+        print(f"🌡 Updated {TWIN_ID}.temperature -> {updates[-1][1][0]['value']}")
+    print(json.dumps(report.summary()))
+    sys.exit(1 if report.failed else 0)
 
 if __name__ == "__main__":
     main()
-
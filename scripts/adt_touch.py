@@ -1,6 +1,10 @@
 import os, json, sys, time
 from datetime import datetime, timezone
 
+# Ensure repo root (parent of scripts/) is on sys.path so hub/* imports resolve
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from hub.artifact_index import get_index
+
 # Guard: skip if env not set (so Codespaces doesn't fail)
 ADT_INSTANCE_URL = os.getenv("ADT_INSTANCE_URL")  # e.g., https://<your-adt>.api.<region>.digitaltwins.azure.net
 RUN_ADT_TOUCH = os.getenv("RUN_ADT_TOUCH", "false").lower() == "true"
@@ -12,10 +16,10 @@ OUT_PATH = "audits/day13_adt_usage.json"
 def utc_now():
     return datetime.now(timezone.utc).isoformat()
 
-def latest_file(glob_pat):
-    import glob
-    files = sorted(glob.glob(glob_pat), key=os.path.getmtime)
-    return files[-1] if files else None
+def latest_file(kind):
+    """Newest event/bundle/sim from the artifact manifest (no directory scan)."""
+    path = get_index().latest_path(kind)
+    return str(path) if path else None
 
 def main():
     usage = {
@@ -1,11 +1,24 @@
 #!/usr/bin/env python3
-import json, time, pathlib, threading
+import os, sys, json, pathlib
+
+# Ensure repo root (parent of scripts/) is on sys.path so hub/* imports resolve
+repo_root = pathlib.Path(__file__).resolve().parent.parent
+if str(repo_root) not in sys.path:
+    sys.path.insert(0, str(repo_root))
+
+from hub.usage_logger import UsageLogger
+from hub.usage_rollup import get_rollup
 
-_lock = threading.Lock()
 USAGE_FILE = pathlib.Path("audits/adt_usage.jsonl")
 
-def _now():
-    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+# Buffered, flock-protected appends; flushed on size/time and at exit.
+# ADT_USAGE_BACKGROUND=1 moves time-based flushes to a writer thread.
+_logger = UsageLogger(
+    str(USAGE_FILE),
+    max_records=int(os.environ.get("ADT_USAGE_MAX_RECORDS", "256")),
+    max_delay_s=float(os.environ.get("ADT_USAGE_MAX_DELAY_S", "1.0")),
+    background=os.environ.get("ADT_USAGE_BACKGROUND") == "1",
+)
 
 def log_op(kind: str, count: int = 1, note: str = ""):
     """
@@ -13,39 +26,44 @@ def log_op(kind: str, count: int = 1, note: str = ""):
     count: integer increment
     note: optional short string
     """
-    assert kind in ("operation", "message", "query_unit"), "invalid kind"
-    rec = {
-        "ts": _now(),
-        "kind": kind,
-        "count": int(count),
-        "note": note[:80] if note else ""
-    }
-    USAGE_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with _lock:
-        with USAGE_FILE.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(rec) + "\n")
-
-def summarize(last_n: int = 200):
+    _logger.log(kind, count, note)
+
+def flush():
+    """Write any buffered usage records now."""
+    return _logger.flush()
+
+def summarize(since=None, until=None):
     """
-    Read the last N entries and reduce to totals.
+    Usage totals from the rolling aggregates (audits/adt_usage.rollup.sqlite).
+    since/until: optional epoch seconds or ISO 'YYYY-MM-DDTHH:MM:SSZ'; window is
+    [since, until), minute-floored. Both None -> all-time totals.
     Returns dict like {"operation": X, "message": Y, "query_unit": Z}
     """
-    totals = {"operation": 0, "message": 0, "query_unit": 0}
-    if not USAGE_FILE.exists():
-        return totals
-    lines = USAGE_FILE.read_text(encoding="utf-8").splitlines()[-last_n:]
-    for s in lines:
-        try:
-            obj = json.loads(s)
-            k = obj.get("kind")
-            c = int(obj.get("count", 0))
-            if k in totals:
-                totals[k] += c
-        except Exception:
-            continue
-    return totals
+    _logger.flush()
+    return get_rollup(str(USAGE_FILE)).totals(since, until)
+
+def series(res: str = "h", since=None, until=None):
+    """Per-bucket counts at 'm', 'h' or 'd' resolution, oldest first."""
+    _logger.flush()
+    return get_rollup(str(USAGE_FILE)).series(res, since, until)
 
 if __name__ == "__main__":
-    # quick manual test
-    log_op("operation")
-    print(json.dumps(summarize(), indent=2))
+    import argparse
+    ap = argparse.ArgumentParser(description="ADT usage accounting")
+    sub = ap.add_subparsers(dest="cmd")
+    for name in ("summarize", "series"):
+        p = sub.add_parser(name)
+        p.add_argument("--since", help="epoch seconds or ISO time; floored to the minute")
+        p.add_argument("--until", help="exclusive; floored to the minute, so sub-minute windows are inexact")
+        if name == "series":
+            p.add_argument("--res", choices=("m", "h", "d"), default="h")
+    sub.add_parser("log").add_argument("kind", nargs="?", default="operation")
+    args = ap.parse_args()
+    if args.cmd == "series":
+        print(json.dumps(series(args.res, args.since, args.until), indent=2))
+    elif args.cmd == "summarize":
+        print(json.dumps(summarize(args.since, args.until), indent=2))
+    else:
+        # quick manual test
+        log_op(getattr(args, "kind", None) or "operation")
+        print(json.dumps(summarize(), indent=2))
@@ -1,35 +1,13 @@
 #!/usr/bin/env python3
-import json, sys, os, hashlib, time
+import json, sys, os
+from pathlib import Path
 
-CHAIN_FILE = "audit_chain.jsonl"
-HEAD_FILE = "artifacts/chain_head.json"
+# Ensure repo root (parent of scripts/) is on sys.path so hub/* imports resolve
+repo_root = Path(__file__).resolve().parent.parent
+if str(repo_root) not in sys.path:
+    sys.path.insert(0, str(repo_root))
 
-def sha256_bytes(b: bytes) -> str:
-    return hashlib.sha256(b).hexdigest()
-
-def sha256_json(obj) -> str:
-    data = json.dumps(obj, sort_keys=True, separators=(",", ":")).encode("utf-8")
-    return sha256_bytes(data)
-
-def now_iso():
-    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
-
-def read_head():
-    if not os.path.exists(HEAD_FILE):
-        return {"head": None}
-    with open(HEAD_FILE, "r") as f:
-        return json.load(f)
-
-def write_head(head_hash: str):
-    os.makedirs(os.path.dirname(HEAD_FILE), exist_ok=True)
-    with open(HEAD_FILE, "w") as f:
-        json.dump({"head": head_hash, "updated_at": now_iso()}, f, indent=2)
-
-def append_line(line: str):
-    with open(CHAIN_FILE, "a") as f:
-        f.write(line)
-        if not line.endswith("\n"):
-            f.write("\n")
+from hub.audit_chain import SOCKET_PATH, AuditWriter, send_to_daemon
 
 def main():
     if len(sys.argv) < 2:
@@ -44,17 +22,18 @@ def main():
     with open(lineage_path, "r") as f:
         lineage = json.load(f)
 
-    head = read_head().get("head")
-    entry = {
-        "timestamp": now_iso(),
-        "prev_hash": head,
-        "lineage": lineage
-    }
-    entry_hash = sha256_json(entry)
-    entry["entry_hash"] = entry_hash
-
-    append_line(json.dumps(entry, separators=(",", ":")))
-    write_head(entry_hash)
+    # Prefer the group-commit daemon when it is running; otherwise append under the chain lock.
+    sock = os.environ.get("ACM_AUDIT_SOCK", SOCKET_PATH)
+    entry_hash = None
+    if os.path.exists(sock):
+        try:
+            entry_hash = send_to_daemon(lineage, sock)
+        except (ConnectionRefusedError, FileNotFoundError):
+            # Stale socket from a daemon that died (or one that just stopped): nothing was
+            # sent, so appending in-process cannot duplicate the entry.
+            entry_hash = None
+    if entry_hash is None:
+        entry_hash = AuditWriter().append(lineage)
     print(entry_hash)
 
 if __name__ == "__main__":
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Artifact manifest CLI.
+
+Usage:
+  scripts/artifact_index.py rebuild            # backfill from data/events, data/plans, data/sim
+  scripts/artifact_index.py latest <kind>      # kind: event | bundle | sim
+  scripts/artifact_index.py sim-for <bundle_sha256>
+"""
+import sys, json
+from pathlib import Path
+
+# Ensure repo root (parent of scripts/) is on sys.path so hub/* imports resolve
+repo_root = Path(__file__).resolve().parent.parent
+if str(repo_root) not in sys.path:
+    sys.path.insert(0, str(repo_root))
+
+from hub.artifact_index import get_index
+
+def main():
+    if len(sys.argv) < 2:
+        print(__doc__.strip(), file=sys.stderr)
+        sys.exit(1)
+    cmd, idx = sys.argv[1], get_index()
+    if cmd == "rebuild":
+        print(json.dumps(idx.rebuild()))
+    elif cmd == "latest" and len(sys.argv) == 3:
+        print(idx.latest_path(sys.argv[2]) or "")
+    elif cmd == "sim-for" and len(sys.argv) == 3:
+        print(idx.sim_for_bundle(sys.argv[2]) or "")
+    else:
+        print(__doc__.strip(), file=sys.stderr)
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
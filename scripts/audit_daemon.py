@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Audit chain daemon: accepts lineage JSON lines on a Unix socket from many
+producers and group-commits them to audit_chain.jsonl.
+
+Usage: scripts/audit_daemon.py [socket_path]   (default: artifacts/audit.sock)
+Each request line is a lineage object; each reply line is {"entry_hash": ...}.
+"""
+import os, sys, json, socketserver
+from pathlib import Path
+
+# Ensure repo root (parent of scripts/) is on sys.path so hub/* imports resolve
+repo_root = Path(__file__).resolve().parent.parent
+if str(repo_root) not in sys.path:
+    sys.path.insert(0, str(repo_root))
+
+from hub.audit_chain import SOCKET_PATH, GroupCommitWriter
+
+class Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for raw in self.rfile:
+            if not raw.strip():
+                continue
+            try:
+                h = self.server.gcw.append(json.loads(raw))
+                resp = {"entry_hash": h}
+            except Exception as e:
+                resp = {"error": str(e)}
+            self.wfile.write((json.dumps(resp) + "\n").encode("utf-8"))
+
+class Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+def main():
+    sock_path = sys.argv[1] if len(sys.argv) > 1 else SOCKET_PATH
+    os.makedirs(os.path.dirname(sock_path) or ".", exist_ok=True)
+    if os.path.exists(sock_path):
+        os.unlink(sock_path)
+    gcw = GroupCommitWriter()
+    with Server(sock_path, Handler) as srv:
+        srv.gcw = gcw
+        print(f"audit daemon listening on {sock_path}", flush=True)
+        try:
+            srv.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            gcw.close()
+            os.unlink(sock_path)
+
+if __name__ == "__main__":
+    main()
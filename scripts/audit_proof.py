@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Merkle inclusion proofs over audit_chain.jsonl.
+
+Usage:
+  scripts/audit_proof.py sync                       # index new chain entries, print size + root
+  scripts/audit_proof.py roots [n]                  # recent pinned roots
+  scripts/audit_proof.py prove --entry <entry_hash>
+  scripts/audit_proof.py prove --plan <plan_id>
+  scripts/audit_proof.py verify <proof.json> [root] # no chain needed
+"""
+import sys, json
+from pathlib import Path
+
+# Ensure repo root (parent of scripts/) is on sys.path so hub/* imports resolve
+repo_root = Path(__file__).resolve().parent.parent
+if str(repo_root) not in sys.path:
+    sys.path.insert(0, str(repo_root))
+
+from hub.audit_merkle import MerkleLog, verify_inclusion
+
+def usage():
+    print(__doc__.strip(), file=sys.stderr)
+    sys.exit(1)
+
+def main():
+    args = sys.argv[1:]
+    if not args:
+        usage()
+    cmd = args[0]
+
+    if cmd == "verify":
+        if len(args) < 2:
+            usage()
+        proofs = json.loads(Path(args[1]).read_text())
+        proofs = proofs if isinstance(proofs, list) else [proofs]
+        ok = all(verify_inclusion(p, args[2] if len(args) > 2 else None) for p in proofs)
+        print("[OK] inclusion verified" if ok else "[FAIL] inclusion proof does not match root")
+        sys.exit(0 if ok else 2)
+
+    log = MerkleLog()
+    size = log.sync()
+    if cmd == "sync":
+        print(json.dumps({"tree_size": size, "root": log.root()}))
+    elif cmd == "roots":
+        print(json.dumps(log.roots(int(args[1]) if len(args) > 1 else 20), indent=2))
+    elif cmd == "prove" and len(args) == 3 and args[1] in ("--entry", "--plan"):
+        proofs = log.prove(entry_hash=args[2]) if args[1] == "--entry" else log.prove(plan_id=args[2])
+        if not proofs:
+            print(f"No chain entry for {args[2]}", file=sys.stderr)
+            sys.exit(3)
+        print(json.dumps(proofs if len(proofs) > 1 else proofs[0], indent=2))
+    else:
+        usage()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Verify audit_chain.jsonl.
+
+Usage: scripts/audit_verify.py [--full | --parallel [workers]] [chain_file]
+  default     incremental: confirm the checkpoint, verify only new entries
+  --full      re-hash the whole chain from line 1
+  --parallel  hash chunks across cores, then check linkage between chunks
+"""
+import os, sys
+from pathlib import Path
+
+# Ensure repo root (parent of scripts/) is on sys.path so hub/* imports resolve
+repo_root = Path(__file__).resolve().parent.parent
+if str(repo_root) not in sys.path:
+    sys.path.insert(0, str(repo_root))
+
+from hub.audit_chain import CHAIN_FILE
+from hub.audit_verify import verify_full, verify_incremental, verify_parallel
+
+def main():
+    args = sys.argv[1:]
+    mode, workers = "incremental", None
+    if args and args[0] == "--full":
+        mode, args = "full", args[1:]
+    elif args and args[0] == "--parallel":
+        mode, args = "parallel", args[1:]
+        if args and args[0].isdigit():
+            workers, args = int(args[0]), args[1:]
+    chain = args[0] if args else CHAIN_FILE
+
+    if not os.path.exists(chain):
+        print("[OK] No chain yet (file missing).")
+        sys.exit(0)
+
+    if mode == "full":
+        res = verify_full(chain)
+    elif mode == "parallel":
+        res = verify_parallel(chain, workers)
+    else:
+        res = verify_incremental(chain)
+
+    if not res.ok:
+        print(res.error)
+        sys.exit(res.code or 1)
+    print(f"[OK] Chain verified ({res.mode}, {res.verified} of {res.lines} entries hashed). Head: {res.head}")
+
+if __name__ == "__main__":
+    main()
@@ -1,124 +1,112 @@
 #!/usr/bin/env python3
-import json, sys, time, pathlib
+"""
+Repair plans that fail check_plan with the minimal-change feasible plan,
+fixing every violated constraint in one step (hub.policy_revision.repair_plan).
+
+Usage:
+  scripts/auto_revise.py '{"policy": {...}, "plan": {...}}'
+  scripts/auto_revise.py --batch plans.jsonl [--policy '{...}'] [--out repaired.jsonl]
+"""
+import argparse, json, sys, time, pathlib
 from dataclasses import asdict
-from typing import Tuple
-from hub.policy_revision import Policy, Plan, Verdict, check_plan
 
+# Ensure repo root (parent of scripts/) is on sys.path so hub/* imports resolve
+repo_root = pathlib.Path(__file__).resolve().parent.parent
+if str(repo_root) not in sys.path:
+    sys.path.insert(0, str(repo_root))
 
-def revise_once(policy: Policy, plan: Plan) -> Tuple[Plan, str]:
+from hub.policy_batch import PlanSet, repair_batch
+from hub.policy_revision import Policy, Plan, Verdict, repair_plan
+from hub.verdict_cache import cached_check_plan as check_plan
+
+
+def auto_revise(policy: Policy, plan: Plan) -> dict:
     """
-    Apply exactly one targeted fix based on the first failing reason.
+    Check, repair all violations at once, re-check. The number of checks is
+    fixed (two) whatever the number of violated constraints.
     """
     v: Verdict = check_plan(policy, plan)
+    history = [{"attempt": 1, "sat": v.sat, "reason": v.reason, "details": v.details, "fixes": []}]
     if v.sat:
-        return plan, "no_change"
-
-    reason = v.reason
-    p = plan
-
-    if reason == "budget_exceeded":
-        # Clamp cost to the cap in one go for demo speed
-        over = max(0.0, p.added_cost - policy.budget_cap)
-        step = max(200.0, over)  # take a full correction to cap
-        new_cost = max(0.0, p.added_cost - step)
-        p = Plan(p.route, new_cost, p.expected_delay_minutes, p.data_region, p.pii_used)
-
-    elif reason == "delay_exceeds_limit":
-        # Clamp delay to the policy limit in one shot
-        new_delay = min(p.expected_delay_minutes, policy.max_delay_minutes)
-        p = Plan(p.route, p.added_cost, new_delay, p.data_region, p.pii_used)
+        return {"final": "SAT", "attempts": 1, "plan": asdict(plan), "history": history}
 
-    elif reason == "data_egress_non_eu":
-        # Enforce EU residency
-        p = Plan(p.route, p.added_cost, p.expected_delay_minutes, "EU", p.pii_used)
+    repaired, fixes = repair_plan(policy, plan)
+    history[0]["fixes"] = fixes
+    last = check_plan(policy, repaired)
+    history.append({"attempt": 2, "sat": last.sat, "reason": last.reason, "details": last.details})
+    result = {"final": "SAT" if last.sat else "UNSAT", "attempts": 1, "plan": asdict(repaired), "history": history}
+    if not last.sat:
+        result["counterexample"] = last.reason
+    return result
 
-    elif reason == "pii_used_not_allowed":
-        # Disable PII
-        p = Plan(p.route, p.added_cost, p.expected_delay_minutes, p.data_region, False)
 
-    else:
-        # Unknown reason — leave unchanged with marker
-        return plan, f"no_rule_for_{reason}"
-
-    return p, reason
+def policy_from(pol: dict) -> Policy:
+    return Policy(
+        budget_cap=float(pol.get("budget_cap", 10000.0)),
+        sla_min=float(pol.get("sla_min", 96.0)),
+        allow_cross_region=bool(pol.get("allow_cross_region", False)),
+        max_delay_minutes=int(pol.get("max_delay_minutes", 60)),
+    )
 
 
-def auto_revise(policy: Policy, plan: Plan, max_attempts: int = 6) -> dict:
-    """
-    In each attempt, apply up to 4 sequential fixes (budget -> delay -> region -> pii),
-    re-checking after each. This converges quickly for demos.
-    """
-    history = []
-    current = plan
-
-    for i in range(1, max_attempts + 1):
-        step_log = {"attempt": i, "fixes": []}
-
-        # Try up to 4 fixes in priority order within the same attempt
-        for _ in range(4):
-            v = check_plan(policy, current)
-            step_log.update({"sat": v.sat, "reason": v.reason, "details": v.details})
-            if v.sat:
-                history.append(step_log)
-                return {
-                    "final": "SAT",
-                    "attempts": i,
-                    "plan": asdict(current),
-                    "history": history
-                }
-
-            # apply one fix
-            next_plan, rule = revise_once(policy, current)
-            step_log["fixes"].append(rule)
-            current = next_plan
-
-        # after up to 4 fixes, record the state for this attempt
-        v = check_plan(policy, current)
-        step_log.update({"sat": v.sat, "reason": v.reason, "details": v.details})
-        history.append(step_log)
-
-        if v.sat:
-            return {
-                "final": "SAT",
-                "attempts": i,
-                "plan": asdict(current),
-                "history": history
-            }
-
-    # If still UNSAT after all attempts
-    last = check_plan(policy, current)
-    history.append({
-        "attempt": max_attempts + 1,
-        "sat": last.sat,
-        "reason": last.reason,
-        "details": last.details
-    })
-    return {
-        "final": "UNSAT",
-        "attempts": max_attempts,
-        "plan": asdict(current),
-        "history": history,
-        "counterexample": last.reason
-    }
+def revise_batch(policy: Policy, plans: list) -> tuple:
+    """Repair a list of plan dicts in one vectorized pass; returns (rows, summary)."""
+    t0 = time.perf_counter()
+    ps = PlanSet.from_columns(
+        [float(p.get("added_cost", 0.0)) for p in plans],
+        [float(p.get("expected_delay_minutes", 0)) for p in plans],
+        [str(p.get("data_region", "EU")) for p in plans],
+        [bool(p.get("pii_used", False)) for p in plans],
+    )
+    fixed, before = repair_batch(policy, ps)
+    ms = (time.perf_counter() - t0) * 1000.0
+    rows = []
+    for i, p in enumerate(plans):
+        rows.append({
+            "route": str(p.get("route", "")),
+            "added_cost": float(fixed.cost[i]),
+            "expected_delay_minutes": int(fixed.delay[i]),
+            "data_region": fixed.regions[fixed.region[i]],
+            "pii_used": bool(fixed.pii[i]),
+            "fixes": before.reasons(i),
+        })
+    counts = before.counts()
+    summary = {"plans": len(plans), "repaired": counts["unsat"], "repair_ms": round(ms, 2),
+               "fixes": {k: v for k, v in counts.items() if k not in ("sat", "unsat") and v}}
+    return rows, summary
+
+
+def main_batch(args) -> None:
+    policy = policy_from(json.loads(args.policy) if args.policy else {})
+    with open(args.batch, encoding="utf-8") as f:
+        plans = [json.loads(line) for line in f if line.strip()]
+    rows, summary = revise_batch(policy, plans)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            for r in rows:
+                f.write(json.dumps(r) + "\n")
+        summary["out"] = args.out
+    print(json.dumps(summary, indent=2))
 
 
 def main():
-    # Simple CLI usage:
-    # scripts/auto_revise.py '{"policy": {...}, "plan": {...}}'
-    if len(sys.argv) < 2:
+    ap = argparse.ArgumentParser(description="Minimal-change plan repair against check_plan")
+    ap.add_argument("payload", nargs="?", help='\'{"policy": {...}, "plan": {...}}\'')
+    ap.add_argument("--batch", help="JSONL file of plans to repair in one pass")
+    ap.add_argument("--policy", help="policy JSON for --batch (defaults as in the payload form)")
+    ap.add_argument("--out", help="write repaired plans (JSONL) here in --batch mode")
+    args = ap.parse_args()
+    if args.batch:
+        return main_batch(args)
+    if not args.payload:
         print('Usage: scripts/auto_revise.py \'{"policy": {...}, "plan": {...}}\'', file=sys.stderr)
         sys.exit(1)
 
-    payload = json.loads(sys.argv[1])
+    payload = json.loads(args.payload)
     pol = payload.get("policy", {})
     pln = payload.get("plan", {})
 
-    policy = Policy(
-        budget_cap=float(pol.get("budget_cap", 10000.0)),
-        sla_min=float(pol.get("sla_min", 96.0)),
-        allow_cross_region=bool(pol.get("allow_cross_region", False)),
-        max_delay_minutes=int(pol.get("max_delay_minutes", 60)),
-    )
+    policy = policy_from(pol)
     plan = Plan(
         route=str(pln.get("route", "R7")),
         added_cost=float(pln.get("added_cost", 6400.0)),
@@ -127,7 +115,7 @@ def main():
         pii_used=bool(pln.get("pii_used", True)),
     )
 
-    result = auto_revise(policy, plan, max_attempts=int(payload.get("max_attempts", 6)))
+    result = auto_revise(policy, plan)
 
     # Log a compact audit line
     audits = pathlib.Path("audits")
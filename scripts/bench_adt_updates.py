@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Benchmark twin updates against the local ADT stand-in:
+  legacy - one request per patch, new connection each time, sequential
+  pooled - AdtClient.update_many (coalesced per twin, keep-alive pool)
+
+Usage: scripts/bench_adt_updates.py [twins] [patches_per_twin] [latency_ms]   (default: 200 5 2)
+"""
+import sys, json, time
+from pathlib import Path
+
+# Ensure repo root (parent of scripts/) is on sys.path so hub/* imports resolve
+repo_root = Path(__file__).resolve().parent.parent
+if str(repo_root) not in sys.path:
+    sys.path.insert(0, str(repo_root))
+
+import httpx
+
+from hub.adt_client import API_VERSION, AdtClient
+from hub.adt_standin import AdtStandIn
+
+def main():
+    twins = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    per_twin = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    latency = float(sys.argv[3]) if len(sys.argv) > 3 else 2.0
+    updates = [(f"twin{t}", [{"op": "add", "path": "/temperature", "value": 20 + k}])
+               for k in range(per_twin) for t in range(twins)]
+    out = {"twins": twins, "patches": len(updates), "latency_ms": latency}
+
+    srv = AdtStandIn(latency_ms=latency).start()
+    try:
+        t0 = time.perf_counter()
+        for twin_id, patch in updates:
+            with httpx.Client(base_url=srv.endpoint) as c:
+                c.patch(f"/digitaltwins/{twin_id}", params={"api-version": API_VERSION},
+                        content=json.dumps(patch)).raise_for_status()
+        dt = time.perf_counter() - t0
+        out["legacy_patches_per_s"] = round(len(updates) / dt)
+
+        with AdtClient(srv.endpoint, max_connections=16, rate_per_s=1e6) as client:
+            t0 = time.perf_counter()
+            report = client.update_many(updates)
+            dt = time.perf_counter() - t0
+        assert not report.failed
+        out["pooled_patches_per_s"] = round(len(updates) / dt)
+        out["pooled_requests"] = report.requests
+        out["server_requests"] = srv.requests
+    finally:
+        srv.stop()
+    print(json.dumps(out, indent=2))
+
+if __name__ == "__main__":
+    main()
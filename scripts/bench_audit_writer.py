@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Benchmark audit chain appends in entries/second:
+  legacy  - per entry: read head file, append one line, rewrite head (old append_audit.py)
+  locked  - AuditWriter.append per entry (flock + fsync each)
+  group   - GroupCommitWriter fed by N producer threads (one write + fsync per batch)
+
+Usage: scripts/bench_audit_writer.py [n_entries] [n_producers]   (default: 2000 16)
+"""
+import os, sys, json, time, tempfile, threading
+from pathlib import Path
+
+# Ensure repo root (parent of scripts/) is on sys.path so hub/* imports resolve
+repo_root = Path(__file__).resolve().parent.parent
+if str(repo_root) not in sys.path:
+    sys.path.insert(0, str(repo_root))
+
+from hub.audit_chain import AuditWriter, GroupCommitWriter, sha256_json, now_iso
+
+LINEAGE = {"plan_id": "PlanA", "verify_status": "PASS", "violations": [],
+           "policy_sha256": "0" * 64, "simulation": {"cost_delta": 6400, "risk_delta": 0.137}}
+
+def legacy(chain, head, n):
+    for _ in range(n):
+        prev = json.load(open(head))["head"] if os.path.exists(head) else None
+        entry = {"timestamp": now_iso(), "prev_hash": prev, "lineage": LINEAGE}
+        entry["entry_hash"] = sha256_json(entry)
+        with open(chain, "a") as f:
+            f.write(json.dumps(entry, separators=(",", ":")) + "\n")
+        with open(head, "w") as f:
+            json.dump({"head": entry["entry_hash"], "updated_at": now_iso()}, f, indent=2)
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    producers = int(sys.argv[2]) if len(sys.argv) > 2 else 16
+    out = {"entries": n, "producers": producers}
+    with tempfile.TemporaryDirectory() as d:
+        t0 = time.perf_counter()
+        legacy(f"{d}/legacy.jsonl", f"{d}/legacy_head.json", n)
+        out["legacy_eps"] = round(n / (time.perf_counter() - t0))
+
+        w = AuditWriter(f"{d}/locked.jsonl", f"{d}/locked_head.json")
+        t0 = time.perf_counter()
+        for _ in range(n):
+            w.append(LINEAGE)
+        out["locked_fsync_eps"] = round(n / (time.perf_counter() - t0))
+
+        gcw = GroupCommitWriter(AuditWriter(f"{d}/group.jsonl", f"{d}/group_head.json"))
+        per = n // producers
+        def produce():
+            futs = [gcw.submit(LINEAGE) for _ in range(per)]
+            for f in futs:
+                f.result()
+        threads = [threading.Thread(target=produce) for _ in range(producers)]
+        t0 = time.perf_counter()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        out["group_commit_eps"] = round(per * producers / (time.perf_counter() - t0))
+        out["group_batches"] = gcw.batches
+        gcw.close()
+    print(json.dumps(out, indent=2))
+
+if __name__ == "__main__":
+    main()
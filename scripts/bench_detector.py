@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Benchmark the streaming disruption detector: signals per second through
+feed(), and detection lag (simulated minutes from storm start to the first
+event on one of its routes).
+
+Usage: scripts/bench_detector.py [routes] [hours] [storms]   (default: 2000 24 30)
+"""
+import sys, json, time
+from datetime import datetime, timezone
+from pathlib import Path
+
+# Ensure repo root (parent of scripts/) is on sys.path so hub/* imports resolve
+repo_root = Path(__file__).resolve().parent.parent
+if str(repo_root) not in sys.path:
+    sys.path.insert(0, str(repo_root))
+
+from hub.detector import DisruptionDetector
+from hub.scenario_gen import generate_storms, generate_topology, iter_signals
+
+def main():
+    routes = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    hours = int(sys.argv[2]) if len(sys.argv) > 2 else 24
+    n_storms = int(sys.argv[3]) if len(sys.argv) > 3 else 30
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    topo = generate_topology(max(2, routes // 2), routes, seed=3)
+    storms = generate_storms(topo, start, hours / 24, n_storms, seed=3)
+    rows = [r for chunk in iter_signals(topo, start, hours / 24, 5, seed=3, storms=storms) for r in chunk]
+
+    det = DisruptionDetector.from_policy()
+    t0 = time.perf_counter()
+    events = list(det.process(rows))
+    elapsed = time.perf_counter() - t0
+
+    first = {}
+    for ev in events:
+        first.setdefault(ev["route_id"], []).append(datetime.fromisoformat(ev["ts"]))
+    lags = []
+    for s in storms:
+        s0, s1 = datetime.fromisoformat(s.start), datetime.fromisoformat(s.end)
+        hits = [t for r in s.route_ids for t in first.get(r, []) if s0 <= t <= s1]
+        if hits:
+            lags.append((min(hits) - s0).total_seconds() / 60.0)
+    lags.sort()
+    print(json.dumps({
+        "signals": len(rows),
+        "events": len(events),
+        "signals_per_s": round(len(rows) / elapsed),
+        "us_per_signal": round(elapsed / len(rows) * 1e6, 3),
+        "storms": len(storms),
+        "storms_detected": len(lags),
+        "lag_min_p50": round(lags[len(lags) // 2], 1) if lags else None,
+        "lag_min_max": round(lags[-1], 1) if lags else None,
+    }, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Benchmark branch-and-bound plan search on generated networks (hub/scenario_gen)
+of n warehouses and 3n routes (each warehouse linked to its 20 ring
+neighbours), under the repo's config/policy limits. Each size disrupts EVENTS
+EU -> EU routes; network indexing is timed separately from the searches.
+
+Usage: scripts/bench_plan_search.py [n ...]   (default: 1000 10000 100000)
+"""
+import sys, json, time
+from dataclasses import asdict
+from pathlib import Path
+
+# Ensure repo root (parent of scripts/) is on sys.path so hub/* imports resolve
+repo_root = Path(__file__).resolve().parent.parent
+if str(repo_root) not in sys.path:
+    sys.path.insert(0, str(repo_root))
+
+from hub.pipeline import search_limits
+from hub.plan_search import PlanNetwork, search_plans
+from hub.scenario_gen import generate_topology
+
+EVENTS = 50
+
+def main():
+    sizes = [int(a) for a in sys.argv[1:]] or [1000, 10000, 100000]
+    rows = []
+    for n in sizes:
+        topo = generate_topology(n, 3 * n, seed=11, neighbourhood=20)
+        whs = topo["warehouses"]
+        t0 = time.perf_counter()
+        net = PlanNetwork(topo)
+        index_ms = (time.perf_counter() - t0) * 1000
+        # Disrupt EU -> EU routes, so the in-boundary search has something to do.
+        eu = [r for r, v in topo["routes"].items()
+              if whs[v["from"]]["region"] == "EU" and whs[v["to"]]["region"] == "EU"][:EVENTS]
+        lim = search_limits(top_k=5, max_hops=6, deadline_ms=250)
+        ms, found, stats = [], 0, []
+        for rid in eu:
+            event = {"type": "route_outage", "route_id": rid, "warehouse_id": topo["routes"][rid]["to"],
+                     "severity": "high"}
+            plans, st = search_plans(event, net, lim)
+            ms.append(st.elapsed_ms)
+            found += bool(plans)
+            stats.append(asdict(st))
+        ms.sort()
+        total = lambda k: sum(s[k] for s in stats)
+        rows.append({"warehouses": n, "routes": 3 * n, "index_ms": round(index_ms, 1), "events": len(eu),
+                     "with_plans": found, "search_ms_p50": ms[len(ms) // 2], "search_ms_max": ms[-1],
+                     "paths": total("paths"), "explored": total("explored"),
+                     "pruned": {k[7:]: total(k) for k in stats[0] if k.startswith("pruned_")},
+                     "truncated": total("truncated")})
+    print(json.dumps(rows, indent=2))
+
+if __name__ == "__main__":
+    main()
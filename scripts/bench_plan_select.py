@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Benchmark plan selection over n random verified candidates: the old full sort
+for one best plan, PlanSelector.extend + top 10 (batches of 4096), the first
+frontier read after those batches, and PlanSelector.add (one plan at a time,
+frontier kept current, as verified plans stream in).
+
+Usage: scripts/bench_plan_select.py [n ...]   (default: 1000 10000 50000)
+"""
+import sys, json, time
+from pathlib import Path
+
+import numpy as np
+
+# Ensure repo root (parent of scripts/) is on sys.path so hub/* imports resolve
+repo_root = Path(__file__).resolve().parent.parent
+if str(repo_root) not in sys.path:
+    sys.path.insert(0, str(repo_root))
+
+from hub.plan_select import PlanSelector
+
+WEIGHTS = {"cost_usd": -1 / 150, "stockout_risk_reduction_pct": 1.0, "delay_reduction_pct": 1.0}
+
+def candidates(n, seed=5):
+    rng = np.random.default_rng(seed)
+    cost = rng.uniform(1000, 10000, n).round(0)
+    # Reductions grow with spend, so the frontier is a real trade-off curve.
+    risk = (cost / 250 + rng.normal(0, 6, n)).clip(0).round(1)
+    delay = (cost / 300 + rng.normal(0, 6, n)).clip(0).round(1)
+    sla = rng.uniform(94, 99.5, n).round(2)
+    return [{"id": f"P{i:06d}", "cost_usd": float(cost[i]), "sla_expected_percent": float(sla[i]),
+             "kpi_expectations": {"stockout_risk_reduction_pct": float(risk[i]), "delay_reduction_pct": float(delay[i])}}
+            for i in range(n)]
+
+def ms(t0):
+    return round((time.perf_counter() - t0) * 1000, 2)
+
+def main():
+    sizes = [int(a) for a in sys.argv[1:]] or [1000, 10000, 50000]
+    rows = []
+    for n in sizes:
+        plans = candidates(n)
+        t0 = time.perf_counter()
+        sorted(plans, key=lambda p: (p["cost_usd"], -p["sla_expected_percent"]))[0]
+        sort_ms = ms(t0)
+        t0 = time.perf_counter()
+        batch = PlanSelector(k=10, weights=WEIGHTS)
+        for i in range(0, n, 4096):
+            batch.extend(plans[i:i + 4096])
+        batch.top()
+        top_ms = ms(t0)
+        t0 = time.perf_counter()
+        front = batch.frontier()
+        front_ms = ms(t0)
+        t0 = time.perf_counter()
+        stream = PlanSelector(k=10, weights=WEIGHTS)
+        for p in plans:
+            stream.add(p)
+        stream_ms = ms(t0)
+        assert [p["id"] for p in stream.top()] == [p["id"] for p in batch.top()]
+        assert len(stream.frontier()) == len(front)
+        rows.append({"candidates": n, "full_sort_best_ms": sort_ms, "extend_top10_ms": top_ms,
+                     "frontier_ms": front_ms, "frontier": len(front),
+                     "stream_add_us_per_plan": round(stream_ms * 1000 / n, 2)})
+    print(json.dumps(rows, indent=2))
+
+if __name__ == "__main__":
+    main()
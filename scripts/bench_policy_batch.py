@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Benchmark: check_plan loop vs vectorized evaluate_batch, and repair_batch
+(minimal-change repair of every plan in one pass).
+
+Usage: scripts/bench_policy_batch.py [n_plans ...]   (default: 1000 100000 1000000)
+"""
+import sys, json, time
+from pathlib import Path
+
+# Ensure repo root (parent of scripts/) is on sys.path so hub/* imports resolve
+repo_root = Path(__file__).resolve().parent.parent
+if str(repo_root) not in sys.path:
+    sys.path.insert(0, str(repo_root))
+
+import numpy as np
+from hub.policy_revision import Plan, Policy, check_plan
+from hub.policy_batch import PlanSet, evaluate_batch, repair_batch
+
+def main():
+    sizes = [int(a) for a in sys.argv[1:]] or [1000, 100_000, 1_000_000]
+    policy = Policy(budget_cap=10000.0, sla_min=96.0, allow_cross_region=False, max_delay_minutes=60)
+    rng = np.random.default_rng(42)
+    for n in sizes:
+        ps = PlanSet(
+            cost=rng.uniform(0, 15000, n), delay=rng.integers(0, 120, n).astype(np.float64),
+            sla=rng.uniform(90, 100, n), region=rng.integers(0, 3, n).astype(np.int16),
+            pii=rng.random(n) < 0.1, regions=("EU", "US", "APAC"),
+        )
+        t0 = time.perf_counter()
+        v = evaluate_batch(policy, ps)
+        vec_ms = (time.perf_counter() - t0) * 1000.0
+
+        t0 = time.perf_counter()
+        repair_batch(policy, ps)
+        repair_ms = (time.perf_counter() - t0) * 1000.0
+
+        loop_n = min(n, 100_000)
+        plans = [Plan("R", float(ps.cost[i]), int(ps.delay[i]), ps.regions[ps.region[i]], bool(ps.pii[i]))
+                 for i in range(loop_n)]
+        t0 = time.perf_counter()
+        for p in plans:
+            check_plan(policy, p)
+        loop_ms = (time.perf_counter() - t0) * 1000.0 * (n / loop_n)
+
+        print(json.dumps({"plans": n, "vectorized_ms": round(vec_ms, 2),
+                          "check_plan_loop_ms": round(loop_ms, 2), "repair_ms": round(repair_ms, 2),
+                          "sat": int(v.sat.sum())}))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Benchmark "last hour of risk for one route": csv.DictReader over the whole
+signals.csv vs the columnar store (sealed history + open newest day).
+
+Usage: scripts/bench_signal_store.py [routes] [days]   (default: 500 7)
+"""
+import sys, csv, json, time, tempfile, os
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# Ensure repo root (parent of scripts/) is on sys.path so hub/* imports resolve
+repo_root = Path(__file__).resolve().parent.parent
+if str(repo_root) not in sys.path:
+    sys.path.insert(0, str(repo_root))
+
+from hub.scenario_gen import write_scenario
+from hub.signal_store import SignalStore, import_csv
+
+def timed(fn, reps):
+    t0 = time.perf_counter()
+    for _ in range(reps):
+        out = fn()
+    return (time.perf_counter() - t0) / reps * 1000.0, out
+
+def main():
+    routes = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    days = float(sys.argv[2]) if len(sys.argv) > 2 else 7
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    with tempfile.TemporaryDirectory() as tmp:
+        m = write_scenario(tmp, max(1, routes // 2), routes, days, 0, seed=1, start=start)
+        path = os.path.join(tmp, "signals.csv")
+        store = SignalStore(os.path.join(tmp, "store"))
+        t0 = time.perf_counter()
+        import_csv(path, store)
+        import_ms = (time.perf_counter() - t0) * 1000.0
+        route = store.keys()[routes // 2][1]
+        end = start + timedelta(days=days)
+        since = (end - timedelta(hours=1)).isoformat()
+
+        def from_csv():
+            with open(path, newline="") as f:
+                rows = list(csv.DictReader(f))
+            return [float(r["risk"]) for r in rows if r["route"] == route and r["timestamp"] >= since]
+
+        def from_store():
+            return store.window(since, None, route=route)["risk"].tolist()
+
+        csv_ms, a = timed(from_csv, 1)
+        store_ms, b = timed(from_store, 200)
+        hist_ms, _ = timed(lambda: store.window(start.isoformat(), end.isoformat(), route=route), 50)
+        assert len(a) == len(b), (len(a), len(b))
+        print(json.dumps({"signals": m["signals"], "routes": routes, "days": days,
+                          "import_ms": round(import_ms, 1), "csv_last_hour_ms": round(csv_ms, 1),
+                          "store_last_hour_ms": round(store_ms, 3), "store_full_history_one_route_ms": round(hist_ms, 3),
+                          "speedup": round(csv_ms / store_ms, 1)}, indent=2))
+
+if __name__ == "__main__":
+    main()
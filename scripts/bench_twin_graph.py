@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Benchmark the local twin graph: load time and query latency at N warehouses
+and N routes (each route links two warehouses).
+
+Usage: scripts/bench_twin_graph.py [n]   (default: 100000)
+"""
+import sys, json, time, random
+from pathlib import Path
+
+# Ensure repo root (parent of scripts/) is on sys.path so hub/* imports resolve
+repo_root = Path(__file__).resolve().parent.parent
+if str(repo_root) not in sys.path:
+    sys.path.insert(0, str(repo_root))
+
+from hub.twin_graph import TwinGraph, parse
+
+def snapshot(n, seed=7):
+    rng = random.Random(seed)
+    return {
+        "warehouses": {f"W{i}": {"inventory": rng.randint(0, 500), "demand": rng.randint(50, 300)}
+                       for i in range(n)},
+        "routes": {f"R{i}": {"from": f"W{rng.randrange(n)}", "to": f"W{rng.randrange(n)}",
+                             "latency_minutes": rng.randint(5, 120)} for i in range(n)},
+    }
+
+def timed(fn, reps):
+    t0 = time.perf_counter()
+    for _ in range(reps):
+        fn()
+    return (time.perf_counter() - t0) / reps * 1000.0
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    snap = snapshot(n)
+    t0 = time.perf_counter()
+    g = TwinGraph.from_snapshot(snap)
+    out = {"warehouses": n, "routes": n, "edges": g.edges,
+           "load_ms": round((time.perf_counter() - t0) * 1000.0, 1)}
+    point = parse(f"MATCH (w)-[:ROUTE]->(r) WHERE w.warehouseId = 'W{n // 2}' RETURN w, r LIMIT 5")
+    out["indexed_match_ms"] = round(timed(lambda: list(g.run(point)), 200), 4)
+    scan = parse("MATCH (w:Warehouse)-[:ROUTE]->(r) WHERE r.latency_minutes > 115 RETURN r.routeId LIMIT 5")
+    out["scan_limit_ms"] = round(timed(lambda: list(g.run(scan)), 20), 4)
+    full = parse("MATCH (r:Route) WHERE r.latency_minutes < 6 RETURN r.routeId")
+    out["full_scan_ms"] = round(timed(lambda: list(g.run(full)), 3), 2)
+    print(json.dumps(out, indent=2))
+
+if __name__ == "__main__":
+    main()
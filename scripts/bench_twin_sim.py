@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Benchmark the vectorized twin simulator at 10, 1,000 and 100,000 warehouses
+(and as many routes), plus a 2,000-trial Monte Carlo run per size. The event hits a hub warehouse that ~1% of routes
+touch, so the affected set grows with the network.
+
+Usage: scripts/bench_twin_sim.py [n ...]   (default: 10 1000 100000)
+"""
+import sys, json, time, random
+from pathlib import Path
+
+# Ensure repo root (parent of scripts/) is on sys.path so hub/* imports resolve
+repo_root = Path(__file__).resolve().parent.parent
+if str(repo_root) not in sys.path:
+    sys.path.insert(0, str(repo_root))
+
+from hub.pipeline import generate_plans
+from hub.twin_sim import SnapshotArrays, monte_carlo, simulate_plans
+
+def snapshot(n, seed=7):
+    rng = random.Random(seed)
+    def end():
+        return "W0" if rng.random() < 0.01 else f"W{rng.randrange(n)}"
+    return {
+        "warehouses": {f"W{i}": {"inventory": rng.randint(0, 500), "demand": rng.randint(50, 300)}
+                       for i in range(n)},
+        "routes": {f"R{i}": {"from": end(), "to": f"W{rng.randrange(n)}",
+                             "latency_minutes": rng.randint(5, 120)} for i in range(n)},
+    }
+
+def timed(fn, reps):
+    t0 = time.perf_counter()
+    for _ in range(reps):
+        fn()
+    return (time.perf_counter() - t0) / reps * 1000.0
+
+def main():
+    sizes = [int(a) for a in sys.argv[1:]] or [10, 1000, 100000]
+    bundle = generate_plans({"type": "port_closure", "severity": "high", "route_id": "R1", "warehouse_id": "W0"})
+    rows = []
+    for n in sizes:
+        snap = snapshot(n)
+        t0 = time.perf_counter()
+        arr = SnapshotArrays.from_snapshot(snap)
+        load_ms = (time.perf_counter() - t0) * 1000.0
+        res = simulate_plans(arr, bundle)
+        reps = 200 if n <= 1000 else 20
+        rows.append({
+            "nodes": n,
+            "plans": len(bundle["plans"]),
+            "affected": res[0]["affected"],
+            "load_ms": round(load_ms, 2),
+            "simulate_ms": round(timed(lambda: simulate_plans(arr, bundle), reps), 4),
+            "monte_carlo_2000_ms": round(timed(lambda: monte_carlo(arr, bundle, trials=2000, seed=1), 3), 2),
+        })
+    print(json.dumps(rows, indent=2))
+
+if __name__ == "__main__":
+    main()
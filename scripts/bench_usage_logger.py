@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Benchmark ADT usage metering, ns per log call:
+  legacy     - open/append/close the JSONL file per call (old adt_usage.log_op)
+  buffered   - UsageLogger, size/time flushes inline
+  background - UsageLogger with the writer thread doing time-based flushes
+
+Usage: scripts/bench_usage_logger.py [n_calls]   (default: 50000)
+"""
+import sys, json, time, tempfile
+from pathlib import Path
+
+# Ensure repo root (parent of scripts/) is on sys.path so hub/* imports resolve
+repo_root = Path(__file__).resolve().parent.parent
+if str(repo_root) not in sys.path:
+    sys.path.insert(0, str(repo_root))
+
+from hub.usage_logger import UsageLogger
+
+def legacy(path, n):
+    for _ in range(n):
+        rec = {"ts": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()), "kind": "operation", "count": 1, "note": ""}
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(rec) + "\n")
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    out = {"calls": n}
+    with tempfile.TemporaryDirectory() as d:
+        t0 = time.perf_counter()
+        legacy(f"{d}/legacy.jsonl", n)
+        out["legacy_ns"] = round((time.perf_counter() - t0) / n * 1e9)
+        for name, bg in (("buffered", False), ("background", True)):
+            lg = UsageLogger(f"{d}/{name}.jsonl", background=bg)
+            t0 = time.perf_counter()
+            for _ in range(n):
+                lg.log("operation")
+            out[f"{name}_ns"] = round((time.perf_counter() - t0) / n * 1e9)
+            lg.close()
+            assert sum(1 for _ in open(f"{d}/{name}.jsonl")) == n
+    print(json.dumps(out, indent=2))
+
+if __name__ == "__main__":
+    main()
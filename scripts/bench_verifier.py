@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Benchmark: cold (fresh solver + full encoding per plan) vs warm
+(persistent IncrementalVerifier, push/pop per plan) vs cached (verdict
+cache hit) Z3 verification.
+
+Usage: scripts/bench_verifier.py [n_plans]   (default: 500)
+"""
+import sys, json, time, random
+from pathlib import Path
+
+# Ensure repo root (parent of scripts/) is on sys.path so hub/* imports resolve
+repo_root = Path(__file__).resolve().parent.parent
+if str(repo_root) not in sys.path:
+    sys.path.insert(0, str(repo_root))
+
+from hub.verdict_cache import VerdictCache, plan_digest
+from hub.z3_verifier import IncrementalVerifier, _Encoded, load_constraints
+
+def make_plans(n: int):
+    rng = random.Random(13)
+    return [{
+        "plan_id": f"P{i}",
+        "cost_usd": rng.uniform(2000, 14000),
+        "sla_pct": rng.uniform(92, 99.5),
+        "latency_ms": rng.uniform(200, 700),
+        "region": rng.choice(["EU", "US"]),
+        "endpoint": rng.choice(["private", "public"]),
+        "stockout_risk": rng.uniform(0.1, 0.5),
+        "delay_minutes": rng.uniform(10, 70),
+    } for i in range(n)]
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    plans = make_plans(n)
+
+    # Cold: what a process-per-call verifier pays (minus interpreter start-up).
+    t0 = time.perf_counter()
+    cold = [_Encoded(load_constraints()).check(p)[0] for p in plans]
+    cold_ms = (time.perf_counter() - t0) * 1000.0
+
+    v = IncrementalVerifier()
+    v.check(plans[0], use_cache=False)  # build once
+    t0 = time.perf_counter()
+    warm = [v.check(p, use_cache=False)[0] for p in plans]
+    warm_ms = (time.perf_counter() - t0) * 1000.0
+
+    # Cached: repeated verification of the same plans is a dictionary lookup.
+    cache = VerdictCache()
+    for p in plans:
+        cache.put(v.policy_hash, "z3", plan_digest(p), list(v.check(p, use_cache=False)))
+    t0 = time.perf_counter()
+    cached = [cache.get_or_compute(v.policy_hash, "z3", p, lambda: None)[0] for p in plans]
+    cached_ms = (time.perf_counter() - t0) * 1000.0
+
+    assert cold == warm == cached, "cold, warm and cached verdicts diverge"
+    print(json.dumps({
+        "plans": n,
+        "cold_ms_per_plan": round(cold_ms / n, 3),
+        "warm_ms_per_plan": round(warm_ms / n, 3),
+        "cached_ms_per_plan": round(cached_ms / n, 4),
+        "speedup": round(cold_ms / warm_ms, 1) if warm_ms else None,
+        "sat": sum(warm),
+        "rebuilds": v.rebuilds,
+    }, indent=2))
+
+if __name__ == "__main__":
+    main()
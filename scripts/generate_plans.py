@@ -1,58 +1,31 @@
-import os, json, glob, time, hashlib
-from datetime import datetime
+import os, sys, json, hashlib
+from pathlib import Path
 
-EVENTS_DIR = "data/events"
-PLANS_DIR = "data/plans"
-os.makedirs(PLANS_DIR, exist_ok=True)
+# Ensure repo root (parent of scripts/) is on sys.path so hub/* imports resolve
+repo_root = Path(__file__).resolve().parent.parent
+if str(repo_root) not in sys.path:
+    sys.path.insert(0, str(repo_root))
+
+from hub.pipeline import PLANS_DIR, generate_plans, latest_artifact, content_id, json_bytes, write_artifact
 
 def latest_event():
-    files = sorted(glob.glob(os.path.join(EVENTS_DIR, "*.json")), key=os.path.getmtime)
-    if not files:
+    path = latest_artifact("event")
+    if not path:
         raise SystemExit("No events found. Run seed_disruption.py first.")
-    with open(files[-1]) as f:
-        return json.load(f), files[-1]
-
-event, path = latest_event()
-
-plans = [
-    {
-        "id": "PlanA",
-        "strategy": "reroute_via_R7",
-        "assumptions": {"carrier_capacity_buffer_pct": 10},
-        "cost_usd": 4800,
-        "sla_expected_percent": 97.5,
-        "region_data_boundary": "EU",
-        "pii_access": False,
-        "kpi_expectations": {"stockout_risk_reduction_pct": 22, "delay_reduction_pct": 18},
-        "inputs": {"route_id": event["route_id"], "warehouse_id": event["warehouse_id"]},
-        "ts": datetime.now().isoformat()
-    },
-    {
-        "id": "PlanB",
-        "strategy": "reallocate_inventory_and_surge_carrier",
-        "assumptions": {"temp_staff_hours": 12},
-        "cost_usd": 6400,
-        "sla_expected_percent": 98.2,
-        "region_data_boundary": "EU",
-        "pii_access": False,
-        "kpi_expectations": {"stockout_risk_reduction_pct": 42, "delay_reduction_pct": 31},
-        "inputs": {"route_id": event["route_id"], "warehouse_id": event["warehouse_id"]},
-        "ts": datetime.now().isoformat()
-    }
-]
-
-bundle = {
-    "event": event,
-    "plans": plans,
-    "origin_event_file": os.path.basename(path),
-    "generated_at": datetime.now().isoformat()
-}
+    data = path.read_bytes()
+    return json.loads(data), str(path), hashlib.sha256(data).hexdigest()
 
-payload = json.dumps(bundle, sort_keys=True).encode()
-bundle_id = hashlib.sha256(payload).hexdigest()[:16]
-out_path = os.path.join(PLANS_DIR, f"{bundle_id}.json")
+def snapshot_arg():
+    """--snapshot <twin_snapshot.json>: search candidates over that network."""
+    if "--snapshot" not in sys.argv:
+        return None
+    return json.loads(Path(sys.argv[sys.argv.index("--snapshot") + 1]).read_text(encoding="utf-8"))
 
-with open(out_path, "w") as f:
-    json.dump(bundle, f, indent=2)
+event, path, event_sha = latest_event()
+bundle = generate_plans(event, origin_event_file=os.path.basename(path), snapshot=snapshot_arg())
+out_path = os.path.join(PLANS_DIR, f"{content_id(bundle)}.json")
+write_artifact(Path("."), "bundle", os.path.basename(out_path), json_bytes(bundle), event_sha)
 
 print(f"Wrote plan bundle: {out_path}")
+if "search" in bundle:
+    print(json.dumps(bundle["search"]))
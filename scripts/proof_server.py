@@ -1,10 +1,19 @@
 #!/usr/bin/env python3
+import sys
 import json
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 from flask import Flask, render_template, request, Response
 
+# Ensure repo root (parent of scripts/) is on sys.path so hub/* imports resolve
+repo_root = Path(__file__).resolve().parent.parent
+if str(repo_root) not in sys.path:
+    sys.path.insert(0, str(repo_root))
+
+from hub.audit_query import FIELDS, get_index
+from hub.audit_reader import get_reader
+
 AUDIT_FILES = [Path("audits/chain.log"), Path("audit_chain.jsonl")]
 
 # Flask app with template/static folders under ui/
@@ -13,23 +22,26 @@ app = Flask(__name__, template_folder="../ui/templates", static_folder="../ui/st
 app.config["JSON_AS_ASCII"] = False
 
 
-def load_records() -> List[Dict[str, Any]]:
-    """Load JSONL audit records from the first available audit file."""
+def load_records(n: int) -> List[Dict[str, Any]]:
+    """Last n JSONL audit records (oldest first) from the first available audit file."""
     src = next((p for p in AUDIT_FILES if p.exists()), None)
     if not src:
         return []
-    recs: List[Dict[str, Any]] = []
-    with src.open("r", encoding="utf-8") as f:
-        for line in f:
-            s = line.strip()
-            if not s:
-                continue
-            try:
-                recs.append(json.loads(s))
-            except Exception:
-                # Tolerate non-JSON lines in chain.log
-                continue
-    return recs
+    # The reader keeps a line-offset index and only scans appended bytes.
+    return get_reader(str(src)).tail(n)
+
+
+def query_records(n: int) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """Newest-first records matching the request's filter/cursor args, plus the next cursor."""
+    src = next((p for p in AUDIT_FILES if p.exists()), None)
+    if not src:
+        return [], None
+    filters = {k: request.args[k] for k in FIELDS if request.args.get(k)}
+    res = get_index(str(src)).query(
+        since=request.args.get("since"), until=request.args.get("until"),
+        cursor=request.args.get("cursor"), limit=n, **filters,
+    )
+    return res["records"], res["next_cursor"]
 
 
 def value(d: Dict[str, Any], *keys, default=None):
@@ -64,18 +76,30 @@ def coalesce(r: Dict[str, Any]) -> Dict[str, Any]:
 
 @app.route("/api/audit")
 def api_audit():
-    """Return latest N normalized audit entries as JSON, with unicode preserved."""
+    """
+    Return latest N normalized audit entries as JSON, with unicode preserved.
+    Filters (plan_id, policy_hash, verdict, secret_name, attestation_type,
+    since, until) and cursor go through the secondary index.
+    """
     try:
         n = max(1, int(request.args.get("n", "20")))
     except Exception:
         n = 20
-    recs = load_records()
-    rows = [coalesce(x) for x in recs[-n:]]
-    rows.reverse()  # newest first
+    next_cursor = None
+    if any(request.args.get(k) for k in FIELDS + ("since", "until", "cursor")):
+        try:
+            recs, next_cursor = query_records(n)
+        except ValueError as e:
+            return Response(json.dumps({"error": str(e)}), status=400, mimetype="application/json")
+        rows = [coalesce(x) for x in recs]
+    else:
+        rows = [coalesce(x) for x in load_records(n)]
+        rows.reverse()  # newest first
     payload = {
         "count": len(rows),
         "generated": datetime.now(timezone.utc).isoformat(),
         "entries": rows,
+        "next_cursor": next_cursor,
     }
     # Ensure em dashes (—) are not escaped to \u2014
     return Response(
@@ -91,8 +115,7 @@ def home():
         n = max(1, int(request.args.get("n", "20")))
     except Exception:
         n = 20
-    recs = load_records()
-    rows = [coalesce(x) for x in recs[-n:]]
+    rows = [coalesce(x) for x in load_records(n)]
     rows.reverse()
     generated = datetime.now(timezone.utc).isoformat()
     return render_template("proof.html", rows=rows, generated=generated, count=len(rows))
@@ -1,9 +1,18 @@
 #!/usr/bin/env python3
 import sys
 import json
+import argparse
 from pathlib import Path
 from typing import List, Dict, Any
 
+# Ensure repo root (parent of scripts/) is on sys.path so hub/* imports resolve
+repo_root = Path(__file__).resolve().parent.parent
+if str(repo_root) not in sys.path:
+    sys.path.insert(0, str(repo_root))
+
+from hub.audit_query import FIELDS, get_index
+from hub.audit_reader import get_reader
+
 AUDIT_FILES = [
     Path("audits/chain.log"),
     Path("audit_chain.jsonl"),
@@ -20,29 +29,12 @@ CORE_FIELDS = [
     "notes",
 ]
 
-def load_audit_lines() -> List[Dict[str, Any]]:
-    src = None
+def audit_source() -> Path:
     for p in AUDIT_FILES:
         if p.exists():
-            src = p
-            break
-    if not src:
-        print("No audit log found (looked for audits/chain.log and audit_chain.jsonl)", file=sys.stderr)
-        sys.exit(1)
-
-    records = []
-    with src.open("r", encoding="utf-8") as f:
-        for line in f:
-            s = line.strip()
-            if not s:
-                continue
-            try:
-                obj = json.loads(s)
-                records.append(obj)
-            except Exception:
-                # Tolerate non-JSON lines
-                continue
-    return records
+            return p
+    print("No audit log found (looked for audits/chain.log and audit_chain.jsonl)", file=sys.stderr)
+    sys.exit(1)
 
 def coalesce(record: Dict[str, Any]) -> Dict[str, Any]:
     flat = {}
@@ -78,22 +70,34 @@ def print_entry(entry: Dict[str, Any], idx: int):
     print()
 
 def main():
-    n = 5
-    if len(sys.argv) >= 2:
-        try:
-            n = max(1, int(sys.argv[1]))
-        except Exception:
-            pass
+    ap = argparse.ArgumentParser(description="Show audit entries, newest first.")
+    ap.add_argument("n", nargs="?", type=int, default=5, help="entries to show (default 5)")
+    for k in FIELDS:
+        ap.add_argument("--" + k.replace("_", "-"), dest=k, help=f"only entries with this {k}")
+    ap.add_argument("--since", help="timestamp lower bound (inclusive, ISO 8601)")
+    ap.add_argument("--until", help="timestamp upper bound (exclusive, ISO 8601)")
+    ap.add_argument("--cursor", help="next_cursor from a previous page")
+    args = ap.parse_args()
+    n = max(1, args.n)
 
-    records = load_audit_lines()
+    src = audit_source()
+    filters = {k: getattr(args, k) for k in FIELDS if getattr(args, k)}
+    next_cursor = None
+    if filters or args.since or args.until or args.cursor:
+        res = get_index(str(src)).query(since=args.since, until=args.until, cursor=args.cursor,
+                                        limit=n, **filters)
+        records, next_cursor = res["records"], res["next_cursor"]
+    else:
+        records = list(reversed(get_reader(str(src)).tail(n)))
     if not records:
         print("No JSON records found in audit log.")
         sys.exit(0)
 
-    last = records[-n:]
-    for i, rec in enumerate(reversed(last), 1):
+    for i, rec in enumerate(records, 1):
         flat = coalesce(rec)
         print_entry(flat, i)
+    if next_cursor:
+        print(f"(more: --cursor {next_cursor})")
 
 if __name__ == "__main__":
     main()
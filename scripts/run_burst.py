@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+Run a burst of concurrent disruption events through the decision scheduler.
+
+Usage: scripts/run_burst.py [n_events] [--process] [--write]   (default: 48 events, thread pools)
+"""
+import sys, json
+from pathlib import Path
+
+# Ensure repo root (parent of scripts/) is on sys.path so hub/* imports resolve
+repo_root = Path(__file__).resolve().parent.parent
+if str(repo_root) not in sys.path:
+    sys.path.insert(0, str(repo_root))
+
+from hub.pipeline import seed_event
+from hub.scheduler import run_burst
+
+def main():
+    flags = {a for a in sys.argv[1:] if a.startswith("--")}
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    n = int(args[0]) if args else 48
+    events = [seed_event("route_outage", f"R{i % 40 + 1}", f"W{i % 12 + 1}", source="burst")
+              for i in range(n)]
+    report = run_burst(events, executor="process" if "--process" in flags else "thread",
+                       write_artifacts="--write" in flags)
+    out = report.summary()
+    out["errors"] = [r.error for r in report.runs if r.error][:5]
+    print(json.dumps(out, indent=2))
+    sys.exit(1 if report.failed else 0)
+
+if __name__ == "__main__":
+    main()
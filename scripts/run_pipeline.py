@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Run the full decision pipeline in one process.
+
+Usage: scripts/run_pipeline.py [disruption_type] [route_id] [warehouse_id] [--write] [--proof]
+"""
+import sys, json
+from pathlib import Path
+
+# Ensure repo root (parent of scripts/) is on sys.path so hub/* imports resolve
+repo_root = Path(__file__).resolve().parent.parent
+if str(repo_root) not in sys.path:
+    sys.path.insert(0, str(repo_root))
+
+from hub.pipeline import run_pipeline
+
+def main():
+    flags = {a for a in sys.argv[1:] if a.startswith("--")}
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    disruption, route_id, warehouse_id = (args + ["route_outage", "R7", "W3"][len(args):])[:3]
+
+    res = run_pipeline(disruption, route_id, warehouse_id,
+                       write_artifacts="--write" in flags, write_proof="--proof" in flags)
+    print(json.dumps({
+        "event": res.event,
+        "plans": [p["id"] for p in res.bundle["plans"]],
+        "verdicts": res.verdicts,
+        "via": "policy-fallback" if res.used_fallback else "z3",
+        "best": res.best["id"] if res.best else None,
+        "paths": res.paths,
+        "timings_ms": res.timings_ms,
+    }, indent=2))
+    sys.exit(0 if res.best else 2)
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,14 @@
-import os, glob, json, hashlib, time
+import os, sys, json, hashlib, time
 from datetime import datetime, timezone
+from pathlib import Path
 
-def latest(path):
-    files = sorted(glob.glob(path), key=os.path.getmtime)
-    return files[-1] if files else None
+# Ensure repo root (parent of scripts/) is on sys.path so hub/* imports resolve
+repo_root = Path(__file__).resolve().parent.parent
+if str(repo_root) not in sys.path:
+    sys.path.insert(0, str(repo_root))
+
+from hub.artifact_index import get_index
+from hub.pipeline import load_config, verify_plans
 
 def sha256_hex(path):
     with open(path, "rb") as f:
@@ -11,13 +16,17 @@ def sha256_hex(path):
         return hashlib.sha256(f.read()).hexdigest()
 
 def main():
-    bundle_path = latest("data/plans/*.json")
-    sim_path = latest("data/sim/*_sim.json")
+    index = get_index()
+    bundle_path = index.latest_path("bundle")
+    # Only the sim recorded for this bundle; the newest sim may belong to another run.
+    sim_path = index.sim_for_bundle(sha256_hex(bundle_path)) if bundle_path else None
     proof_log = "audits/day13_proof.jsonl"
     chain_meta = "audits/chain.meta"
 
-    if not all([bundle_path, sim_path]) or not os.path.exists(proof_log) or not os.path.exists(chain_meta):
+    if not bundle_path or not os.path.exists(proof_log) or not os.path.exists(chain_meta):
         raise SystemExit("Missing inputs; run Day 13 pipeline first.")
+    if not sim_path:
+        raise SystemExit(f"No sim for bundle {os.path.basename(bundle_path)}; run simulate_twin.py first.")
 
     with open(bundle_path) as f:
         bundle = json.load(f)
@@ -26,13 +35,15 @@ def main():
     with open(chain_meta) as f:
         chain = json.load(f)
 
-    # Derive simple “verdicts” from policy-compatible plan fields (mirrors verify step)
+    # Verdicts from the verify step (served from the shared verdict cache when warm)
+    rows, _ = verify_plans(bundle, load_config())
+    sat_by_id = {r["plan_id"]: r["sat"] for r in rows}
     verdicts = []
     for p in bundle["plans"]:
         verdicts.append({
             "plan_id": p["id"],
             "strategy": p["strategy"],
-            "sat": True,  # Day 13 config makes both SAT
+            "sat": sat_by_id.get(p["id"], False),
             "budget": p["cost_usd"],
             "sla": p["sla_expected_percent"],
             "region": p.get("region_data_boundary"),
@@ -9,6 +9,9 @@ import pathlib
 from scripts.lib_retry import retry
 from scripts.adt_usage import summarize  # ADT usage snapshot
 
+# Trailing window for the per-run ADT usage snapshot (summarize() alone is all-time)
+USAGE_WINDOW_S = int(os.environ.get("ADT_USAGE_WINDOW_S", "86400"))
+
 def call_gate(secret_name: str, token_path: str):
     """
     Ask the gate if the secret can be released.
@@ -83,8 +86,11 @@ def main():
     except Exception:
         token_dig = None
 
-    # Day 25: include a short ADT usage snapshot in the audit entry
-    usage_totals = summarize()  # {"operation": X, "message": Y, "query_unit": Z}
+    # Day 25: include a short ADT usage snapshot in the audit entry, over the
+    # trailing USAGE_WINDOW_S up to and including the current minute
+    usage_until = int(time.time()) // 60 * 60 + 60
+    usage_since = usage_until - USAGE_WINDOW_S
+    usage_totals = summarize(usage_since, usage_until)  # {"operation": X, "message": Y, "query_unit": Z}
 
     audit_entry = {
         "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
@@ -93,6 +99,8 @@ def main():
         "secret_name": secret_name,
         "token_digest": token_dig,
         "adt_usage": usage_totals,
+        "adt_usage_window": {"since": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(usage_since)),
+                             "until": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(usage_until))},
     }
 
     ap = pathlib.Path("audits/chain.log")
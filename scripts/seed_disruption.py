@@ -1,24 +1,46 @@
-import json, os, time, hashlib
-from datetime import datetime
+"""
+Write disruption events to data/events.
 
-CONFIG = "configs/day13.yaml"
-EVENTS_DIR = "data/events"
-os.makedirs(EVENTS_DIR, exist_ok=True)
+No arguments: the fixed R7/W3 route_outage demo event. With --count N: N
+seeded events over a topology (--topology JSON, or one generated from
+--warehouses/--routes), reproducible for a given --seed.
+"""
+import argparse, json, os, sys
+from pathlib import Path
 
-event = {
-    "type": "route_outage",
-    "route_id": "R7",
-    "warehouse_id": "W3",
-    "source": "day13-seed",
-    "severity": "high",
-    "ts": datetime.utcnow().isoformat() + "Z"
-}
+# Ensure repo root (parent of scripts/) is on sys.path so hub/* imports resolve
+repo_root = Path(__file__).resolve().parent.parent
+if str(repo_root) not in sys.path:
+    sys.path.insert(0, str(repo_root))
 
-payload = json.dumps(event, sort_keys=True).encode()
-event_id = hashlib.sha256(payload).hexdigest()[:16]
-path = os.path.join(EVENTS_DIR, f"{event_id}.json")
+from hub.pipeline import EVENTS_DIR, seed_event, content_id, json_bytes, write_artifact
+from hub.scenario_gen import generate_topology, random_events
 
-with open(path, "w") as f:
-    json.dump(event, f, indent=2)
+def write_event(event):
+    path = os.path.join(EVENTS_DIR, f"{content_id(event)}.json")
+    write_artifact(Path("."), "event", os.path.basename(path), json_bytes(event))
+    print(f"Wrote disruption event: {path}")
 
-print(f"Wrote disruption event: {path}")
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--count", type=int, default=0)
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--topology", help="topology.json from ops/sim/data_generator.py")
+    ap.add_argument("--warehouses", type=int, default=100)
+    ap.add_argument("--routes", type=int, default=200)
+    args = ap.parse_args(argv)
+    if not args.count:
+        write_event(seed_event())
+        return
+    if args.topology:
+        topo = json.loads(Path(args.topology).read_text(encoding="utf-8"))
+    elif args.warehouses < 2 or args.routes < 1:
+        ap.error("--warehouses must be at least 2 and --routes at least 1")
+    else:
+        topo = generate_topology(args.warehouses, args.routes, args.seed)
+    for ev in random_events(topo, args.count, args.seed):
+        write_event(seed_event(ev["type"], ev["route_id"], ev["warehouse_id"], source=f"seed-{args.seed}",
+                               severity=ev["severity"]))
+
+if __name__ == "__main__":
+    main()
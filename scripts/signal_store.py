@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Columnar signal store (hub/signal_store.py).
+
+Usage:
+  scripts/signal_store.py import [signals.csv]         # one-time CSV import (default data/signals.csv)
+  scripts/signal_store.py compact                      # seal every day but the newest
+  scripts/signal_store.py tail [-n N] [--warehouse W] [--route R]
+  scripts/signal_store.py window --since TS [--until TS] [--warehouse W] [--route R]
+"""
+import sys, json, argparse
+from pathlib import Path
+
+# Ensure repo root (parent of scripts/) is on sys.path so hub/* imports resolve
+repo_root = Path(__file__).resolve().parent.parent
+if str(repo_root) not in sys.path:
+    sys.path.insert(0, str(repo_root))
+
+from hub.signal_store import STORE_DIR, SignalStore, import_csv
+
+def main():
+    ap = argparse.ArgumentParser(description="Columnar signal store.")
+    ap.add_argument("--store", default=STORE_DIR)
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    imp = sub.add_parser("import")
+    imp.add_argument("csv", nargs="?", default="data/signals.csv")
+    sub.add_parser("compact")
+    for name in ("tail", "window"):
+        p = sub.add_parser(name)
+        p.add_argument("--warehouse")
+        p.add_argument("--route")
+    sub.choices["tail"].add_argument("-n", type=int, default=10)
+    sub.choices["window"].add_argument("--since", required=True)
+    sub.choices["window"].add_argument("--until")
+    args = ap.parse_args()
+
+    store = SignalStore(args.store)
+    if args.cmd == "import":
+        print(json.dumps({"imported": import_csv(args.csv, store), "days": len(store.days()),
+                          "keys": len(store.keys())}))
+    elif args.cmd == "compact":
+        print(json.dumps({"sealed": store.compact()}))
+    elif args.cmd == "tail":
+        print(json.dumps(store.rows(store.tail(args.n, args.warehouse, args.route)), indent=2))
+    else:
+        print(json.dumps(store.rows(store.window(args.since, args.until, args.warehouse, args.route)), indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,18 @@ set -euo pipefail
 SNAPSHOT="${1:-}"
 PLAN="${2:-}"
 if [ -z "$SNAPSHOT" ] || [ -z "$PLAN" ]; then
-  echo "Usage: scripts/simulate_plan.sh <snapshot.json> <plan.json>"
+  echo "Usage: scripts/simulate_plan.sh <snapshot.json> <bundle.json|plan.json>"
   exit 1
 fi
-python verifiers/simulator.py "$SNAPSHOT" "$PLAN"
+SNAPSHOT="$(realpath "$SNAPSHOT")"; PLAN="$(realpath "$PLAN")"
+cd "$(dirname "$0")/.."
+# A single plan (no "plans" key) is simulated as a one-plan bundle.
+python3 -c 'import json, sys
+from hub.pipeline import simulate_bundle
+snap, bundle = (json.load(open(p)) for p in sys.argv[1:3])
+if "plans" not in bundle:
+    plan = dict(bundle, id=bundle.get("id", bundle.get("plan_id")))
+    bundle = {"event": plan.pop("event", {}), "plans": [plan]}
+if not bundle["plans"]:
+    sys.exit(f"no plans in {sys.argv[2]}")
+print(json.dumps(simulate_bundle(bundle, origin_bundle=sys.argv[2], snapshot=snap), indent=2))' "$SNAPSHOT" "$PLAN"
@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+import sys, json, hashlib
+from pathlib import Path
+
+# Ensure repo root (parent of scripts/) is on sys.path so hub/* imports resolve
+repo_root = Path(__file__).resolve().parent.parent
+if str(repo_root) not in sys.path:
+    sys.path.insert(0, str(repo_root))
+
+from hub.pipeline import SIM_DIR, latest_artifact, simulate_bundle, json_bytes, write_artifact
+
+def main():
+    def opt(name, default=None):
+        return sys.argv[sys.argv.index(name) + 1] if name in sys.argv else default
+    snapshot = None
+    if opt("--snapshot"):
+        snapshot = json.loads(Path(opt("--snapshot")).read_text(encoding="utf-8"))
+    bundle_path = latest_artifact("bundle")
+    if not bundle_path:
+        raise SystemExit("No plan bundles found. Run generate_plans.py first.")
+    data = bundle_path.read_bytes()
+    bundle = json.loads(data)
+    sim = simulate_bundle(bundle, origin_bundle=bundle_path.name, snapshot=snapshot,
+                          trials=int(opt("--trials", 0)), seed=int(opt("--seed", 0)))
+    out_path = Path(SIM_DIR) / f"{bundle_path.stem}_sim.json"
+    write_artifact(Path("."), "sim", out_path.name, json_bytes(sim), hashlib.sha256(data).hexdigest())
+    print(f"Wrote simulation results: {out_path}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Run ADT-style MATCH queries against a local twin snapshot (no ADT query units).
+
+Usage:
+  scripts/twin_query.py "MATCH (w)-[:ROUTE]->(r) WHERE w.warehouseId = 'W3' RETURN w, r LIMIT 5"
+  scripts/twin_query.py --config configs/day13.yaml      # run every adt.queries entry
+Options: --snapshot <twin_snapshot.json>
+"""
+import sys, json, time, argparse
+from pathlib import Path
+
+# Ensure repo root (parent of scripts/) is on sys.path so hub/* imports resolve
+repo_root = Path(__file__).resolve().parent.parent
+if str(repo_root) not in sys.path:
+    sys.path.insert(0, str(repo_root))
+
+from hub.twin_graph import QueryError, TwinGraph
+
+def main():
+    ap = argparse.ArgumentParser(description="Local twin graph queries")
+    ap.add_argument("query", nargs="?")
+    ap.add_argument("--snapshot", default="twin_snapshot.json")
+    ap.add_argument("--config", help="YAML config with adt.queries")
+    args = ap.parse_args()
+
+    queries = [args.query] if args.query else []
+    if args.config:
+        import yaml
+        cfg = yaml.safe_load(Path(args.config).read_text()) or {}
+        queries += list((cfg.get("adt") or {}).get("queries") or [])
+    if not queries:
+        ap.error("give a query or --config")
+
+    t0 = time.perf_counter()
+    g = TwinGraph.load(args.snapshot)
+    load_ms = (time.perf_counter() - t0) * 1000.0
+    out = {"snapshot": args.snapshot, "nodes": len(g.nodes), "edges": g.edges,
+           "load_ms": round(load_ms, 3), "results": []}
+    for q in queries:
+        t0 = time.perf_counter()
+        try:
+            rows = g.query(q)
+        except QueryError as e:
+            print(f"[ERROR] {e}: {q}", file=sys.stderr)
+            sys.exit(2)
+        out["results"].append({"query": q, "rows": rows,
+                               "query_ms": round((time.perf_counter() - t0) * 1000.0, 3)})
+    print(json.dumps(out, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+import sys, json
+from pathlib import Path
+
+# Ensure repo root (parent of scripts/) is on sys.path so hub/* imports resolve
+repo_root = Path(__file__).resolve().parent.parent
+if str(repo_root) not in sys.path:
+    sys.path.insert(0, str(repo_root))
+
+from hub.pipeline import latest_artifact, verify_plans_z3
+
+def main():
+    bundle_path = latest_artifact("bundle")
+    if not bundle_path:
+        raise SystemExit("No plan bundles found. Run generate_plans.py first.")
+    bundle = json.loads(bundle_path.read_text())
+    rows = verify_plans_z3(bundle)
+    print(json.dumps({"bundle_file": bundle_path.name, "results": rows}, indent=2))
+
+if __name__ == "__main__":
+    main()
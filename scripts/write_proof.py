@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+import sys, json, hashlib
+from pathlib import Path
+
+# Ensure repo root (parent of scripts/) is on sys.path so hub/* imports resolve
+repo_root = Path(__file__).resolve().parent.parent
+if str(repo_root) not in sys.path:
+    sys.path.insert(0, str(repo_root))
+
+from hub.artifact_index import get_index
+from hub.pipeline import (POLICY_PATH, PROOF_LOG, latest_artifact, load_config,
+                          verify_plans, build_proof_entry, read_chain_head, append_proof)
+from hub.policy_hash import policy_hash
+
+def main():
+    bundle_path = latest_artifact("bundle")
+    if not bundle_path:
+        raise SystemExit("Missing bundle; run generate_plans.py first.")
+    bundle_bytes = bundle_path.read_bytes()
+    sim_path = get_index().sim_for_bundle(hashlib.sha256(bundle_bytes).hexdigest())
+    if not sim_path:
+        raise SystemExit("Missing sim for latest bundle; run simulate_twin.py first.")
+    sim_bytes = sim_path.read_bytes()
+    bundle, sim = json.loads(bundle_bytes), json.loads(sim_bytes)
+    rows, _ = verify_plans(bundle, load_config())
+    entry = build_proof_entry(
+        bundle_path.name, hashlib.sha256(bundle_bytes).hexdigest(),
+        sim_path.name, hashlib.sha256(sim_bytes).hexdigest(),
+        sim, rows, policy_hash(POLICY_PATH), read_chain_head(Path(".")),
+    )
+    append_proof(Path("."), entry)
+    print(f"Appended proof to {PROOF_LOG}: {entry['entry_digest']}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+from hub.adt_client import AdtClient, coalesce_patches
+from hub.adt_standin import AdtStandIn, apply_patch
+
+
+def test_coalesced_patch_matches_sequential_apply():
+    updates = [
+        ("t1", [{"op": "add", "path": "/temperature", "value": 20}]),
+        ("t2", [{"op": "add", "path": "/status", "value": {"ok": True}}]),
+        ("t1", [{"op": "replace", "path": "/temperature", "value": 31}]),
+        ("t2", [{"op": "add", "path": "/status/ok", "value": False}]),
+        ("t2", [{"op": "add", "path": "/status", "value": {"ok": None}}]),
+    ]
+    merged = coalesce_patches(updates)
+    assert merged["t1"] == [{"op": "add", "path": "/temperature", "value": 31}]
+    for twin in ("t1", "t2"):
+        seq, once = {}, {}
+        for t, p in updates:
+            if t == twin:
+                apply_patch(seq, p)
+        apply_patch(once, merged[twin])
+        assert seq == once
+
+
+def test_update_many_pools_and_retries_throttled_requests():
+    srv = AdtStandIn(reject_every=4).start()
+    try:
+        updates = [(f"w{i % 10}", [{"op": "add", "path": "/risk", "value": i}]) for i in range(50)]
+        with AdtClient(srv.endpoint, max_connections=4, rate_per_s=10_000) as client:
+            report = client.update_many(updates)
+            assert not report.failed and report.requests == 10 and report.ops_in == 50
+            assert client.get_twin("w3")["risk"] == 43
+        assert srv.requests > 10  # some PATCHes were answered 429 and retried
+    finally:
+        srv.stop()
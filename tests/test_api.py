@@ -20,3 +20,33 @@ def test_version():
     body = r.json()
     assert "commit" in body and "policy_hash" in body
     assert isinstance(body["policy_hash"], str) and len(body["policy_hash"]) == 64
+
+def test_decide():
+    r = client.post("/decide", json={"event": {"route_id": "R7", "warehouse_id": "W3"}})
+    assert r.status_code == 200
+    body = r.json()
+    assert [p["id"] for p in body["plans"]] == ["PlanA", "PlanB"]
+    assert body["chosen"]["id"] == "PlanA"
+    assert body["chosen_simulation"]["plan_id"] == "PlanA"
+
+def test_decide_batch():
+    items = [{"event": {"route_id": f"R{i}", "warehouse_id": "W1"}} for i in range(5)]
+    r = client.post("/decide/batch", json={"items": items})
+    assert r.status_code == 200
+    assert r.json()["count"] == 5
+
+def test_verify_and_simulate_bundle():
+    bundle = client.post("/decide/plans", json={"event": {"route_id": "R7", "warehouse_id": "W3"}}).json()
+    bundle["plans"][1]["cost_usd"] = 20000
+    v = client.post("/decide/verify", json=bundle).json()
+    assert [row["sat"] for row in v["verdicts"]] == [True, False]
+    sim = client.post("/decide/simulate", json=bundle).json()
+    assert len(sim["results"]) == 2
+
+def test_version_etag_304():
+    r = client.get("/version")
+    etag = r.headers["etag"]
+    r2 = client.get("/version", headers={"If-None-Match": etag})
+    assert r2.status_code == 304 and r2.headers["etag"] == etag
+    r3 = client.get("/policy/hash", headers={"If-None-Match": etag})
+    assert r3.status_code == 200
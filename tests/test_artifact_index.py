@@ -0,0 +1,28 @@
+from hub.artifact_index import ArtifactIndex
+from hub import pipeline as engine
+
+
+def test_latest_and_sim_for_bundle(tmp_path):
+    ev = engine.write_artifact(tmp_path, "event", "e1.json", b'{"a": 1}')
+    b1 = engine.write_artifact(tmp_path, "bundle", "b1.json", b'{"b": 1}', ev)
+    b2 = engine.write_artifact(tmp_path, "bundle", "b2.json", b'{"b": 2}', ev)
+    engine.write_artifact(tmp_path, "sim", "b1_sim.json", b'{"s": 1}', b1)
+
+    idx = ArtifactIndex(str(tmp_path))
+    assert idx.latest_path("bundle") == tmp_path / "data/plans/b2.json"
+    assert idx.sim_for_bundle(b1) == tmp_path / "data/sim/b1_sim.json"
+    assert idx.sim_for_bundle(b2) is None
+    assert idx.by_sha(b1).parent == ev
+
+
+def test_rebuild_links_parents(tmp_path):
+    (tmp_path / "data/events").mkdir(parents=True)
+    (tmp_path / "data/plans").mkdir(parents=True)
+    (tmp_path / "data/events/e.json").write_text("{}")
+    (tmp_path / "data/plans/b.json").write_text('{"origin_event_file": "e.json"}')
+    idx = ArtifactIndex(str(tmp_path))
+    assert idx.rebuild() == {"event": 1, "bundle": 1, "sim": 0}
+    assert idx.latest("bundle").parent == idx.latest("event").sha256
+    assert idx.rebuild() == {"event": 1, "bundle": 1, "sim": 0}  # replaces, does not duplicate
+    assert idx._conn().execute("SELECT COUNT(*) FROM artifacts").fetchone()[0] == 2
+    assert idx.latest("bundle").parent == idx.latest("event").sha256
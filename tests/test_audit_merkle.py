@@ -0,0 +1,32 @@
+from hub.audit_chain import AuditWriter
+from hub.audit_merkle import MerkleLog, leaf_hash, node_hash, verify_inclusion
+
+
+def _naive_root(leaves):
+    if len(leaves) == 1:
+        return leaves[0]
+    k = 1
+    while k << 1 < len(leaves):
+        k <<= 1
+    return node_hash(_naive_root(leaves[:k]), _naive_root(leaves[k:]))
+
+
+def test_incremental_roots_and_proofs(tmp_path):
+    chain = str(tmp_path / "chain.jsonl")
+    w = AuditWriter(chain, None, fsync=False)
+    log = MerkleLog(chain, str(tmp_path / "m.sqlite"), root_every=8)
+    hashes = []
+    for batch in (1, 6, 13, 1, 20):
+        hashes += w.append_many([{"plan_id": f"P{len(hashes) + i}"} for i in range(batch)])
+        assert log.sync() == len(hashes)
+        assert log.root() == _naive_root([leaf_hash(h) for h in hashes]).hex()
+
+    for i in (0, 5, 20, 40):
+        proof = log.prove(entry_hash=hashes[i])[0]
+        assert proof["leaf_index"] == i and verify_inclusion(proof)
+        assert not verify_inclusion(dict(proof, entry_hash=hashes[i - 1]))
+
+    old = log.prove_index(3, tree_size=8)
+    pinned = {r["tree_size"]: r["root"] for r in log.roots(100)}
+    assert verify_inclusion(old, pinned[8])
+    assert log.prove(plan_id="P7")[0]["entry_hash"] == hashes[7]
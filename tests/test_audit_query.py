@@ -0,0 +1,84 @@
+import json
+import os
+
+from hub.audit_chain import AuditWriter
+from hub.audit_query import AuditIndex
+
+
+def test_filters_and_cursor_pagination(tmp_path):
+    chain = str(tmp_path / "audit_chain.jsonl")
+    w = AuditWriter(chain, None, fsync=False)
+    w.append_many([{"plan_id": f"P{i % 3}", "verify_status": "PASS" if i % 2 else "FAIL"} for i in range(30)])
+    idx = AuditIndex(chain, str(tmp_path / "idx.sqlite"))
+
+    seen, cursor = [], None
+    while True:
+        page = idx.query(plan_id="P1", cursor=cursor, limit=4)
+        seen += [r["lineage"]["plan_id"] for r in page["records"]]
+        cursor = page["next_cursor"]
+        if not cursor:
+            break
+    assert seen == ["P1"] * 10
+
+    both = idx.query(plan_id="P0", verdict="PASS", limit=100)["records"]
+    assert len(both) == 5
+
+    # Appends are indexed incrementally; newest comes first.
+    w.append({"plan_id": "P9", "verify_status": "PASS"})
+    assert idx.sync() == 1
+    assert idx.query(limit=1)["records"][0]["lineage"]["plan_id"] == "P9"
+
+
+def test_chain_log_shape_and_time_range(tmp_path):
+    log = tmp_path / "chain.log"
+    recs = [
+        {"timestamp": "2025-01-01T00:00:00Z", "secret_name": "s1", "audit": {"attestation_type": "sevsnpvm"}},
+        "garbage line",
+        {"timestamp": "2025-01-02T00:00:00Z", "secret_name": "s1", "verdict": "ALLOW"},
+        {"timestamp": "2025-01-03T00:00:00Z", "secret_name": "s2", "verdict": "DENY"},
+    ]
+    log.write_text("".join((r if isinstance(r, str) else json.dumps(r)) + "\n" for r in recs))
+    idx = AuditIndex(str(log), str(tmp_path / "idx.sqlite"))
+    assert len(idx.query(attestation_type="sevsnpvm")["records"]) == 1
+    hits = idx.query(secret_name="s1", since="2025-01-02T00:00:00Z", until="2025-01-03T00:00:00Z")
+    assert [r["verdict"] for r in hits["records"]] == ["ALLOW"]
+
+    log.write_text(json.dumps({"timestamp": "2025-02-01T00:00:00Z", "verdict": "DENY"}) + "\n")
+    assert [r["timestamp"] for r in idx.query(verdict="DENY")["records"]] == ["2025-02-01T00:00:00Z"]
+
+
+def test_same_size_in_place_rewrite_rebuilds(tmp_path):
+    log = tmp_path / "chain.log"
+    log.write_text("".join(json.dumps({"secret_name": s, "verdict": "ALLOW"}) + "\n" for s in ("s1", "s2")))
+    idx = AuditIndex(str(log), str(tmp_path / "idx.sqlite"))
+    assert idx.sync() == 2
+    with open(log, "r+") as f:  # same inode, same size
+        data = f.read().replace('"s2"', '"s9"')
+        f.seek(0)
+        f.write(data)
+    assert idx.sync() == 2
+    assert [r["secret_name"] for r in idx.query(secret_name="s9")["records"]] == ["s9"]
+    assert idx.query(secret_name="s2")["records"] == []
+
+
+def test_same_size_rewrite_in_the_middle_and_mixed_offsets(tmp_path):
+    log = tmp_path / "chain.log"
+    recs = [{"timestamp": "2025-01-01T00:00:00Z", "secret_name": f"s{i:03d}", "verdict": "ALLOW"} for i in range(400)]
+    log.write_text("".join(json.dumps(r) + "\n" for r in recs))
+    idx = AuditIndex(str(log), str(tmp_path / "idx.sqlite"))
+    assert idx.sync() == 400
+    with open(log, "r+") as f:  # far from both SIG_WINDOW ends; same inode, same size
+        data = f.read().replace('"s200"', '"x200"')
+        f.seek(0)
+        f.write(data)
+    os.utime(log, ns=(0, os.stat(log).st_mtime_ns + 1))  # coarse-mtime filesystems
+    assert idx.sync() == 400
+    assert len(idx.query(secret_name="x200")["records"]) == 1
+
+    # 01:00+01:00 is 00:00Z, earlier than 00:30Z; string order would say otherwise.
+    mixed = tmp_path / "mixed.log"
+    mixed.write_text("".join(json.dumps({"timestamp": t, "verdict": v}) + "\n" for t, v in (
+        ("2025-01-01T00:30:00Z", "A"), ("2025-01-01T01:00:00+01:00", "B"), ("2025-01-01T00:10:00+00:00", "C"))))
+    m = AuditIndex(str(mixed), str(tmp_path / "m.sqlite"))
+    hits = m.query(since="2025-01-01T00:00:00+00:00", until="2025-01-01T00:20:00Z")["records"]
+    assert sorted(r["verdict"] for r in hits) == ["B", "C"]
@@ -0,0 +1,34 @@
+import json
+
+from hub.audit_reader import AuditTail
+
+
+def _write(path, recs, mode="a"):
+    with open(path, mode) as f:
+        for r in recs:
+            f.write((r if isinstance(r, str) else json.dumps(r)) + "\n")
+
+
+def test_tail_tracks_appends_and_skips_junk(tmp_path):
+    log = str(tmp_path / "chain.log")
+    _write(log, [{"i": i} for i in range(100)], "w")
+    t = AuditTail(log)
+    assert [r["i"] for r in t.tail(3)] == [97, 98, 99]
+
+    _write(log, ["not json", "", {"i": 100}])
+    with open(log, "a") as f:
+        f.write('{"i": 101')  # partial write is not visible yet
+    assert [r["i"] for r in t.tail(3)] == [98, 99, 100]
+    with open(log, "a") as f:
+        f.write("}\n")
+    assert [r["i"] for r in t.tail(2)] == [100, 101]
+    assert t.rebuilds == 0 and len(t) == 104
+
+
+def test_rewrite_rebuilds_index(tmp_path):
+    log = str(tmp_path / "chain.log")
+    _write(log, [{"i": i} for i in range(10)], "w")
+    t = AuditTail(log)
+    assert len(t.tail(50)) == 10
+    _write(log, [{"j": 0}, {"j": 1}], "w")
+    assert t.tail(5) == [{"j": 0}, {"j": 1}] and t.rebuilds == 1
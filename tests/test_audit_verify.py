@@ -0,0 +1,64 @@
+import json
+
+from hub.audit_chain import AuditWriter
+from hub.audit_verify import verify_full, verify_incremental, verify_parallel
+
+
+def _chain(tmp_path, n):
+    chain = str(tmp_path / "chain.jsonl")
+    AuditWriter(chain, None, fsync=False).append_many([{"plan_id": f"P{i}"} for i in range(n)])
+    return chain
+
+
+def test_incremental_only_hashes_new_entries(tmp_path):
+    chain, cp = _chain(tmp_path, 50), str(tmp_path / "cp.json")
+    first = verify_incremental(chain, cp)
+    assert first.ok and first.verified == 50
+    AuditWriter(chain, None, fsync=False).append_many([{"plan_id": "new"}] * 3)
+    second = verify_incremental(chain, cp)
+    assert second.ok and second.mode == "incremental" and second.verified == 3 and second.lines == 53
+    assert second.head == verify_full(chain).head
+
+
+def test_tampered_checkpoint_entry_falls_back_to_full(tmp_path):
+    chain, cp = _chain(tmp_path, 10), str(tmp_path / "cp.json")
+    verify_incremental(chain, cp)
+    lines = open(chain).read().splitlines()
+    e = json.loads(lines[-1]); e["lineage"]["plan_id"] = "forged"
+    lines[-1] = json.dumps(e, separators=(",", ":"))
+    open(chain, "w").write("\n".join(lines) + "\n")
+    res = verify_incremental(chain, cp)
+    assert not res.ok and res.mode == "full" and res.error.startswith("[FAIL] Line 10")
+
+
+def test_parallel_matches_full_and_finds_breaks(tmp_path):
+    chain = _chain(tmp_path, 400)
+    assert verify_parallel(chain, 3).head == verify_full(chain).head
+    lines = open(chain).read().splitlines()
+    del lines[200]
+    open(chain, "w").write("\n".join(lines) + "\n")
+    res = verify_parallel(chain, 3)
+    assert not res.ok and res.code == 3 and res.error.startswith("[FAIL] Line 201")
+    assert verify_full(chain).error.startswith("[FAIL] Line 201")
+
+
+def test_bad_unterminated_last_line_fails_in_every_mode(tmp_path):
+    chain, cp = _chain(tmp_path, 10), str(tmp_path / "cp.json")
+    assert verify_incremental(chain, cp).ok
+    with open(chain, "a") as f:
+        f.write('{"bogus": 1}')
+    for res in (verify_full(chain), verify_incremental(chain, cp), verify_parallel(chain, 2)):
+        assert not res.ok and res.code == 2 and res.error == "[FAIL] Line 11: entry_hash mismatch"
+
+
+def test_checkpoint_stops_before_unterminated_line(tmp_path):
+    chain, cp = _chain(tmp_path, 5), str(tmp_path / "cp.json")
+    size = len(open(chain, "rb").read())
+    # A valid 6th entry whose newline has not been written yet.
+    AuditWriter(chain, None, fsync=False).append_many([{"plan_id": "P5"}])
+    data = open(chain, "rb").read()
+    open(chain, "wb").write(data[:-1])
+    res = verify_incremental(chain, cp)
+    assert res.ok and res.lines == 6
+    saved = json.load(open(cp))
+    assert saved["offset"] == size and saved["line"] == 5
@@ -0,0 +1,36 @@
+from hub.detector import DisruptionDetector
+
+
+def _ts(minute):
+    return f"2025-01-01T{minute // 60:02d}:{minute % 60:02d}:00+00:00"
+
+
+def test_thresholds_come_from_policy():
+    det = DisruptionDetector.from_policy("policies/base.yaml")
+    assert (det.max_risk, det.max_delay) == (0.35, 45.0)
+
+
+def test_one_event_per_episode_and_rearm():
+    det = DisruptionDetector(0.35, 45, window_s=900, min_samples=3)
+    feed = lambda m, risk, delay=10: det.feed(_ts(m), "W3", "R7", risk, delay)
+    assert feed(0, 0.9) is None and feed(5, 0.9) is None  # below min_samples
+    ev = feed(10, 0.9)
+    assert ev["type"] == "stockout_risk" and ev["severity"] == "critical" and ev["ts"] == _ts(10)
+    assert ev["detector"]["samples"] == 3
+    assert all(feed(m, 0.9) is None for m in range(15, 60, 5))  # same episode
+    for m in range(60, 90, 5):
+        assert feed(m, 0.1) is None  # window mean drops below rearm * threshold
+    ev = feed(90, 0.9, 150)
+    assert ev["type"] == "route_outage"
+    assert det.events == 2 and ("W3", "R7") in det.open_breaches()
+
+
+def test_window_slides_and_keys_are_independent():
+    det = DisruptionDetector(0.35, 45, window_s=600, min_samples=2)
+    assert det.feed(_ts(0), "W1", "R1", 0.0, 100) is None
+    assert det.feed(_ts(0), "W2", "R2", 0.0, 10) is None
+    # 20 minutes later the first W1 sample has left the 10-minute window.
+    assert det.feed(_ts(20), "W1", "R1", 0.0, 10) is None
+    ev = det.feed(_ts(25), "W1", "R1", 0.0, 90)
+    assert ev["type"] == "route_delay" and ev["detector"]["mean_delay_minutes"] == 50.0
+    assert det.feed(1735689900, "W2", "R2", 0.0, 100)["ts"] == "2025-01-01T00:05:00+00:00"
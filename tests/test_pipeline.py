@@ -0,0 +1,25 @@
+from hub import pipeline as engine
+
+
+def test_run_pipeline_in_memory(tmp_path):
+    res = engine.run_pipeline("route_outage", "R7", "W3")
+    assert [p["id"] for p in res.bundle["plans"]] == ["PlanA", "PlanB"]
+    assert all(r["sat"] for r in res.verdicts)
+    assert res.best["id"] == "PlanA"
+    assert [r["plan_id"] for r in res.sim["results"]] == ["PlanA", "PlanB"]
+    assert res.paths == {} and res.proof is None
+
+
+def test_soft_verify_reasons():
+    cfg = {"budget_cap_usd": 5000, "sla_min_percent": 98, "region_data_boundary": "EU"}
+    bundle = engine.generate_plans(engine.seed_event())
+    rows = engine.soft_verify_plans(bundle, cfg)
+    assert rows[0]["sat"] is False and rows[0]["counterexample"] == "sla_min"
+    assert rows[1]["counterexample"] == "budget_cap"
+
+
+def test_proof_chain_links():
+    sim = {"results": []}
+    e1 = engine.build_proof_entry("b.json", "0" * 64, "s.json", "1" * 64, sim, [], "p" * 64, None)
+    e2 = engine.build_proof_entry("b.json", "0" * 64, "s.json", "1" * 64, sim, [], "p" * 64, e1["chain_head"])
+    assert e2["prev_head"] == e1["chain_head"] and e2["chain_head"] != e1["chain_head"]
@@ -0,0 +1,61 @@
+from hub import pipeline as engine
+from hub.plan_search import SearchLimits, search_plans
+
+# W1 -> W3 is disrupted (R1); detours via W2 (EU) or W4 (US).
+SNAP = {
+    "warehouses": {"W1": {"inventory": 100, "demand": 100, "region": "EU"},
+                   "W2": {"inventory": 400, "demand": 100, "region": "EU"},
+                   "W3": {"inventory": 60, "demand": 140, "region": "EU"},
+                   "W4": {"inventory": 900, "demand": 100, "region": "US"}},
+    "routes": {"R1": {"from": "W1", "to": "W3", "latency_minutes": 40},
+               "R2": {"from": "W1", "to": "W2", "latency_minutes": 20},
+               "R3": {"from": "W2", "to": "W3", "latency_minutes": 30},
+               "R4": {"from": "W1", "to": "W4", "latency_minutes": 5},
+               "R5": {"from": "W4", "to": "W3", "latency_minutes": 5}},
+}
+EVENT = {"type": "route_outage", "route_id": "R1", "warehouse_id": "W3", "severity": "high"}
+
+
+def test_feasible_top_k_respects_every_limit():
+    lim = SearchLimits(budget_cap_usd=6000, max_delay_minutes=45, min_sla_percent=96,
+                       allowed_regions={"EU"}, top_k=4)
+    plans, stats = search_plans(EVENT, SNAP, lim)
+    assert [p["id"] for p in plans] == ["Plan01", "Plan02", "Plan03", "Plan04"]
+    for p in plans:
+        assert p["cost_usd"] <= 6000 and p["expected_delay_minutes"] <= 45
+        assert p["sla_expected_percent"] >= 96 and "W4" not in p["strategy"] and "R4" not in p["strategy"]
+    assert any("reroute_via_R2>R3" in p["strategy"] for p in plans)
+    assert any("reallocate_" in p["strategy"] and "_from_W2" in p["strategy"] for p in plans)
+    assert stats.pruned_region >= 1 and not stats.truncated
+
+    open_plans, _ = search_plans(EVENT, SNAP, SearchLimits(allowed_regions=None, top_k=20))
+    assert any("R4>R5" in p["strategy"] for p in open_plans)
+    assert len(open_plans) > len(plans)
+
+
+def test_bound_pruning_keeps_the_best():
+    full, _ = search_plans(EVENT, SNAP, SearchLimits(top_k=1000))
+    top, stats = search_plans(EVENT, SNAP, SearchLimits(top_k=2))
+    assert [p["strategy"] for p in top] == [p["strategy"] for p in full[:2]]
+    assert stats.pruned_bound > 0
+
+
+def test_bound_holds_for_reroutes_slower_than_the_disruption():
+    # The only detour (120 min) is slower than the disrupted route (40 min at high severity).
+    snap = {"warehouses": {w: dict(SNAP["warehouses"][w]) for w in ("W1", "W2", "W3")},
+            "routes": {"R1": SNAP["routes"]["R1"],
+                       "R2": {"from": "W1", "to": "W2", "latency_minutes": 60},
+                       "R3": {"from": "W2", "to": "W3", "latency_minutes": 60}}}
+    full, _ = search_plans(EVENT, snap, SearchLimits(top_k=1000))
+    for k in range(1, len(full) + 1):
+        top, _ = search_plans(EVENT, snap, SearchLimits(top_k=k))
+        assert [p["strategy"] for p in top] == [p["strategy"] for p in full[:k]]
+
+
+def test_generate_plans_searches_with_snapshot_and_limits():
+    bundle = engine.generate_plans(EVENT, snapshot=SNAP)
+    assert bundle["plans"][0]["id"] == "Plan01" and "search" in bundle
+    assert all(p["cost_usd"] <= 10000 for p in bundle["plans"])
+    assert [p["id"] for p in engine.generate_plans(EVENT)["plans"]] == ["PlanA", "PlanB"]
+    tight = engine.generate_plans(EVENT, snapshot=SNAP, limits=SearchLimits(budget_cap_usd=1))
+    assert [p["id"] for p in tight["plans"]] == ["PlanA", "PlanB"]  # nothing feasible: fixed plans
@@ -0,0 +1,57 @@
+import numpy as np
+
+from hub import pipeline as engine
+from hub.plan_select import PlanSelector, metrics_array, pareto_mask
+
+
+def _plans(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return [{"id": f"P{i}", "cost_usd": float(rng.integers(1000, 9000, endpoint=True) // 500 * 500),
+             "sla_expected_percent": float(rng.integers(94, 99, endpoint=True)),
+             "kpi_expectations": {"stockout_risk_reduction_pct": float(rng.integers(0, 40)),
+                                  "delay_reduction_pct": float(rng.integers(0, 40))}}
+            for i in range(n)]
+
+
+def _brute_front(m):
+    s = m * np.array([-1.0, 1, 1, 1])
+    return {i for i in range(len(s))
+            if not any(np.all(s[j] >= s[i]) and np.any(s[j] > s[i]) for j in range(len(s)))}
+
+
+def test_pareto_mask_matches_brute_force():
+    m = metrics_array(_plans(400))
+    assert set(np.flatnonzero(pareto_mask(m)).tolist()) == _brute_front(m)
+
+
+def test_streaming_and_batch_agree_with_full_sort():
+    plans = _plans(1000, seed=1)
+    weights = {"cost_usd": -1 / 150, "stockout_risk_reduction_pct": 1.0, "delay_reduction_pct": 1.0}
+    stream, batch = PlanSelector(k=5, weights=weights), PlanSelector(k=5, weights=weights)
+    for p in plans:
+        stream.add(p)
+    for i in range(0, len(plans), 128):
+        batch.extend(plans[i:i + 128])
+
+    def key(ip):
+        i, p = ip
+        kpi = p["kpi_expectations"]
+        score = -p["cost_usd"] / 150 + kpi["stockout_risk_reduction_pct"] + kpi["delay_reduction_pct"]
+        return (-score, p["cost_usd"], -p["sla_expected_percent"], i)
+
+    expected = [p["id"] for _, p in sorted(enumerate(plans), key=key)[:5]]
+    assert [p["id"] for p in stream.top()] == expected
+    assert [p["id"] for p in batch.top()] == expected
+    front = {plans[i]["id"] for i in _brute_front(metrics_array(plans))}
+    assert {p["id"] for p in stream.frontier()} == front
+    assert {p["id"] for p in batch.frontier()} == front
+
+
+def test_choose_best_plan_default_rule_and_weights():
+    bundle = engine.generate_plans(engine.seed_event())
+    verdicts = [{"plan_id": p["id"], "sat": True} for p in bundle["plans"]]
+    assert engine.choose_best_plan(bundle, verdicts)["id"] == "PlanA"
+    # PlanB reduces more stockout risk; weight it heavily and it wins.
+    best = engine.choose_best_plan(bundle, verdicts, weights={"stockout_risk_reduction_pct": 1.0})
+    assert best["id"] == max(bundle["plans"], key=lambda p: p["kpi_expectations"]["stockout_risk_reduction_pct"])["id"]
+    assert engine.choose_best_plan(bundle, [{"plan_id": "PlanA", "sat": False}]) is None
@@ -0,0 +1,50 @@
+import random
+
+from hub.policy_revision import Plan, Policy, check_plan, repair_plan
+from hub.policy_batch import PlanSet, evaluate_batch, evaluate_config, repair_batch, BUDGET, PII
+
+
+def test_matches_check_plan():
+    rng = random.Random(7)
+    plans = [
+        Plan(f"R{i}", rng.uniform(0, 15000), rng.randint(0, 120),
+             rng.choice(["EU", "US", "APAC"]), rng.random() < 0.2)
+        for i in range(2000)
+    ]
+    for policy in (Policy(10000.0, 96.0, False, 60), Policy(8000.0, 96.0, True, 45)):
+        verdict = evaluate_batch(policy, PlanSet.from_plans(plans))
+        for i, plan in enumerate(plans):
+            v = check_plan(policy, plan)
+            assert bool(verdict.sat[i]) == v.sat
+            assert verdict.reason(i) == v.reason
+
+
+def test_violation_bitmap_and_config_reasons():
+    ps = PlanSet.from_columns([12000, 100], [0, 0], ["EU", "EU"], [True, False], sla=[99, 99])
+    v = evaluate_batch(Policy(10000.0, 96.0, False, 60), ps)
+    assert int(v.violations[0]) == BUDGET | PII and v.reasons(0) == ["budget_exceeded", "pii_used_not_allowed"]
+    assert v.counts()["sat"] == 1
+
+    cfg = {"budget_cap_usd": 5000, "sla_min_percent": 98, "region_data_boundary": "EU"}
+    bundle = [{"id": "X", "cost_usd": 6000, "sla_expected_percent": 90, "region_data_boundary": "US", "pii_access": True}]
+    assert evaluate_config(cfg, PlanSet.from_bundle(bundle)).reasons(0) == ["budget_cap", "sla_min", "region_mismatch", "pii_access"]
+
+
+def test_repair_fixes_every_violation_in_one_step():
+    rng = random.Random(11)
+    plans = [
+        Plan(f"R{i}", rng.uniform(0, 15000), rng.randint(0, 120),
+             rng.choice(["US", "APAC"]), rng.random() < 0.2)
+        for i in range(1000)
+    ]
+    policy = Policy(10000.0, 96.0, False, 60)
+    fixed, before = repair_batch(policy, PlanSet.from_plans(plans))
+    assert evaluate_batch(policy, fixed).sat.all()
+    for i, plan in enumerate(plans):
+        p, fixes = repair_plan(policy, plan)
+        assert check_plan(policy, p).sat and fixes == before.reasons(i)
+        assert (fixed.cost[i], fixed.delay[i], fixed.regions[fixed.region[i]], bool(fixed.pii[i])) == \
+            (p.added_cost, p.expected_delay_minutes, p.data_region, p.pii_used)
+        # Minimal change: fields that were already feasible are untouched.
+        assert p.added_cost == min(plan.added_cost, policy.budget_cap)
+        assert p.expected_delay_minutes == min(plan.expected_delay_minutes, policy.max_delay_minutes)
@@ -1,5 +1,8 @@
 import os
+import shutil
+
 from hub.policy_hash import policy_hash
+from hub.policy_store import PolicyStore
 
 def main():
     h1 = policy_hash("policies/base.yaml")
@@ -8,5 +11,16 @@ def main():
     assert h1 == h2, "Hash must be deterministic"
     print("OK policy_hash:", h1)
 
+def test_policy_store_matches_and_revalidates(tmp_path):
+    p = tmp_path / "base.yaml"
+    shutil.copy("policies/base.yaml", p)
+    store = PolicyStore(str(p))
+    assert store.hash == policy_hash(str(p))
+    assert store.reloads == 1
+    p.write_text(p.read_text().replace("budget_cap_usd: 10000", "budget_cap_usd: 9000"))
+    os.utime(p, ns=(0, 1))
+    assert store.hash == policy_hash(str(p)) and store.reloads == 2
+    assert store.doc["constraints"]["budget_cap_usd"] == 9000
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,66 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from hub.scenario_gen import (generate_storms, generate_topology, iter_signals, random_events,
+                              storm_events, write_scenario)
+
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def test_topology_and_signals_are_seeded():
+    a, b = generate_topology(50, 120, seed=5), generate_topology(50, 120, seed=5)
+    assert a == b and a != generate_topology(50, 120, seed=6)
+    assert len(a["warehouses"]) == 50 and len(a["routes"]) == 120
+    assert {r["from"] for r in a["routes"].values()} == set(a["warehouses"])
+    assert all(r["from"] != r["to"] for r in a["routes"].values())
+
+    storms = generate_storms(a, START, 1, 4, seed=5)
+    chunks = list(iter_signals(a, START, 1, 10, seed=5, storms=storms))
+    assert len(chunks) == 24 and all(len(c) == 6 * 120 for c in chunks)
+    assert chunks == list(iter_signals(a, START, 1, 10, seed=5, storms=storms))
+    stamps = [row[0] for c in chunks for row in c]
+    assert stamps == sorted(stamps)
+    assert random_events(a, 10, seed=1) == random_events(a, 10, seed=1)
+
+
+def test_storms_raise_signals_and_events():
+    topo = generate_topology(20, 40, seed=1)
+    storms = generate_storms(topo, START, 1, 3, seed=1)
+    calm = [r for c in iter_signals(topo, START, 1, 5, seed=1) for r in c]
+    hit = [r for c in iter_signals(topo, START, 1, 5, seed=1, storms=storms) for r in c]
+    assert sum(r[3] for r in hit) > sum(r[3] for r in calm)
+    events = list(storm_events(storms))
+    assert len(events) == sum(len(s.route_ids) for s in storms)
+    assert all(e["route_id"] in topo["routes"] for e in events)
+
+
+def test_write_scenario(tmp_path):
+    m = write_scenario(str(tmp_path), 10, 20, 0.5, 2, seed=3, interval_minutes=15)
+    assert m["signals"] == 12 * 4 * 20
+    lines = (tmp_path / "signals.csv").read_text().splitlines()
+    assert lines[0] == "timestamp,warehouse,route,risk,delay_minutes,cost_delta"
+    assert len(lines) == m["signals"] + 1
+    assert {p.name for p in tmp_path.iterdir()} >= {"topology.json", "storms.json", "events.jsonl", "manifest.json"}
+
+
+def test_rejects_uneven_intervals_and_self_loop_topologies():
+    topo = generate_topology(2, 4, seed=1)
+    assert all(r["from"] != r["to"] for r in topo["routes"].values())
+    for interval in (0, 7, 90):
+        with pytest.raises(ValueError):
+            next(iter_signals(topo, START, 1, interval))
+    with pytest.raises(ValueError):
+        generate_topology(1, 3)
+
+
+def test_fractional_days_stop_at_the_end_tick():
+    topo = generate_topology(4, 6, seed=2)
+    days = 50 / (24 * 60)  # 50 minutes: the only hour is cut after 10 five-minute ticks
+    rows = [r for c in iter_signals(topo, START, days, 5, seed=2) for r in c]
+    assert len(rows) == 10 * 6
+    end = START + timedelta(days=days)
+    assert max(datetime.fromisoformat(r[0]) for r in rows) < end
+    # Whole hours are unchanged by the cut.
+    two, one_and_half = (list(iter_signals(topo, START, d / 24, 5, seed=2)) for d in (2, 1.5))
+    assert two[0] == one_and_half[0] and len(one_and_half[1]) == 6 * 6
@@ -0,0 +1,28 @@
+from pathlib import Path
+
+from hub import artifact_index
+from hub.pipeline import seed_event
+from hub.scheduler import run_burst
+
+
+def test_burst_isolated_workspaces(tmp_path):
+    events = [seed_event("route_outage", f"R{i}", "W3") for i in range(12)]
+    report = run_burst(events, plan_workers=1, verify_workers=3, simulate_workers=2, max_in_flight=8,
+                       runs_dir=str(tmp_path / "runs"), write_artifacts=True)
+    assert report.failed == 0 and len(report.runs) == 12
+    assert all(r.best_plan == "PlanA" for r in report.runs)
+    workspaces = {r.workspace for r in report.runs}
+    assert len(workspaces) == 12
+    for r in report.runs:
+        assert len(list(Path(r.workspace, "data/plans").glob("*.json"))) == 1
+    assert report.throughput_eps > 0 and report.latency_p95_ms >= report.latency_p50_ms
+
+
+def test_workspace_runs_do_not_pin_shared_indexes(tmp_path):
+    before = set(artifact_index._indexes)
+    events = [seed_event("route_outage", f"R{i}", "W3") for i in range(5)]
+    report = run_burst(events, runs_dir=str(tmp_path / "runs"), write_artifacts=True)
+    assert report.failed == 0
+    assert set(artifact_index._indexes) == before
+    for r in report.runs:
+        assert Path(r.workspace, "data/manifest.sqlite").exists()
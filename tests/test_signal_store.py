@@ -0,0 +1,120 @@
+import csv
+import os
+
+import pytest
+
+from hub import signal_store
+from hub.signal_store import SignalStore, import_csv, open_store
+
+
+def _rows(day, n, route="R7", warehouse="W3", t0=0):
+    return [(f"2025-01-0{day}T{(t0 + i) // 60:02d}:{(t0 + i) % 60:02d}:00+00:00", warehouse, route,
+             0.1 * (i % 10), i, 1000 + i) for i in range(n)]
+
+
+def test_window_and_tail_across_sealed_and_open_days(tmp_path):
+    store = SignalStore(str(tmp_path / "s"))
+    store.append(_rows(1, 30) + _rows(1, 30, route="R8"))
+    store.append(_rows(2, 30) + _rows(2, 10, route="R8"))
+    assert store.compact() == ["2025-01-01"]
+    store.append(_rows(2, 5, t0=30))  # lands in the open day after compaction
+
+    one = store.window("2025-01-01T00:10:00Z", "2025-01-01T00:20:00Z", route="R7")
+    assert one["delay_minutes"].tolist() == list(range(10, 20))
+    assert len(store.window(route="R8")["ts"]) == 40
+    assert len(store.window("2025-01-02T00:00:00Z", warehouse="W3")["ts"]) == 45
+
+    last = store.rows(store.tail(3, route="R7"))
+    assert [r["timestamp"] for r in last] == ["2025-01-02T00:32:00+00:00", "2025-01-02T00:33:00+00:00",
+                                              "2025-01-02T00:34:00+00:00"]
+    assert last[-1]["delay_minutes"] == 4 and last[-1]["cost_delta"] == 1004
+    assert len(store.tail(100, route="R8")["ts"]) == 40
+    assert not len(store.tail(5, route="nope")["ts"])
+
+    store.seal("2025-01-02")  # sealing again keeps every row, now sorted by key then ts
+    reopened = SignalStore(str(tmp_path / "s"))
+    assert len(reopened.window()["ts"]) == 105
+    assert reopened.rows(reopened.tail(1, route="R7")) == last[-1:]
+
+
+def test_import_csv(tmp_path):
+    src = tmp_path / "signals.csv"
+    with open(src, "w", newline="") as f:
+        w = csv.writer(f)
+        w.writerow(["timestamp", "warehouse", "route", "risk", "delay_minutes", "cost_delta"])
+        w.writerows(_rows(1, 20) + _rows(3, 20))
+    store = SignalStore(str(tmp_path / "s"))
+    assert import_csv(str(src), store, chunk_rows=7) == 40
+    assert store.days() == ["2025-01-01", "2025-01-03"]
+    assert not (tmp_path / "s" / "2025-01-01" / "tail.ts").exists()   # sealed
+    assert (tmp_path / "s" / "2025-01-03" / "tail.ts").exists()       # newest stays open
+    assert store.window("2025-01-01T00:00:00Z", "2025-01-02T00:00:00Z")["risk"].size == 20
+
+
+def test_seal_is_all_or_nothing(tmp_path, monkeypatch):
+    store = SignalStore(str(tmp_path / "s"))
+    store.append(_rows(1, 30) + _rows(1, 20, route="R8"))
+    store.seal("2025-01-01")
+    store.append(_rows(1, 10, route="R9"))
+    before = store.rows(store.window())
+
+    real_replace = os.replace
+
+    def crash(src, dst):
+        if dst.endswith("MANIFEST"):
+            raise OSError("crash before the switch")
+        return real_replace(src, dst)
+
+    monkeypatch.setattr(os, "replace", crash)
+    with pytest.raises(OSError):
+        store.seal("2025-01-01")
+    monkeypatch.setattr(os, "replace", real_replace)
+    assert SignalStore(str(tmp_path / "s")).rows(store.window()) == before
+
+    # Crash after the switch but before old files are removed: no duplicated tail rows.
+    monkeypatch.setattr(SignalStore, "_collect", staticmethod(lambda d, gen: None))
+    assert store.seal("2025-01-01") == 60
+    reopened = SignalStore(str(tmp_path / "s"))
+    assert len(reopened.window()["ts"]) == 60
+    assert sorted(map(str, reopened.rows(reopened.window()))) == sorted(map(str, before))
+
+
+def test_reader_with_stale_manifest_retries(tmp_path, monkeypatch):
+    store = SignalStore(str(tmp_path / "s"))
+    store.append(_rows(1, 4))
+    store.seal("2025-01-01")
+    store.append(_rows(1, 2, t0=4))
+    real_manifest, sealed = signal_store._manifest, []
+
+    def stale(d):
+        man = real_manifest(d)
+        if not sealed:  # a writer seals (and collects) right after this reader loaded MANIFEST
+            sealed.append(1)
+            monkeypatch.setattr(signal_store, "_manifest", real_manifest)
+            SignalStore(str(tmp_path / "s")).seal("2025-01-01")
+            monkeypatch.setattr(signal_store, "_manifest", stale)
+        return man
+
+    monkeypatch.setattr(signal_store, "_manifest", stale)
+    assert len(store.window()["ts"]) == 6
+    assert len(store.window(route="R7")["ts"]) == 6
+
+    # A sealed generation that is missing while MANIFEST still names it is an error, not an empty day.
+    monkeypatch.setattr(signal_store, "_manifest", real_manifest)
+    gen = real_manifest(str(tmp_path / "s" / "2025-01-01"))["sealed"]
+    os.remove(tmp_path / "s" / "2025-01-01" / gen / "sorted.risk")
+    with pytest.raises(FileNotFoundError):
+        store.window()
+
+
+def test_open_store_imports_legacy_csv_once(tmp_path):
+    src = tmp_path / "signals.csv"
+    with open(src, "w", newline="") as f:
+        w = csv.writer(f)
+        w.writerow(["timestamp", "warehouse", "route", "risk", "delay_minutes", "cost_delta"])
+        w.writerows(_rows(1, 20))
+    root = str(tmp_path / "s")
+    store = open_store(root, str(src))
+    store.append(_rows(2, 6))  # the demo feed
+    assert len(store.window()["ts"]) == 26
+    assert len(open_store(root, str(src)).window()["ts"]) == 26  # not imported again
@@ -0,0 +1,38 @@
+import pytest
+
+from hub.twin_graph import QueryError, TwinGraph
+
+SNAP = {
+    "warehouses": {"W3": {"inventory": 40}, "W4": {"inventory": 90}, "W5": {"inventory": 10}},
+    "routes": {
+        "R7": {"from": "W3", "to": "W4", "latency_minutes": 40},
+        "R8": {"from": "W3", "latency_minutes": 15},
+        "R9": {"warehouses": ["W5"], "latency_minutes": 70},
+    },
+    "relationships": [{"source": "W4", "target": "W5", "type": "FEEDS"}],
+}
+
+
+def test_day13_query_uses_index_and_limit():
+    g = TwinGraph.from_snapshot(SNAP)
+    rows = g.query("MATCH (w)-[:ROUTE]->(r) WHERE w.warehouseId = 'W3' RETURN w, r LIMIT 5")
+    assert [(r["w"]["$dtId"], r["r"]["routeId"]) for r in rows] == [("W3", "R7"), ("W3", "R8")]
+    assert len(g.query("MATCH (w)-[:ROUTE]->(r) WHERE w.warehouseId = 'W3' RETURN r LIMIT 1")) == 1
+
+
+def test_where_operators_and_multi_hop():
+    g = TwinGraph.from_snapshot(SNAP)
+    rows = g.query("MATCH (r:Route)<-[:ROUTE]-(w) WHERE (r.latency_minutes < 20 OR w.inventory > 80) "
+                   "AND NOT r.routeId = 'R9' RETURN r.routeId AS rid, w.$dtId AS wid")
+    assert sorted((x["rid"], x["wid"]) for x in rows) == [("R7", "W4"), ("R8", "W3")]
+    hops = g.query("MATCH (a)-[:FEEDS]->(b)-[:ROUTE]->(r) RETURN a.$dtId, r.routeId")
+    assert hops == [{"a.$dtId": "W4", "r.routeId": "R9"}]
+    assert [x["w"]["inventory"] for x in g.query("MATCH (w:Warehouse) WHERE w.warehouseId IN ['W5', 'nope'] RETURN w")] == [10]
+
+
+def test_rejects_unsupported_syntax():
+    g = TwinGraph.from_snapshot(SNAP)
+    with pytest.raises(QueryError):
+        g.query("SELECT * FROM digitaltwins")
+    with pytest.raises(QueryError):
+        g.query("MATCH (w) RETURN x")
@@ -0,0 +1,62 @@
+from hub import pipeline as engine
+from hub.twin_sim import SnapshotArrays, monte_carlo, simulate_plans
+
+SNAP = {
+    "warehouses": {"W1": {"inventory": 50, "demand": 100}, "W2": {"inventory": 80, "demand": 120},
+                   "W3": {"inventory": 400, "demand": 100}},
+    "routes": {"R1": {"from": "W1", "to": "W2", "latency_minutes": 40},
+               "R2": {"from": "W3", "to": "W1", "latency_minutes": 30},
+               "R3": {"from": "W2", "to": "W3", "latency_minutes": 20}},
+}
+EVENT = {"type": "port_closure", "severity": "high", "route_id": "R1", "warehouse_id": "W1"}
+
+
+def _plan(pid, supply, delay, cost=1000):
+    return {"id": pid, "cost_usd": cost, "sla_expected_percent": 97,
+            "mitigation": {"supply_recovery": supply, "delay_recovery": delay}}
+
+
+def test_footprint_and_shape():
+    out = simulate_plans(SNAP, {"event": EVENT, "plans": [_plan("A", 0.5, 0.5)]})
+    (a,) = out
+    assert a["affected"] == {"warehouses": 2, "routes": 2}  # W1, W2; R1, R2 (touches W1)
+    assert a["baseline"]["risk"] > a["after"]["risk"]
+    assert a["baseline"]["delay"] > a["after"]["delay"]
+    assert a["risk_delta"] > 0 and a["delay_delta"] > 0
+
+
+def test_stronger_mitigation_dominates():
+    bundle = {"event": EVENT, "plans": [_plan("weak", 0.2, 0.1), _plan("strong", 0.8, 0.9)]}
+    weak, strong = simulate_plans(SnapshotArrays.from_snapshot(SNAP), bundle)
+    assert strong["stockout_risk_reduction_pct"] > weak["stockout_risk_reduction_pct"]
+    assert strong["delay_reduction_pct"] > weak["delay_reduction_pct"]
+    assert strong["cost_delta"] < weak["cost_delta"]  # same spend, more stockout avoided
+
+
+def test_simulate_bundle_uses_snapshot_or_falls_back():
+    bundle = engine.generate_plans(EVENT)
+    echoed = engine.simulate_bundle(bundle)
+    kpi = bundle["plans"][0]["kpi_expectations"]
+    assert echoed["results"][0]["simulated"]["delay_reduction_pct"] == kpi["delay_reduction_pct"]
+
+    sim = engine.simulate_bundle(bundle, snapshot=SNAP)
+    assert "baseline" in sim["results"][0]["simulated"]
+    assert [r["plan_id"] for r in sim["results"]] == [p["id"] for p in bundle["plans"]]
+
+    elsewhere = engine.simulate_bundle(bundle, snapshot={"warehouses": {}, "routes": {}})
+    assert "baseline" not in elsewhere["results"][0]["simulated"]
+
+
+def test_monte_carlo_replays_by_seed_and_brackets_mean():
+    bundle = {"event": EVENT, "plans": [_plan("A", 0.5, 0.5), _plan("B", 0.9, 0.2)]}
+    one = monte_carlo(SNAP, bundle, trials=1500, seed=11, workers=1)
+    assert one == monte_carlo(SNAP, bundle, trials=1500, seed=11, workers=2)
+    assert one != monte_carlo(SNAP, bundle, trials=1500, seed=12, workers=1)
+    for row in one:
+        assert row["trials"] == 1500
+        for key in ("stockout_risk_reduction_pct", "delay_reduction_pct"):
+            ci = row[key]
+            assert ci["p5"] <= ci["mean"] <= ci["p95"] and ci["p5"] < ci["p95"]
+
+    sim = engine.simulate_bundle(engine.generate_plans(EVENT), snapshot=SNAP, trials=200, seed=1)
+    assert sim["results"][0]["simulated"]["monte_carlo"]["trials"] == 200
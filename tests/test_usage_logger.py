@@ -0,0 +1,57 @@
+import json
+import multiprocessing as mp
+import time
+
+from hub.usage_logger import UsageLogger
+
+
+def _worker(path, n):
+    lg = UsageLogger(path, max_records=64)
+    for i in range(n):
+        lg.log("operation", 1, note=f"w{i}")
+    lg.close()
+
+
+def test_concurrent_processes_write_whole_lines(tmp_path):
+    path = str(tmp_path / "adt_usage.jsonl")
+    ctx = mp.get_context("fork")
+    procs = [ctx.Process(target=_worker, args=(path, 500)) for _ in range(4)]
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join()
+    recs = [json.loads(line) for line in open(path)]
+    assert len(recs) == 2000 and all(r["kind"] == "operation" for r in recs)
+
+
+def test_buffers_until_size_or_time(tmp_path):
+    path = tmp_path / "u.jsonl"
+    lg = UsageLogger(str(path), max_records=10, max_delay_s=0.05, background=True)
+    for _ in range(9):
+        lg.log("message")
+    assert not path.exists()  # still buffered
+    lg.log("message")
+    deadline = time.time() + 2
+    while time.time() < deadline and not path.exists():
+        time.sleep(0.01)
+    lg.log("query_unit", 3)
+    lg.close()
+    lines = [json.loads(l) for l in path.read_text().splitlines()]
+    assert len(lines) == 11 and lines[-1]["count"] == 3
+
+
+def test_count_is_coerced_and_bad_records_rejected(tmp_path):
+    path = tmp_path / "u.jsonl"
+    lg = UsageLogger(str(path), max_records=100)
+    lg.log("message", "2")
+    try:
+        lg.log("message", "two")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("non-numeric count accepted")
+    lg.log("query_unit", 3.0, note=7)
+    assert lg.flush() == 2
+    recs = [json.loads(line) for line in open(path)]
+    assert [(r["count"], r["note"]) for r in recs] == [(2, ""), (3, "7")]
+    lg.close()
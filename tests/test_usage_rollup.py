@@ -0,0 +1,42 @@
+import json
+import random
+import time
+
+from hub.usage_rollup import KINDS, UsageRollup
+
+
+def _iso(t):
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(t))
+
+
+def _brute(recs, a, b):
+    out = {k: 0 for k in KINDS}
+    for t, k, c in recs:
+        if a <= t - t % 60 < b:
+            out[k] += c
+    return out
+
+
+def test_window_totals_match_raw_log(tmp_path):
+    rng = random.Random(7)
+    t0 = 1_700_000_000
+    recs = [(t0 + rng.randrange(3 * 86400), rng.choice(KINDS), rng.randint(1, 5)) for _ in range(2000)]
+    log = tmp_path / "adt_usage.jsonl"
+    with log.open("w") as f:
+        for t, k, c in recs[:1500]:
+            f.write(json.dumps({"ts": _iso(t), "kind": k, "count": c, "note": ""}) + "\n")
+    r = UsageRollup(str(log))
+    assert r.sync() == 1500
+
+    with log.open("a") as f:
+        for t, k, c in recs[1500:]:
+            f.write(json.dumps({"ts": _iso(t), "kind": k, "count": c, "note": ""}) + "\n")
+        f.write("not json\n")
+    assert r.sync() == 500  # only the appended lines are read
+
+    assert r.totals() == _brute(recs, 0, 2 ** 40)
+    for _ in range(50):
+        a = (t0 + rng.randrange(3 * 86400)) // 60 * 60
+        b = a + rng.randrange(2 * 86400) // 60 * 60
+        assert r.totals(a, b) == _brute(recs, a, b)
+    assert r.totals(_iso(t0), _iso(t0 + 3600)) == _brute(recs, t0 - t0 % 60, t0 + 3600 - t0 % 60)
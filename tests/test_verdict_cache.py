@@ -0,0 +1,42 @@
+from hub.policy_revision import Plan, Policy, check_plan
+from hub.verdict_cache import VerdictCache, canonical_digest, cached_check_plan
+
+
+def test_lru_and_counters():
+    c = VerdictCache(maxsize=2, lock_path="/nonexistent.lock")
+    calls = []
+    for plan in ({"a": 1}, {"a": 1}, {"a": 2}, {"a": 3}, {"a": 1}):
+        c.get_or_compute("h", "ns", plan, lambda: calls.append(1) or True)
+    assert len(calls) == 4  # {"a": 1} evicted before its last use
+    assert c.stats.hits == 1 and c.stats.misses == 4 and c.stats.size == 2
+
+
+def test_disk_tier_and_lock_invalidation(tmp_path):
+    lock = tmp_path / "policy.lock"
+    lock.write_text("policy_sha256: a\n")
+    db = str(tmp_path / "v.sqlite")
+    VerdictCache(disk_path=db, lock_path=str(lock)).put("h", "ns", canonical_digest({"x": 1}), [True, []])
+
+    c = VerdictCache(disk_path=db, lock_path=str(lock))
+    assert c.get("h", "ns", canonical_digest({"x": 1})) == [True, []]
+    assert c.stats.disk_hits == 1
+
+    lock.write_text("policy_sha256: bb\n")
+    assert c.get("h", "ns", canonical_digest({"x": 1})) is None
+    assert c.stats.invalidations == 1
+
+
+def test_cached_check_plan_matches():
+    policy, plan = Policy(10000.0, 96.0, False, 60), Plan("R7", 12000.0, 30, "EU", False)
+    c = VerdictCache()
+    assert cached_check_plan(policy, plan, c) == check_plan(policy, plan)
+    assert cached_check_plan(policy, plan, c).reason == "budget_exceeded" and c.stats.hits == 1
+
+
+def test_volatile_fields_do_not_split_the_key():
+    c = VerdictCache(lock_path="/nonexistent.lock")
+    calls = []
+    for ts in ("2025-01-01T00:00:00Z", "2025-01-02T00:00:00Z"):
+        c.get_or_compute("h", "z3", {"id": "PlanA", "cost_usd": 6400, "ts": ts}, lambda: calls.append(1) or True)
+    assert len(calls) == 1 and c.stats.hits == 1
+
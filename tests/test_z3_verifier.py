@@ -0,0 +1,46 @@
+import json
+import shutil
+
+import pytest
+
+pytest.importorskip("z3")
+
+from hub.z3_verifier import IncrementalVerifier
+
+
+def test_pass_and_fail_plans():
+    v = IncrementalVerifier()
+    ok, violated = v.check(json.load(open("plan_pass.json")))
+    assert ok and violated == []
+    ok, violated = v.check(json.load(open("plan_fail.json")))
+    assert not ok
+    assert set(violated) == {"budget_cap", "sla_min", "latency_max", "delay_max",
+                             "stockout_max", "region_mismatch", "endpoint"}
+
+
+def test_rebuilds_only_when_policy_changes(tmp_path):
+    pol, lock = tmp_path / "base.yaml", tmp_path / "policy.lock"
+    shutil.copy("policies/base.yaml", pol)
+    lock.write_text("policy_sha256: x\n")
+    v = IncrementalVerifier(str(pol), str(lock))
+    plan = {"cost_usd": 9000, "pii_access": False}
+    assert v.check(plan)[0] and v.check(plan)[0]
+    assert v.rebuilds == 1
+
+    lock.write_text("policy_sha256: y\n")  # lock touched, policy unchanged
+    assert v.check(plan)[0] and v.rebuilds == 1
+
+    pol.write_text(pol.read_text().replace("budget_cap_usd: 10000", "budget_cap_usd: 8000"))
+    assert v.check(plan) == (False, ["budget_cap"])
+    assert v.rebuilds == 2
+
+
+def test_missing_fields_are_reported_unchecked():
+    v = IncrementalVerifier()
+    ok, violated, unchecked = v.check_detail({"cost_usd": 9000, "pii_access": False}, use_cache=False)
+    assert ok and violated == []
+    assert "budget_cap" not in unchecked and "pii_access" not in unchecked
+    assert {"latency_max", "stockout_max", "endpoint"} <= set(unchecked)
+    rows = v.verify_bundle({"plans": [{"id": "P", "cost_usd": 20000, "pii_access": False}]})
+    assert rows[0]["sat"] is False and rows[0]["counterexample"] == "budget_cap"
+    assert "latency_max" in rows[0]["unchecked"]